@@ -0,0 +1,110 @@
+# algorithms/bellman_ford.py
+"""
+Bellman-Ford cho đồ thị có trọng số âm, ba cách chạy cùng một dạng kết quả:
+- "rounds"    : cores.bellman_ford, tối đa n-1 vòng qua mọi cung, phát "relax" từng bước
+                (dùng để log / vẽ)
+- "spfa"      : cores.spfa, hàng đợi các đỉnh vừa giảm khoảng cách — hợp với đồ thị thưa,
+                khi đa số đỉnh ổn định sau vài lần relax
+- "vectorized": numpy, mỗi vòng relax cùng lúc mọi cung đi ra từ các đỉnh vừa giảm ở vòng
+                trước (np.minimum.at trên mảng cung của CSRGraph.arcs())
+- "auto"      : vectorized khi đồ thị đủ nhiều cung, không thì spfa
+
+Kết quả: dist, pred (list, chỉ số nguyên), negative_cycle, cycle — chu trình âm tới được
+từ s dạng list đỉnh [c0, c1, ..., ck] với các cung c0->c1->...->ck->c0 ([] nếu không có).
+Đồ thị vô hướng: mỗi cạnh relax cả hai chiều, nên một cạnh âm đã là chu trình âm.
+"""
+import numpy as np
+
+from algorithms import cores
+
+AUTO_VECTORIZE_ARCS = 20000    # ít cung hơn thì spfa (chi phí gọi numpy mỗi vòng lớn hơn)
+FIRST_CYCLE_CHECK = 8          # tìm chu trình trong pred ở vòng 8, 16, 32...
+
+
+def relax_rounds(csr, dist, pred, active, observer=None):
+    """
+    Các vòng relax numpy, sửa dist / pred (ndarray) tại chỗ. active: mảng bool các đỉnh khoảng
+    cách vừa đổi (chỉ cung đi ra từ chúng cần relax ở vòng sau); mỗi vòng chỉ lấy các cung đó theo
+    indptr, nên vòng có ít đỉnh đổi (VD: đồ thị dạng chuỗi, n vòng) không phải quét cả mảng cung.
+    Mỗi vòng dùng dist của vòng trước
+    (kiểu Jacobi) nên sau k vòng đã đúng cho mọi đường ≤ k cung: còn giảm ở vòng thứ n
+    nghĩa là có chu trình âm. Chu trình trong pred luôn là chu trình âm (pred chỉ đổi khi
+    dist giảm hẳn), nên thỉnh thoảng tìm chu trình trong pred để dừng sớm, không đợi đủ n vòng.
+    Trả về (số vòng, một đỉnh nằm trên / dẫn tới chu trình âm hoặc -1).
+    """
+    a, b, w = csr.arcs()
+    indptr = csr.indptr
+    n = csr.n
+    front = np.flatnonzero(active)
+    check = FIRST_CYCLE_CHECK
+    for i in range(n):
+        if i == check:
+            check *= 2
+            cycle = cores.pred_cycle(pred.tolist())
+            if cycle:
+                return i, cycle[0]
+        if observer:
+            observer("round", None, None, i)
+        sel = _out_arcs(indptr, front)
+        ua, vb = a[sel], b[sel]
+        cand = dist[ua] + w[sel]
+        better = cand < dist[vb]
+        if not better.any():
+            return i, -1
+        ua, vb, cand = ua[better], vb[better], cand[better]
+        np.minimum.at(dist, vb, cand)
+        # nhiều cung cùng vào một đỉnh: giữ một cung đạt min làm pred
+        win = cand == dist[vb]
+        pred[vb[win]] = ua[win]
+        front = np.unique(vb)
+    return n, int(vb[0])
+
+
+def _out_arcs(indptr, front):
+    """Vị trí (trong mảng cung CSR) của mọi cung đi ra từ các đỉnh front"""
+    start = indptr[front]
+    count = indptr[front + 1] - start
+    # cung của front[i] nằm ở start[i] .. start[i] + count[i] - 1, nối liền nhau trong kết quả
+    offset = np.repeat(start - (np.cumsum(count) - count), count)
+    return offset + np.arange(len(offset))
+
+
+def vectorized(csr, s, observer=None):
+    n = csr.n
+    dist = np.full(n, np.inf)
+    dist[s] = 0.0
+    pred = np.full(n, -1, dtype=np.int64)
+    active = np.zeros(n, dtype=bool)
+    active[s] = True
+    rounds, last = relax_rounds(csr, dist, pred, active, observer)
+    pred = pred.tolist()
+    cycle = cores.pred_cycle(pred, last) if last >= 0 else []
+    return {"dist": dist.tolist(), "pred": pred, "rounds": rounds,
+            "negative_cycle": last >= 0, "cycle": cycle}
+
+
+def potentials(csr):
+    """
+    Bellman-Ford từ một đỉnh ảo nối tới mọi đỉnh với trọng số 0 (bước đầu của Johnson).
+    Trả về (thế năng h dạng ndarray, chu trình âm); có chu trình âm thì h là None.
+    """
+    n = csr.n
+    h = np.zeros(n)
+    pred = np.full(n, -1, dtype=np.int64)
+    _, last = relax_rounds(csr, h, pred, np.ones(n, dtype=bool))
+    if last >= 0:
+        return None, cores.pred_cycle(pred.tolist(), last)
+    return h, []
+
+
+METHODS = {"rounds": cores.bellman_ford, "spfa": cores.spfa, "vectorized": vectorized}
+
+
+def solve(csr, s, method="auto", observer=None):
+    """Bellman-Ford từ s theo method ("rounds" / "spfa" / "vectorized" / "auto")"""
+    if method == "auto":
+        method = "vectorized" if len(csr.indices) >= AUTO_VECTORIZE_ARCS else "spfa"
+    fn = METHODS.get(method)
+    if fn is None:
+        raise ValueError(f"Cách chạy Bellman-Ford không hợp lệ: {method}")
+    return fn(csr, s, observer)
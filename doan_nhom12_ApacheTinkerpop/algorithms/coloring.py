@@ -0,0 +1,203 @@
+# algorithms/coloring.py
+"""
+Tô màu đồ thị tham lam với nhiều cách chọn thứ tự đỉnh, cùng dạng kết quả {"color": [...]}
+(màu đánh số từ 1, đồ thị có hướng thì tô trên đồ thị bỏ hướng — CSRGraph.undirected()):
+- "natural"        : theo chỉ số đỉnh (thứ tự thêm đỉnh, như cores.graph_coloring)
+- "largest_first"  : bậc giảm dần (Welsh-Powell)
+- "smallest_last"  : lần lượt bỏ đỉnh bậc nhỏ nhất (bucket theo bậc), tô theo thứ tự ngược lại
+                     — số màu <= độ suy biến + 1
+- "dsatur"         : luôn tô đỉnh có nhiều màu khác nhau quanh nó nhất (độ bão hoà), các đỉnh
+                     xếp vào bucket theo độ bão hoà nên mỗi lần chọn / cập nhật là O(1)
+- "jones_plassmann": song song theo vòng bằng numpy: mỗi vòng tô cùng lúc mọi đỉnh có độ ưu
+                     tiên lớn hơn mọi láng giềng chưa tô (một tập độc lập); ưu tiên = bậc,
+                     cùng bậc thì ngẫu nhiên — hợp với đồ thị lớn và thưa (đồ thị dày thì
+                     mỗi vòng chỉ tô được vài đỉnh, số vòng gần bằng số màu)
+- "auto"           : jones_plassmann khi đồ thị nhiều cung nhưng bậc trung bình nhỏ, không thì dsatur
+
+Màu cấm của một đỉnh giữ dạng bitset (bit c = màu c đã có ở láng giềng): màu nhỏ nhất còn
+trống là bit 0 thấp nhất, tìm bằng vài phép toán bit thay vì thử lần lượt 1, 2, 3...
+"""
+import numpy as np
+
+AUTO_PARALLEL_ARCS = 1000000   # ít cung hơn thì dsatur (ít màu hơn, vòng Python vẫn đủ nhanh)
+AUTO_PARALLEL_DEGREE = 32      # bậc trung bình lớn hơn thì jones_plassmann tốn quá nhiều vòng
+WORD = 64                      # jones_plassmann: số màu trong một ô uint64 của bitset
+
+
+def _free(mask):
+    """Màu nhỏ nhất >= 1 không có trong bitset mask (bit 0 = màu 0 = chưa tô, luôn coi là cấm)"""
+    mask |= 1
+    return (~mask & (mask + 1)).bit_length() - 1
+
+
+def _degree(csr):
+    return np.diff(csr.undirected().indptr)
+
+
+# ================== Tham lam theo thứ tự ==================
+def greedy(csr, order, observer=None):
+    """Tô lần lượt các đỉnh trong order bằng màu nhỏ nhất chưa có ở láng giềng"""
+    indptr, indices, _ = csr.undirected().lists()
+    color = [0] * csr.n
+    for u in order:
+        mask = 0
+        for k in range(indptr[u], indptr[u + 1]):
+            mask |= 1 << color[indices[k]]
+        c = _free(mask)
+        color[u] = c
+        if observer:
+            observer("color", u, None, c)
+    return {"color": color}
+
+
+def natural(csr, observer=None):
+    return greedy(csr, range(csr.n), observer)
+
+
+def largest_first(csr, observer=None):
+    return greedy(csr, np.argsort(-_degree(csr), kind="stable").tolist(), observer)
+
+
+def smallest_last_order(csr):
+    """Thứ tự smallest-last (Matula-Beck) trong O(n + m): bucket[d] = các đỉnh còn lại có bậc d"""
+    indptr, indices, _ = csr.undirected().lists()
+    degree = _degree(csr).tolist()
+    bucket = [dict() for _ in range(max(degree, default=0) + 1)]
+    for v, d in enumerate(degree):
+        bucket[d][v] = None
+    removed = [False] * csr.n
+    order = []
+    d = 0
+    for _ in range(csr.n):
+        # bỏ một đỉnh thì bậc nhỏ nhất giảm tối đa 1
+        d = max(d - 1, 0)
+        while not bucket[d]:
+            d += 1
+        v, _ = bucket[d].popitem()
+        removed[v] = True
+        order.append(v)
+        for k in range(indptr[v], indptr[v + 1]):
+            x = indices[k]
+            if not removed[x]:
+                del bucket[degree[x]][x]
+                degree[x] -= 1
+                bucket[degree[x]][x] = None
+    order.reverse()
+    return order
+
+
+def smallest_last(csr, observer=None):
+    return greedy(csr, smallest_last_order(csr), observer)
+
+
+# ================== DSatur ==================
+def dsatur(csr, observer=None):
+    """
+    DSatur với bucket theo độ bão hoà: bucket[s] chứa các đỉnh chưa tô có s màu khác nhau
+    ở láng giềng. Lấy ra bằng dict.popitem() (O(1); next(iter(...)) chậm dần vì dict giữ chỗ
+    các khoá đã xoá ở đầu), nên cùng độ bão hoà thì đỉnh vào bucket sau cùng được chọn trước;
+    ban đầu bucket 0 xếp theo bậc tăng dần để đỉnh bậc lớn nhất ra trước.
+    """
+    indptr, indices, _ = csr.undirected().lists()
+    n = csr.n
+    color = [0] * n
+    forbidden = [0] * n
+    saturation = [0] * n
+    bucket = [dict.fromkeys(np.argsort(_degree(csr), kind="stable").tolist())]
+    top = 0
+    for _ in range(n):
+        while not bucket[top]:
+            top -= 1
+        u, _ = bucket[top].popitem()
+        c = _free(forbidden[u])
+        color[u] = c
+        if observer:
+            observer("color", u, None, c)
+        bit = 1 << c
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if color[v] or forbidden[v] & bit:
+                continue
+            forbidden[v] |= bit
+            s = saturation[v]
+            del bucket[s][v]
+            s += 1
+            saturation[v] = s
+            if s == len(bucket):
+                bucket.append({})
+            bucket[s][v] = None
+            if s > top:
+                top = s
+    return {"color": color}
+
+
+# ================== Jones-Plassmann ==================
+def _lowest_free(forbidden):
+    """Màu nhỏ nhất (từ 1) không bị cấm cho từng hàng bitset (k, số ô); mọi ô đầy thì trả -1"""
+    inv = ~forbidden
+    word = np.argmax(inv != 0, axis=1)
+    rows = np.arange(len(inv))
+    x = inv[rows, word]
+    full = x == 0
+    x[full] = 1
+    low = x & (~x + np.uint64(1))                  # chỉ giữ bit 1 thấp nhất
+    bit = np.log2(low.astype(np.float64)).astype(np.int64)
+    return np.where(full, -1, word * WORD + bit + 1)
+
+
+def jones_plassmann(csr, observer=None, seed=0):
+    """
+    Mỗi vòng: đỉnh chưa tô có ưu tiên lớn hơn mọi láng giềng chưa tô được tô cùng lúc
+    (chúng không kề nhau), rồi ghi màu vừa tô vào bitset cấm của láng giềng. Chỉ giữ lại
+    các cung giữa hai đỉnh chưa tô nên mỗi vòng rẻ dần. Kết quả trùng với greedy() theo
+    thứ tự ưu tiên giảm dần. Trả thêm số vòng (rounds).
+    """
+    n = csr.n
+    a, b, _ = csr.undirected().arcs()
+    keep = a != b
+    a, b = a[keep].astype(np.int64), b[keep].astype(np.int64)
+    rnd = np.random.default_rng(seed)
+    priority = np.empty(n, dtype=np.int64)
+    priority[np.lexsort((rnd.random(n), np.bincount(a, minlength=n)))] = np.arange(n)
+    color = np.zeros(n, dtype=np.int64)
+    forbidden = np.zeros((n, 1), dtype=np.uint64)
+    uncolored = np.ones(n, dtype=bool)
+    rounds = 0
+    while uncolored.any():
+        if observer:
+            observer("round", None, None, rounds)
+        rounds += 1
+        beaten = np.zeros(n, dtype=bool)
+        beaten[a[priority[b] > priority[a]]] = True
+        chosen = np.flatnonzero(uncolored & ~beaten)
+        c = _lowest_free(forbidden[chosen])
+        if (c < 0).any():
+            forbidden = np.hstack([forbidden, np.zeros((n, 1), dtype=np.uint64)])
+            c = _lowest_free(forbidden[chosen])
+        color[chosen] = c
+        uncolored[chosen] = False
+        if observer:
+            for u, cu in zip(chosen.tolist(), c.tolist()):
+                observer("color", u, None, cu)
+        done = ~uncolored[a]
+        ca, cb = color[a[done]] - 1, b[done]
+        np.bitwise_or.at(forbidden, (cb, ca // WORD), np.uint64(1) << (ca % WORD).astype(np.uint64))
+        live = uncolored[a] & uncolored[b]
+        a, b = a[live], b[live]
+    return {"color": color.tolist(), "rounds": rounds}
+
+
+METHODS = {"natural": natural, "largest_first": largest_first, "smallest_last": smallest_last,
+           "dsatur": dsatur, "jones_plassmann": jones_plassmann}
+
+
+def solve(csr, method="auto", observer=None):
+    """Tô màu theo method (xem đầu file); "auto" chọn theo số cung và bậc trung bình"""
+    if method == "auto":
+        arcs = len(csr.indices)
+        large = arcs >= AUTO_PARALLEL_ARCS and arcs <= AUTO_PARALLEL_DEGREE * csr.n
+        method = "jones_plassmann" if large else "dsatur"
+    fn = METHODS.get(method)
+    if fn is None:
+        raise ValueError(f"Cách tô màu không hợp lệ: {method}")
+    return fn(csr, observer)
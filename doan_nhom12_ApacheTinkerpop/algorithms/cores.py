@@ -0,0 +1,551 @@
+# algorithms/cores.py
+"""
+Lõi tính toán thuần của các thuật toán: chạy trên CSRGraph với chỉ số đỉnh
+nguyên, không log, không vẽ, không phụ thuộc Qt — dùng được cho batch job.
+
+Mỗi hàm trả về dict kết quả (chỉ số đỉnh nguyên, dùng named() để đổi sang tên).
+Các bước chỉ được phát qua observer tuỳ chọn: observer(kind, u, v, x)
+    "discover"    u, v      : u được đưa vào hàng đợi, v là đỉnh phát hiện u (BFS)
+    "visit"       u         : thăm u (DFS / BFS)
+    "settle"      u, x=dist : chốt khoảng cách của u (Dijkstra)
+    "reach"       u, x=dist : chốt u khi tìm đường giữa hai đỉnh (dijkstra_path, astar...)
+    "round"       x=i       : bắt đầu vòng lặp thứ i (Bellman-Ford, từ 0)
+    "relax"       u, v, x   : giảm dist[v] = x qua cạnh u->v (Bellman-Ford, SPFA)
+    "choose_edge" u, v, x=w : chọn cạnh u-v vào cây khung (Prim / Kruskal)
+    "color"       u, x=c    : tô màu c cho u
+observer=None là chế độ headless: không tạo sự kiện nào.
+
+DFS / BFS còn có dạng generator (dfs_events / bfs_events) sinh sự kiện lười cùng dạng
+(kind, u, v, x), thêm "finish" và các loại cạnh; có observer thì dfs / bfs chạy qua chúng
+(không kèm sự kiện cạnh).
+"""
+import heapq
+import math
+from collections import deque
+
+
+# ================== Luồng sự kiện DFS / BFS ==================
+def dfs_events(csr, s, edges=True):
+    """
+    DFS không đệ quy (stack các (đỉnh, vị trí kề kế tiếp)), sinh sự kiện (kind, u, v, x):
+        "visit"        u, v=cha, x=thứ tự thăm      "finish"     u, x=thứ tự xong
+        "tree_edge"    u, v                         "back_edge"  u, v: v là tổ tiên còn mở của u
+        "forward_edge" / "cross_edge" u, v: v đã xong (chỉ đồ thị có hướng)
+    Vô hướng: cạnh quay về cha (một lần) và chiều ngược của back edge không được sinh.
+    edges=False: bỏ mọi sự kiện cạnh (mỗi cung một sự kiện), chỉ còn visit / finish.
+    Sinh lười: bên tiêu thụ kéo tới đâu DFS chạy tới đó, bỏ generator là dừng DFS.
+    """
+    indptr, indices, _ = csr.lists()
+    n = csr.n
+    undirected = not csr.directed
+    disc = [-1] * n
+    done = [False] * n
+    parent = [-1] * n
+    used_parent = [False] * n
+    disc[s] = 0
+    t = 1
+    finished = 0
+    yield ("visit", s, None, 0)
+    stack = [(s, indptr[s])]
+    while stack:
+        u, k = stack[-1]
+        if k == indptr[u + 1]:
+            stack.pop()
+            done[u] = True
+            yield ("finish", u, None, finished)
+            finished += 1
+            continue
+        stack[-1] = (u, k + 1)
+        v = indices[k]
+        if disc[v] == -1:
+            disc[v] = t
+            parent[v] = u
+            if edges:
+                yield ("tree_edge", u, v, None)
+            yield ("visit", v, u, t)
+            t += 1
+            stack.append((v, indptr[v]))
+        elif not edges:
+            continue
+        elif not done[v]:
+            if undirected and v == parent[u] and not used_parent[u]:
+                used_parent[u] = True
+                continue
+            yield ("back_edge", u, v, None)
+        elif not undirected:
+            yield ("forward_edge" if disc[v] > disc[u] else "cross_edge", u, v, None)
+
+
+def bfs_events(csr, s, edges=True):
+    """
+    BFS theo hàng đợi, sinh sự kiện (kind, u, v, x):
+        "discover" v, u, x=tầng: u phát hiện v, v vào hàng đợi
+        "visit"    u, x=tầng: lấy u ra khỏi hàng đợi
+        "tree_edge" u, v: u phát hiện v          "non_tree_edge" u, v: v đã được phát hiện
+        "finish"   u: đã xét hết kề của u
+    edges=False: bỏ tree_edge / non_tree_edge (mỗi cung một sự kiện).
+    """
+    indptr, indices, _ = csr.lists()
+    level = [-1] * csr.n
+    level[s] = 0
+    yield ("discover", s, None, 0)
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        d = level[u]
+        yield ("visit", u, None, d)
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if level[v] == -1:
+                level[v] = d + 1
+                if edges:
+                    yield ("tree_edge", u, v, None)
+                yield ("discover", v, u, d + 1)
+                queue.append(v)
+            elif edges:
+                yield ("non_tree_edge", u, v, None)
+        yield ("finish", u, None, d)
+
+
+# ================== DFS ==================
+def dfs(csr, s, observer=None):
+    if observer:
+        order = []
+        for event in dfs_events(csr, s, edges=False):
+            observer(*event)
+            if event[0] == "visit":
+                order.append(event[1])
+        return {"order": order}
+    indptr, indices, _ = csr.lists()
+    seen = [False] * csr.n
+    order = []
+    # DFS đệ quy viết lại bằng stack các (đỉnh, vị trí kề kế tiếp)
+    seen[s] = True
+    order.append(s)
+    stack = [(s, indptr[s])]
+    while stack:
+        u, k = stack[-1]
+        end = indptr[u + 1]
+        while k < end and seen[indices[k]]:
+            k += 1
+        if k == end:
+            stack.pop()
+            continue
+        stack[-1] = (u, k + 1)
+        v = indices[k]
+        seen[v] = True
+        order.append(v)
+        stack.append((v, indptr[v]))
+    return {"order": order}
+
+
+# ================== BFS ==================
+def bfs(csr, s, observer=None):
+    pred = [-1] * csr.n
+    order = []
+    if observer:
+        for event in bfs_events(csr, s, edges=False):
+            observer(*event)
+            kind = event[0]
+            if kind == "visit":
+                order.append(event[1])
+            elif kind == "discover" and event[2] is not None:
+                pred[event[1]] = event[2]
+        return {"order": order, "pred": pred}
+    indptr, indices, _ = csr.lists()
+    seen = [False] * csr.n
+    seen[s] = True
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not seen[v]:
+                seen[v] = True
+                pred[v] = u
+                queue.append(v)
+    return {"order": order, "pred": pred}
+
+
+# ================== Dijkstra ==================
+def dijkstra(csr, s, observer=None, target=None):
+    """target: dừng ngay khi chốt được target (dist / pred của các đỉnh chưa chốt còn dở)"""
+    indptr, indices, weights = csr.lists()
+    dist = [float("inf")] * csr.n
+    pred = [-1] * csr.n
+    dist[s] = 0
+    order = []
+    pq = [(0, s)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        order.append(u)
+        if observer:
+            observer("settle", u, None, d)
+        if u == target:
+            break
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(pq, (nd, v))
+    return {"dist": dist, "pred": pred, "order": order}
+
+
+# ================== Đường đi giữa hai đỉnh ==================
+# Các hàm dưới trả về {"distance", "path", "settled"}: path là list chỉ số từ s tới t
+# ([] nếu không tới được, distance = inf), settled = số đỉnh đã chốt (đo công việc đã làm).
+# Trọng số phải không âm như Dijkstra.
+def _walk(pred, t):
+    """Lần ngược pred (pred[đỉnh đầu] = -1) từ t"""
+    path = []
+    while t != -1:
+        path.append(t)
+        t = pred[t]
+    return path[::-1]
+
+
+def dijkstra_path(csr, s, t, observer=None):
+    """Dijkstra một chiều, dừng khi chốt t"""
+    inner = (lambda kind, u, v, x: observer("reach", u, v, x)) if observer else None
+    res = dijkstra(csr, s, inner, target=t)
+    if res["pred"][t] == -1 and t != s:
+        return {"distance": float("inf"), "path": [], "settled": len(res["order"])}
+    return {"distance": res["dist"][t], "path": _walk(res["pred"], t), "settled": len(res["order"])}
+
+
+def bidirectional_dijkstra(csr, s, t, observer=None):
+    """
+    Dijkstra đồng thời từ s (xuôi) và từ t (trên đồ thị đảo chiều), mỗi lượt mở rộng phía có
+    hàng đợi nhỏ hơn; dừng khi tổng hai đỉnh đầu hàng đợi không nhỏ hơn đường tốt nhất đã gặp.
+    dist / pred lưu bằng dict: chỉ chạm tới phần đồ thị đã duyệt.
+    """
+    if s == t:
+        if observer:
+            observer("reach", s, None, 0)
+        return {"distance": 0, "path": [s], "settled": 1}
+    sides = (csr.lists(), csr.reverse().lists())
+    dist = ({s: 0}, {t: 0})
+    pred = ({s: -1}, {t: -1})
+    done = (set(), set())
+    heaps = ([(0, s)], [(0, t)])
+    inf = float("inf")
+    best, meet = inf, -1
+    settled = 0
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        d, u = heapq.heappop(heaps[side])
+        if u in done[side]:
+            continue
+        done[side].add(u)
+        settled += 1
+        if observer:
+            observer("reach", u, None, d)
+        indptr, indices, weights = sides[side]
+        near, far = dist[side], dist[1 - side]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < near.get(v, inf):
+                near[v] = nd
+                pred[side][v] = u
+                heapq.heappush(heaps[side], (nd, v))
+            if v in far and near[v] + far[v] < best:
+                best, meet = near[v] + far[v], v
+    if meet == -1:
+        return {"distance": inf, "path": [], "settled": settled}
+    # nửa sau: pred phía ngược trỏ về phía t
+    path = _walk(pred[0], meet)
+    v = pred[1][meet]
+    while v != -1:
+        path.append(v)
+        v = pred[1][v]
+    return {"distance": best, "path": path, "settled": settled}
+
+
+def astar(csr, s, t, heuristic, observer=None):
+    """
+    A*: heuristic(i) ước lượng khoảng cách từ đỉnh i tới t, không được vượt quá khoảng cách
+    thật (admissible) thì kết quả mới là ngắn nhất. Đỉnh có thể được mở lại nếu heuristic
+    không nhất quán. heuristic trả về 0 thì chính là dijkstra_path.
+    """
+    indptr, indices, weights = csr.lists()
+    inf = float("inf")
+    dist = {s: 0}
+    pred = {s: -1}
+    settled = 0
+    tie = 0     # cùng f thì lấy đỉnh vào trước, không so sánh đỉnh
+    pq = [(heuristic(s), tie, 0, s)]
+    while pq:
+        _, _, d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        settled += 1
+        if observer:
+            observer("reach", u, None, d)
+        if u == t:
+            return {"distance": d, "path": _walk(pred, t), "settled": settled}
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist.get(v, inf):
+                dist[v] = nd
+                pred[v] = u
+                tie += 1
+                heapq.heappush(pq, (nd + heuristic(v), tie, nd, v))
+    return {"distance": inf, "path": [], "settled": settled}
+
+
+def euclidean_heuristic(coords, t, scale=1.0):
+    """
+    Heuristic cho astar từ toạ độ đỉnh: coords[i] = (x, y). Admissible khi mọi cạnh
+    u-v có trọng số >= scale * khoảng cách Euclid giữa u và v.
+    """
+    tx, ty = coords[t]
+
+    def h(i):
+        x, y = coords[i]
+        return scale * math.hypot(x - tx, y - ty)
+    return h
+
+
+# ================== Bellman-Ford ==================
+def pred_cycle(pred, v=-1):
+    """
+    Chu trình trong đồ thị pred (pred[x] -> x), dạng [c0, ..., ck] với cung c0->...->ck->c0.
+    Lùi n bước từ v (đỉnh vừa được relax khi đáng lẽ đã ổn định) là rơi vào chu trình;
+    không được thì quét toàn bộ pred. Không có chu trình thì trả về [].
+    """
+    n = len(pred)
+    for _ in range(n if v >= 0 else 0):
+        v = pred[v]
+        if v == -1:
+            break
+    if v == -1:
+        # tìm chu trình trong đồ thị hàm (mỗi đỉnh một pred): đánh dấu theo lượt đi
+        mark = [-1] * n
+        for start in range(n):
+            u = start
+            while u != -1 and mark[u] == -1:
+                mark[u] = start
+                u = pred[u]
+            if u != -1 and mark[u] == start:
+                v = u
+                break
+        else:
+            return []
+    cycle = [v]
+    u = pred[v]
+    while u != v:
+        cycle.append(u)
+        u = pred[u]
+    return cycle[::-1]
+
+
+def bellman_ford(csr, s, observer=None):
+    """
+    Tối đa n-1 vòng qua mọi cung (vô hướng: cả hai chiều), rồi tìm chu trình âm.
+    Ở vòng 8, 16, 32... tìm chu trình trong pred (luôn là chu trình âm) để dừng sớm.
+    """
+    a, b, w = csr.arcs()
+    edges = list(zip(a.tolist(), b.tolist(), w.tolist()))
+    dist = [float("inf")] * csr.n
+    pred = [-1] * csr.n
+    dist[s] = 0
+    rounds = 0
+    check = 8
+    for i in range(csr.n - 1):
+        if i == check:
+            check *= 2
+            cycle = pred_cycle(pred)
+            if cycle:
+                return {"dist": dist, "pred": pred, "rounds": rounds,
+                        "negative_cycle": True, "cycle": cycle}
+        rounds = i + 1
+        if observer:
+            observer("round", None, None, i)
+        updated = False
+        for u, v, wt in edges:
+            if dist[u] + wt < dist[v]:
+                dist[v] = dist[u] + wt
+                pred[v] = u
+                updated = True
+                if observer:
+                    observer("relax", u, v, dist[v])
+        if not updated:
+            break
+    cycle = []
+    for u, v, wt in edges:
+        if dist[u] + wt < dist[v]:
+            pred[v] = u
+            cycle = pred_cycle(pred, v)
+            break
+    return {"dist": dist, "pred": pred, "rounds": rounds,
+            "negative_cycle": bool(cycle), "cycle": cycle}
+
+
+# ================== SPFA ==================
+def spfa(csr, s, observer=None):
+    """
+    Bellman-Ford theo hàng đợi (SPFA): chỉ relax cung đi ra từ đỉnh vừa giảm khoảng cách.
+    length[v] = số cung của đường hiện tại tới v; đạt n thì đường có lặp đỉnh, tức có chu trình
+    âm — khi đó tìm chu trình trong pred (mỗi n lần relax một lần cho tới khi thấy). Ngoài ra
+    cứ sau n, 2n, 4n... lần relax cũng tìm chu trình trong pred để phát hiện sớm
+    (chu trình trong pred luôn âm).
+    """
+    indptr, indices, weights = csr.lists()
+    n = csr.n
+    dist = [float("inf")] * n
+    pred = [-1] * n
+    length = [0] * n
+    queued = [False] * n
+    dist[s] = 0
+    queued[s] = True
+    queue = deque([s])
+    relaxations = 0
+    next_check = 0
+    next_scan = n
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        d = dist[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                length[v] = length[u] + 1
+                relaxations += 1
+                if observer:
+                    observer("relax", u, v, nd)
+                if (length[v] >= n and relaxations >= next_check) or relaxations >= next_scan:
+                    cycle = pred_cycle(pred, v) if length[v] >= n else pred_cycle(pred)
+                    if cycle:
+                        return {"dist": dist, "pred": pred, "relaxations": relaxations,
+                                "negative_cycle": True, "cycle": cycle}
+                    if length[v] >= n:
+                        next_check = relaxations + n
+                    if relaxations >= next_scan:
+                        next_scan *= 2
+                if not queued[v]:
+                    queued[v] = True
+                    queue.append(v)
+    return {"dist": dist, "pred": pred, "relaxations": relaxations,
+            "negative_cycle": False, "cycle": []}
+
+
+# ================== Prim ==================
+def prim(csr, s, observer=None):
+    indptr, indices, weights = csr.lists()
+    in_tree = [False] * csr.n
+    in_tree[s] = True
+    pq = []
+    mst = []
+    total = 0
+
+    def push_edges(u):
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not in_tree[v]:
+                heapq.heappush(pq, (weights[k], u, v))
+    push_edges(s)
+    while pq:
+        wt, u, v = heapq.heappop(pq)
+        if in_tree[v]:
+            continue
+        in_tree[v] = True
+        total += wt
+        mst.append((u, v, wt))
+        if observer:
+            observer("choose_edge", u, v, wt)
+        push_edges(v)
+    return {"mst": mst, "total": total}
+
+
+# ================== Kruskal ==================
+def kruskal(csr, observer=None):
+    parent = list(range(csr.n))
+
+    def find(x):
+        # path halving, không đệ quy
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    src, dst, w = csr.edge_lists()
+    mst = []
+    total = 0
+    for k in csr.w.argsort(kind="stable").tolist():
+        u, v = src[k], dst[k]
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            parent[rv] = ru
+            mst.append((u, v, w[k]))
+            total += w[k]
+            if observer:
+                observer("choose_edge", u, v, w[k])
+    return {"mst": mst, "total": total}
+
+
+# ================== Connected Components ==================
+def connected_components(csr):
+    """Thành phần liên thông (yếu nếu có hướng), đánh số 0, 1, ... theo đỉnh nhỏ nhất của thành phần"""
+    parent = list(range(csr.n))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    src, dst, _ = csr.edge_lists()
+    for u, v in zip(src, dst):
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            if ru < rv:
+                parent[rv] = ru
+            else:
+                parent[ru] = rv
+    label = {}
+    component = [label.setdefault(find(u), len(label)) for u in range(csr.n)]
+    return {"component": component}
+
+
+# ================== Graph Coloring ==================
+def graph_coloring(csr, observer=None):
+    indptr, indices, _ = csr.lists()
+    color = [0] * csr.n
+    for u in range(csr.n):
+        used = {color[indices[k]] for k in range(indptr[u], indptr[u + 1])}
+        c = 1
+        while c in used:
+            c += 1
+        color[u] = c
+        if observer:
+            observer("color", u, None, c)
+    return {"color": color}
+
+
+# ================== Đổi kết quả sang tên đỉnh ==================
+def named(csr, result):
+    """Đổi dict kết quả chỉ số nguyên sang tên đỉnh (đỉnh không tới được bị bỏ khỏi pred)"""
+    names = csr.names
+    out = {}
+    for key, value in result.items():
+        if key in ("order", "path", "cycle"):
+            out[key] = [names[i] for i in value]
+        elif key in ("dist", "color", "component", "level"):
+            out[key] = dict(zip(names, value))
+        elif key == "pred":
+            out[key] = {names[i]: names[p] for i, p in enumerate(value) if p >= 0}
+        elif key == "mst":
+            out[key] = [(names[u], names[v], wt) for u, v, wt in value]
+        else:
+            out[key] = value
+    return out
@@ -0,0 +1,300 @@
+# algorithms/csr_graph.py
+import hashlib
+
+import numpy as np
+
+
+class CSRGraph:
+    """
+    Đồ thị dạng CSR (compressed sparse row):
+    - đỉnh được đánh số 0..n-1 (names[i] là tên, index[tên] là số)
+    - kề của đỉnh i: indices[indptr[i]:indptr[i+1]], trọng số tương ứng trong weights
+    - đồ thị vô hướng lưu mỗi cạnh theo cả hai chiều
+    - src / dst / w: danh sách cạnh gốc (mỗi cạnh một lần), dùng cho Kruskal
+    - arcs(): mọi cung có hướng (vô hướng thì đủ hai chiều), dùng cho Bellman-Ford
+    Thứ tự kề giữ nguyên thứ tự thêm cạnh, giống networkx.
+    Không sửa tại chỗ: with_edge / without_edge trả về đồ thị mới với version tăng 1.
+    """
+
+    def __init__(self, names, indptr, indices, weights, src, dst, w, directed, index=None, version=0):
+        # index: dict tên -> số dựng sẵn (đồ thị sửa từ đồ thị khác dùng lại, không dựng lại)
+        self.names = list(names)
+        self.index = index if index is not None else {name: i for i, name in enumerate(self.names)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.src = np.asarray(src, dtype=np.int32)
+        self.dst = np.asarray(dst, dtype=np.int32)
+        self.w = np.asarray(w, dtype=np.float64)
+        self.directed = directed
+        self.version = version
+        self._fingerprint = None
+        self._lists = None
+        self._edge_lists = None
+        self._reverse = None
+        self._undirected = None
+        self._arcs = None
+
+    @property
+    def n(self):
+        return len(self.names)
+
+    @property
+    def m(self):
+        """Số cạnh gốc (cạnh vô hướng tính một lần)"""
+        return len(self.src)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.indptr, self.indices, self.weights,
+                                      self.src, self.dst, self.w))
+
+    # ================== Dựng đồ thị ==================
+    @classmethod
+    def from_networkx(cls, G):
+        names = list(G.nodes())
+        index = {name: i for i, name in enumerate(names)}
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        indices = []
+        weights = []
+        for i, u in enumerate(names):
+            for v, data in G.adj[u].items():
+                indices.append(index[v])
+                weights.append(data.get("weight", 1.0))
+            indptr[i + 1] = len(indices)
+        src, dst, w = [], [], []
+        for u, v, wt in G.edges(data="weight", default=1.0):
+            src.append(index[u])
+            dst.append(index[v])
+            w.append(wt)
+        return cls(names, indptr, indices, weights, src, dst, w, G.is_directed())
+
+    @classmethod
+    def from_edges(cls, vertices, edges, directed=False, weighted=False):
+        """
+        Dựng thẳng từ danh sách đỉnh và các dòng cạnh [u, v] / [u, v, w]
+        (ô nhập, file json, GremlinManager.iter_edges()) mà không qua networkx.
+        Cạnh lặp lại thì giữ vị trí đầu, trọng số cuối — giống nx.Graph.add_edge.
+        """
+        index = {}
+        for v in vertices:
+            index.setdefault(v, len(index))
+        unique = {}
+        for e in edges:
+            u, v = e[0], e[1]
+            w = float(e[2]) if weighted and len(e) == 3 else 1.0
+            iu = index.setdefault(u, len(index))
+            iv = index.setdefault(v, len(index))
+            key = (iu, iv) if directed or iu <= iv else (iv, iu)
+            if key in unique:
+                unique[key] = (unique[key][0], unique[key][1], w)
+            else:
+                unique[key] = (iu, iv, w)
+        rows = list(unique.values())
+        src = np.fromiter((r[0] for r in rows), dtype=np.int32, count=len(rows))
+        dst = np.fromiter((r[1] for r in rows), dtype=np.int32, count=len(rows))
+        w = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+        names = [None] * len(index)
+        for name, i in index.items():
+            names[i] = name
+        return cls.from_arrays(names, src, dst, w, directed)
+
+    @classmethod
+    def from_index_arrays(cls, names, src, dst, w, directed=False, merge="last"):
+        """
+        Như from_edges nhưng đầu vào đã là mảng chỉ số (graph/graph_loader.py):
+        bỏ cạnh lặp bằng numpy — giữ vị trí lần đầu, trọng số lần cuối
+        (merge="min": trọng số nhỏ nhất trong các cạnh lặp, dùng cho undirected()).
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        w = np.asarray(w, dtype=np.float64)
+        n = len(names)
+        if directed:
+            key = src * n + dst
+        else:
+            key = np.minimum(src, dst) * n + np.maximum(src, dst)
+        _, first = np.unique(key, return_index=True)
+        if len(first) == len(key):
+            return cls.from_arrays(names, src, dst, w, directed)
+        if merge == "min":
+            # sắp ổn định theo key: đầu mỗi nhóm là lần xuất hiện đầu, reduceat lấy min của nhóm
+            order = np.argsort(key, kind="stable")
+            sorted_key = key[order]
+            starts = np.flatnonzero(np.r_[True, sorted_key[1:] != sorted_key[:-1]])
+            first = order[starts]
+            wmin = np.minimum.reduceat(w[order], starts)
+            keep = np.argsort(first, kind="stable")
+            first = first[keep]
+            return cls.from_arrays(names, src[first], dst[first], wmin[keep], directed)
+        _, last = np.unique(key[::-1], return_index=True)
+        last = len(key) - 1 - last
+        # hai lần unique cùng sắp theo key nên first[i] và last[i] cùng một cạnh
+        order = np.argsort(first, kind="stable")
+        first, last = first[order], last[order]
+        return cls.from_arrays(names, src[first], dst[first], w[last], directed)
+
+    @classmethod
+    def from_arrays(cls, names, src, dst, w, directed=False):
+        """Dựng từ mảng cạnh số nguyên (src[k] -> dst[k], trọng số w[k])"""
+        src = np.asarray(src, dtype=np.int32)
+        dst = np.asarray(dst, dtype=np.int32)
+        w = np.asarray(w, dtype=np.float64)
+        n = len(names)
+        if directed:
+            a, b, ww = src, dst, w
+        else:
+            # mỗi cạnh hai chiều, xen kẽ để giữ thứ tự thêm cạnh như networkx;
+            # khuyên (u == v) chỉ lưu một lần
+            loop = src == dst
+            a = np.stack([src, dst], axis=1).ravel()
+            b = np.stack([dst, src], axis=1).ravel()
+            ww = np.repeat(w, 2)
+            keep = np.ones(len(a), dtype=bool)
+            keep[1::2] = ~loop
+            a, b, ww = a[keep], b[keep], ww[keep]
+        order = np.argsort(a, kind="stable")
+        a, b, ww = a[order], b[order], ww[order]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(a, minlength=n), out=indptr[1:])
+        # danh sách cạnh gốc lấy lại theo thứ tự hàng, giống G.edges() của networkx:
+        # vô hướng thì mỗi cạnh xuất hiện ở đầu mút có số nhỏ hơn
+        own = slice(None) if directed else b >= a
+        return cls(names, indptr, b, ww, a[own], b[own], ww[own], directed)
+
+    # ================== Truy cập ==================
+    def lists(self):
+        """
+        (indptr, indices, weights) dạng list Python — trong vòng lặp Python,
+        truy cập phần tử list nhanh hơn nhiều so với phần tử mảng numpy
+        """
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._lists
+
+    def edge_lists(self):
+        """(src, dst, w) dạng list Python"""
+        if self._edge_lists is None:
+            self._edge_lists = (self.src.tolist(), self.dst.tolist(), self.w.tolist())
+        return self._edge_lists
+
+    def arcs(self):
+        """
+        (a, b, w) mảng numpy: cung a[k] -> b[k] trọng số w[k], đúng thứ tự CSR
+        (a tăng dần); đồ thị vô hướng có đủ hai chiều, khác src / dst
+        """
+        if self._arcs is None:
+            a = np.repeat(np.arange(self.n, dtype=np.int32), np.diff(self.indptr))
+            self._arcs = (a, self.indices, self.weights)
+        return self._arcs
+
+    def reverse(self):
+        """Đồ thị đảo chiều mọi cạnh (cache lại), dùng cho tìm kiếm ngược từ đích; vô hướng thì là chính nó"""
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            self._reverse = CSRGraph.from_arrays(self.names, self.dst, self.src, self.w, True)
+        return self._reverse
+
+    def undirected(self):
+        """
+        Đồ thị bỏ hướng (cache lại): u, v kề nhau nếu có cung u -> v hoặc v -> u, trọng số là
+        cung nhẹ hơn (như MST của bản gốc trên cả hai chiều); vô hướng thì là chính nó
+        """
+        if not self.directed:
+            return self
+        if self._undirected is None:
+            self._undirected = CSRGraph.from_index_arrays(self.names, self.src, self.dst, self.w, False, merge="min")
+        return self._undirected
+
+    def neighbors(self, i):
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def degree(self):
+        return np.diff(self.indptr)
+
+    def fingerprint(self):
+        """
+        Dấu vân tay cấu trúc (hex, cache lại): trùng nhau khi cùng hướng, cùng mảng kề và trọng số
+        (kể cả thứ tự kề) — không tính tên đỉnh, vì kết quả thuật toán theo chỉ số chỉ phụ thuộc
+        vào cấu trúc. Dùng làm khoá cache kết quả (algorithms/result_cache.py).
+        """
+        if self._fingerprint is None:
+            h = hashlib.blake2b(b"D" if self.directed else b"U", digest_size=16)
+            for arr in (self.indptr, self.indices, self.weights):
+                h.update(np.ascontiguousarray(arr).data)
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    # ================== Sửa đồ thị ==================
+    def arc_weight(self, u, v):
+        """Trọng số cung u -> v (chỉ số), None nếu không có; O(bậc của u)"""
+        lo = self.indptr[u]
+        hit = np.flatnonzero(self.indices[lo:self.indptr[u + 1]] == v)
+        return float(self.weights[lo + hit[0]]) if len(hit) else None
+
+    def _edge_pos(self, u, v):
+        """Vị trí cạnh u -> v (vô hướng: u - v) trong src / dst, -1 nếu không có"""
+        a, b = (u, v) if self.directed or u <= v else (v, u)
+        hit = np.flatnonzero((self.src == a) & (self.dst == b))
+        return int(hit[0]) if len(hit) else -1
+
+    def _arc_pos(self, u, v):
+        lo = self.indptr[u]
+        return int(lo + np.flatnonzero(self.indices[lo:self.indptr[u + 1]] == v)[0])
+
+    def _derived(self, names, index, indptr, indices, weights, src, dst, w):
+        return CSRGraph(names, indptr, indices, weights, src, dst, w, self.directed, index, self.version + 1)
+
+    def with_edge(self, u, v, w=1.0):
+        """
+        Đồ thị mới có thêm cạnh u -> v trọng số w (theo tên; đỉnh chưa có được thêm vào cuối),
+        cạnh đã có thì chỉ đổi trọng số. Cạnh mới nằm cuối danh sách kề của u (và của v nếu vô
+        hướng) và cuối hàng của nó trong src / dst — đúng như khi dựng lại từ đầu với cạnh này
+        thêm sau cùng. Chỉ chép / chèn mảng numpy, không sắp xếp lại.
+        """
+        names, index, indptr = self.names, self.index, self.indptr
+        extra = [x for x in dict.fromkeys((u, v)) if x not in index]
+        if extra:
+            names = names + extra
+            index = dict(index)
+            for x in extra:
+                index[x] = len(index)
+            indptr = np.concatenate([indptr, np.full(len(extra), indptr[-1])])
+        iu, iv = index[u], index[v]
+        pos = self._edge_pos(iu, iv) if not extra else -1
+        if pos >= 0:
+            weights, ew = self.weights.copy(), self.w.copy()
+            ew[pos] = w
+            weights[self._arc_pos(iu, iv)] = w
+            if not self.directed:
+                weights[self._arc_pos(iv, iu)] = w
+            return self._derived(names, index, indptr, self.indices, weights,
+                                 self.src, self.dst, ew)
+        indptr = indptr.copy()
+        indices, weights = self.indices, self.weights
+        for x, y in ([(iu, iv)] if self.directed or iu == iv else [(iu, iv), (iv, iu)]):
+            k = indptr[x + 1]
+            indices = np.insert(indices, k, y)
+            weights = np.insert(weights, k, w)
+            indptr[x + 1:] += 1
+        a, b = (iu, iv) if self.directed or iu <= iv else (iv, iu)
+        k = np.searchsorted(self.src, a, side="right")
+        return self._derived(names, index, indptr, indices, weights, np.insert(self.src, k, a),
+                             np.insert(self.dst, k, b), np.insert(self.w, k, w))
+
+    def without_edge(self, u, v):
+        """Đồ thị mới đã bỏ cạnh u -> v (theo tên, vô hướng: u - v); không có cạnh thì raise ValueError"""
+        iu, iv = self.index.get(u), self.index.get(v)
+        pos = self._edge_pos(iu, iv) if iu is not None and iv is not None else -1
+        if pos < 0:
+            raise ValueError(f"Không có cạnh {u} - {v} trong đồ thị")
+        indptr = self.indptr.copy()
+        indices, weights = self.indices, self.weights
+        for x, y in ([(iu, iv)] if self.directed or iu == iv else [(iu, iv), (iv, iu)]):
+            k = int(indptr[x] + np.flatnonzero(indices[indptr[x]:indptr[x + 1]] == y)[0])
+            indices = np.delete(indices, k)
+            weights = np.delete(weights, k)
+            indptr[x + 1:] -= 1
+        return self._derived(self.names, self.index, indptr, indices, weights, np.delete(self.src, pos),
+                             np.delete(self.dst, pos), np.delete(self.w, pos))
@@ -0,0 +1,77 @@
+# algorithms/frontier_bfs.py
+"""
+BFS theo tầng bằng numpy, tự đổi hướng giữa hai cách mở rộng (direction-optimizing BFS):
+- top-down : gom kề của mọi đỉnh trong frontier, giữ những đỉnh chưa thăm
+- bottom-up: mỗi đỉnh chưa thăm tìm một láng giềng vào (đồ thị đảo chiều) nằm trong frontier
+Frontier lớn (đồ thị đường kính nhỏ, tầng giữa chứa gần hết đỉnh) thì bottom-up rẻ hơn vì
+không phải gom và khử trùng lặp cả triệu cung; frontier nhỏ thì top-down.
+Quy tắc đổi hướng theo Beamer: top-down -> bottom-up khi số cung ra của frontier
+> số cung của đỉnh chưa thăm / alpha; bottom-up -> top-down khi frontier < n / beta.
+
+Kết quả như cores.bfs nhưng thêm level; order đi theo tầng, trong một tầng theo chỉ số đỉnh
+(khác thứ tự hàng đợi của cores.bfs), pred là một cha bất kỳ ở tầng trước.
+"""
+import numpy as np
+
+ALPHA = 14
+BETA = 24
+
+
+def _top_down(csr, frontier, level, pred, depth):
+    indptr, indices = csr.indptr, csr.indices
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return frontier[:0]
+    # vị trí các ô kề của frontier trong indices, nối liền nhau
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    nbr = indices[offsets]
+    parent = np.repeat(frontier, counts)
+    fresh = level[nbr] < 0
+    nbr, parent = nbr[fresh], parent[fresh]
+    nxt, first = np.unique(nbr, return_index=True)
+    level[nxt] = depth
+    pred[nxt] = parent[first]
+    return nxt
+
+
+def _bottom_up(rev_arcs, in_frontier, level, pred, depth):
+    a, b, _ = rev_arcs          # a <- b trong đồ thị gốc
+    hit = in_frontier[b] & (level[a] < 0)
+    nxt, first = np.unique(a[hit], return_index=True)
+    level[nxt] = depth
+    pred[nxt] = b[hit][first]
+    return nxt
+
+
+def direction_optimizing_bfs(csr, s, alpha=ALPHA, beta=BETA):
+    n = csr.n
+    level = np.full(n, -1, dtype=np.int64)
+    pred = np.full(n, -1, dtype=np.int64)
+    level[s] = 0
+    frontier = np.array([s], dtype=np.int64)
+    degree = np.diff(csr.indptr)
+    unexplored = int(degree.sum()) - int(degree[s])
+    rev_arcs = None
+    bottom_up = False
+    order = [frontier]
+    depth = 0
+    while len(frontier):
+        depth += 1
+        frontier_arcs = int(degree[frontier].sum())
+        if not bottom_up and frontier_arcs > unexplored / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+        if bottom_up:
+            if rev_arcs is None:
+                rev_arcs = csr.reverse().arcs()
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            frontier = _bottom_up(rev_arcs, in_frontier, level, pred, depth)
+        else:
+            frontier = _top_down(csr, frontier, level, pred, depth)
+        unexplored -= int(degree[frontier].sum())
+        order.append(frontier)
+    return {"order": np.concatenate(order).tolist(), "pred": pred.tolist(), "level": level.tolist()}
@@ -1,206 +1,398 @@
 # algorithms/controller_animator.py
-import heapq
-from collections import deque
+from algorithms import bellman_ford, coloring, cores, frontier_bfs, incremental, mst, shortest_paths
+from algorithms.csr_graph import CSRGraph
+from algorithms.observers import TraceObserver
+from algorithms.trace_log import TraceRecorder
+from profiling import phase
 
 
 class AlgorithmController:
-    def __init__(self, G, status_widget, visualizer=None):
+    def __init__(self, G, status_widget=None, visualizer=None, trace_every=1, observer=None,
+                 server=None, execution=None, profiler=None, cache=None):
+        # G: networkx graph hoặc CSRGraph dựng sẵn (VD: từ cạnh Gremlin)
+        # status_widget / visualizer = None: không log / không vẽ
+        # trace_every: chỉ log và vẽ 1 trên mỗi trace_every bước
+        # observer: callable(kind, u, v, x) nhận mọi bước (tiến độ, huỷ...), xem algorithms/cores.py
+        # server: ServerBackend (algorithms/server_backend.py) cho các thuật toán chạy trên Gremlin Server
+        # execution: {tên thuật toán: "client" | "server"} dùng cho compute(), mặc định "client"
+        # profiler: profiling.Profiler — đo run() / compute() theo giai đoạn "run:<tên>" / "compute:<tên>",
+        #           run() đếm thêm số bước theo loại sự kiện
+        # cache: ResultCache (algorithms/result_cache.py, VD: result_cache.SHARED) — chạy lại cùng thuật toán,
+        #        cùng nguồn trên cùng cấu trúc đồ thị thì lấy kết quả đã lưu; None = luôn tính lại
         self.G = G
+        self.csr = G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
         self.status = status_widget   # QTextEdit
         self.vis = visualizer
+        self.trace_every = trace_every
+        self.observer = observer
+        self.trace = None
+        self.server = server
+        self.execution = dict(execution or {})
+        self.profiler = profiler
+        self.cache = cache
+        self.cache_hit = False
+
+    def _log(self, text):
+        if self.status is not None:
+            self.status.append(text)
+
+    def _draw(self, **kwargs):
+        if self.vis:
+            self.vis.draw(**kwargs)
+
+    def _observer(self, label=""):
+        self.trace = None
+        hook = self.observer
+        if self.profiler is not None:
+            hook = self.profiler.counter(hook)
+        if self.status is None and not self.vis:
+            return hook
+        self.trace = TraceObserver(self.csr.names, self.status, self.vis or None, label,
+                                   self.trace_every, hook=hook)
+        return self.trace
+
+    def _cached(self, key, fn):
+        """
+        Kết quả của key = (tên thuật toán, nguồn, biến thể) trên self.csr: lấy từ cache nếu có,
+        không thì fn() rồi lưu lại. Kết quả lấy từ cache dùng chung — không sửa tại chỗ.
+        self.cache_hit cho biết lần gọi vừa rồi lấy từ cache: khi đó không có bước nào được
+        phát, bên gọi phải tự log / vẽ kết quả (MST, tô màu vốn đã làm vậy sau khi chạy).
+        """
+        self.cache_hit = False
+        if self.cache is None:
+            return fn()
+        key = (self.csr.fingerprint(),) + key
+        res = self.cache.get(key)
+        if res is not None:
+            self._log("(dùng kết quả đã tính cho đồ thị này)")
+            self.cache_hit = True
+            return res
+        res = fn()
+        self.cache.put(key, res)
+        return res
 
 
     # ================== DFS ==================
     def dfs(self, start):
-        visited = set()
-        self.status.append("=== DFS ===")
-        def _dfs(v):
-            if v in visited:
-                return
-            visited.add(v)
-            self.status.append(f"DFS thăm: {v}")
-            if self.vis:
-                self.vis.draw(visited=visited, active=v)
-            for n in self.G.neighbors(v):
-                _dfs(n)
-        _dfs(start)
-        if self.vis:
-            self.vis.draw(visited=visited)
+        self._log("=== DFS ===")
+        res = cores.dfs(self.csr, self.csr.index[start], self._observer("DFS"))
+        if self.trace:
+            self._draw(visited=self.trace.state.visited)
+        return res
 
 
     # ================== BFS ==================
     def bfs(self, start):
-        visited = {start}
-        queue = deque([start])
-        self.status.append("=== BFS ===")
-        while queue:
-            v = queue.popleft()
-            self.status.append(f"BFS thăm: {v}")
-            if self.vis:
-                self.vis.draw(visited=visited, active=v)
-            for n in self.G.neighbors(v):
-                if n not in visited:
-                    visited.add(n)
-                    queue.append(n)
-        if self.vis:
-            self.vis.draw(visited=visited)
+        self._log("=== BFS ===")
+        res = cores.bfs(self.csr, self.csr.index[start], self._observer("BFS"))
+        if self.trace:
+            self._draw(visited=self.trace.state.visited)
+        return res
+
+    def bfs_levels(self, start):
+        """
+        BFS theo tầng đổi hướng top-down / bottom-up (algorithms/frontier_bfs.py), không phát
+        sự kiện từng bước — dùng cho đồ thị lớn. Trả về order, pred, level theo tên đỉnh.
+        """
+        if start not in self.csr.index:
+            raise ValueError(f"Không có đỉnh bắt đầu {start} trong đồ thị")
+        res = frontier_bfs.direction_optimizing_bfs(self.csr, self.csr.index[start])
+        return cores.named(self.csr, res)
 
 
     # ================== Dijkstra ==================
     def dijkstra(self, start):
-        dist = {v: float("inf") for v in self.G.nodes()}
-        dist[start] = 0
-        pq = [(0, start)]
-        self.status.append("=== Dijkstra ===")
-        while pq:
-            d, u = heapq.heappop(pq)
-            if d > dist[u]:
-                continue
-            self.status.append(f"Chọn đỉnh {u}, khoảng cách = {dist[u]}")
-            if self.vis:
-                self.vis.draw(visited=set(dist.keys()), active=u)
-            for v in self.G.neighbors(u):
-                w = self.G[u][v].get("weight", 1.0)
-                if dist[u] + w < dist[v]:
-                    dist[v] = dist[u] + w
-                    heapq.heappush(pq, (dist[v], v))
-        self.status.append("=== Dijkstra kết thúc ===")
-        if self.vis:
-            self.vis.draw()
+        self._log("=== Dijkstra ===")
+        s = self.csr.index[start]
+        res = self._cached(("Dijkstra", s, None), lambda: cores.dijkstra(self.csr, s, self._observer()))
+        final = self._show_distances(res) if self.cache_hit else None
+        self._log("=== Dijkstra kết thúc ===")
+        self._draw(**(final or {}))
+        return res
 
 
     # ================== Bellman-Ford ==================
-    def bellman_ford(self, start):
-        vertices = list(self.G.nodes())
-        dist = {v: float("inf") for v in vertices}
-        dist[start] = 0
-        edges = [(u, v, self.G[u][v].get("weight",1.0)) for u,v in self.G.edges()]
-        self.status.append("=== Bellman-Ford ===")
-        for i in range(len(vertices)-1):
-            self.status.append(f"Vòng lặp {i+1}")
-            updated = False
-            for u,v,w in edges:
-                if dist[u] + w < dist[v]:
-                    dist[v] = dist[u] + w
-                    updated = True
-                    self.status.append(f"  Relax {u}->{v}, dist={dist[v]}")
-                    if self.vis:
-                        self.vis.draw(active=v)
-            if not updated:
-                break
-        for u,v,w in edges:
-            if dist[u] + w < dist[v]:
-                self.status.append("⚠ Phát hiện chu trình âm")
-                return
-        self.status.append("=== Bellman-Ford kết thúc ===")
-        if self.vis:
-            self.vis.draw()
+    def bellman_ford(self, start, method="rounds"):
+        # method: "rounds" (log từng relax), "spfa", "vectorized", "auto" — xem algorithms/bellman_ford.py
+        self._log("=== Bellman-Ford ===")
+        s = self.csr.index[start]
+        res = self._cached(("Bellman-Ford", s, method),
+                           lambda: bellman_ford.solve(self.csr, s, method, self._observer()))
+        if res["negative_cycle"]:
+            cycle = [self.csr.names[i] for i in res["cycle"]]
+            self._log("⚠ Phát hiện chu trình âm: " + " → ".join(map(str, cycle + cycle[:1])))
+            self._draw(path=cycle + cycle[:1])
+            return res
+        final = self._show_distances(res) if self.cache_hit else None
+        self._log("=== Bellman-Ford kết thúc ===")
+        self._draw(**(final or {}))
+        return res
+
+
+    def _show_distances(self, res):
+        """
+        Khoảng cách lấy từ cache: log như các bước chốt đỉnh (lấy mẫu theo trace_every) và trả về
+        trạng thái vẽ cuối (đỉnh tới được) để giữ trên hình thay cho khung trống lúc kết thúc
+        """
+        if self.status is None and not self.vis:
+            return None
+        names, dist = self.csr.names, res["dist"]
+        order = res.get("order")
+        text = "Chọn đỉnh {}, khoảng cách = {}"
+        if order is None:
+            # Bellman-Ford không có thứ tự chốt: các đỉnh tới được theo khoảng cách tăng dần
+            order = sorted((i for i, d in enumerate(dist) if d != float("inf")), key=dist.__getitem__)
+            text = "Khoảng cách tới {} = {}"
+        every = max(1, int(self.trace_every))
+        for k, i in enumerate(order):
+            if k % every == 0 or k == len(order) - 1:
+                self._log(text.format(names[i], dist[i]))
+        if not order:
+            return None
+        return {"visited": {names[i] for i in order}, "active": names[order[-1]]}
+
+
+    # ================== Đường đi giữa hai đỉnh ==================
+    def shortest_path(self, start, target, method="bidirectional", heuristic=None):
+        """
+        Đường đi ngắn nhất start -> target, dừng ngay khi tới target thay vì chốt cả đồ thị.
+        method: "dijkstra" (một chiều), "bidirectional" (hai chiều), "astar"
+        heuristic (astar): {đỉnh: (x, y)} toạ độ đỉnh (VD: GremlinManager.get_coordinates(),
+        trọng số cạnh phải >= khoảng cách Euclid) hoặc callable(đỉnh) -> ước lượng khoảng
+        cách tới target; None = 0 (như Dijkstra)
+        Trả về distance, path (chỉ số đỉnh, [] nếu không tới được), settled (số đỉnh đã chốt).
+        """
+        csr = self.csr
+        for v in (start, target):
+            if v not in csr.index:
+                raise ValueError(f"Không có đỉnh {v} trong đồ thị")
+        s, t = csr.index[start], csr.index[target]
+        self._log(f"=== Đường đi {start} → {target} ({method}) ===")
+        observer = self._observer()
+        fn = {"dijkstra": cores.dijkstra_path, "bidirectional": cores.bidirectional_dijkstra}.get(method)
+        if method == "astar":
+            res = cores.astar(csr, s, t, self._heuristic(heuristic, t), observer)
+        elif fn is not None:
+            res = fn(csr, s, t, observer)
+        else:
+            raise ValueError(f"Cách tìm đường không hợp lệ: {method}")
+        path = [csr.names[i] for i in res["path"]]
+        if path:
+            self._log(f"Đường đi: {' → '.join(map(str, path))}, độ dài = {res['distance']}")
+        else:
+            self._log(f"Không có đường đi từ {start} tới {target}")
+        self._log(f"Số đỉnh đã chốt: {res['settled']}")
+        self._draw(visited=set(path), path=path)
+        return res
+
+    def _heuristic(self, heuristic, t):
+        if heuristic is None:
+            return lambda i: 0
+        names = self.csr.names
+        if callable(heuristic):
+            return lambda i: heuristic(names[i])
+        missing = [v for v in names if v not in heuristic]
+        if missing:
+            raise ValueError(f"Thiếu toạ độ của đỉnh {missing[0]}")
+        return cores.euclidean_heuristic([heuristic[v] for v in names], t)
 
 
     # ================== Prim ==================
     def prim(self, start):
-        visited = {start}
-        pq = []
-        mst_edges = []
-        self.status.append("=== Prim (MST) ===")
-        self.status.append(f"Bắt đầu từ đỉnh {start}")
-
-
-        def push_edges(u):
-            for v in self.G.neighbors(u):
-                if v not in visited:
-                    w = self.G[u][v].get("weight",1.0)
-                    heapq.heappush(pq, (w,u,v))
-        push_edges(start)
-        while pq:
-            w,u,v = heapq.heappop(pq)
-            if v in visited:
-                continue
-            visited.add(v)
-            mst_edges.append((u,v))
-            self.status.append(f"Chọn cạnh {u}-{v} (w={w})")
-            if self.vis:
-                self.vis.draw(mst_edges=mst_edges)
-            push_edges(v)
-        total = sum(self.G[u][v].get("weight",1.0) for u,v in mst_edges)
-        self.status.append(f"Tổng trọng số MST = {total}")
-        if self.vis:
-            self.vis.draw(mst_edges=mst_edges)
+        self._log("=== Prim (MST) ===")
+        self._log(f"Bắt đầu từ đỉnh {start}")
+        s = self.csr.index[start]
+        res = self._cached(("Prim", s, None), lambda: mst.prim(self.csr, s, self._observer()))
+        self._log_mst(res)
+        return res
 
 
     # ================== Kruskal ==================
     def kruskal(self):
-        parent = {}
-        def find(x):
-            if parent[x]!=x:
-                parent[x]=find(parent[x])
-            return parent[x]
-        def union(a,b):
-            ra,rb=find(a),find(b)
-            if ra!=rb:
-                parent[rb]=ra
-                return True
-            return False
-        vertices = list(self.G.nodes())
-        for v in vertices:
-            parent[v]=v
-        edges = [(u,v,self.G[u][v].get("weight",1.0)) for u,v in self.G.edges()]
-        edges.sort(key=lambda x:x[2])
-        mst=[]
-        self.status.append("=== Kruskal (MST) ===")
-        for u,v,w in edges:
-            if union(u,v):
-                mst.append((u,v))
-                self.status.append(f"Chọn cạnh {u}-{v} (w={w})")
-                if self.vis:
-                    self.vis.draw(mst_edges=mst)
-        total = sum(self.G[u][v].get("weight",1.0) for u,v in mst)
-        self.status.append(f"Tổng trọng số MST = {total}")
-        if self.vis:
-            self.vis.draw(mst_edges=mst)
+        self._log("=== Kruskal (MST) ===")
+        res = self._cached(("Kruskal", None, None), lambda: mst.kruskal(self.csr, self._observer()))
+        self._log_mst(res)
+        return res
+
+    def spanning_forest(self, method="auto"):
+        """Rừng khung nhỏ nhất; method: "kruskal" / "prim" / "boruvka" / "auto" (algorithms/mst.py)"""
+        self._log(f"=== Rừng khung nhỏ nhất ({method}) ===")
+        res = mst.solve(self.csr, method, self._observer())
+        self._log_mst(res)
+        return res
+
+    def _log_mst(self, res):
+        if res["trees"] > 1:
+            self._log(f"Đồ thị không liên thông: rừng khung gồm {res['trees']} cây")
+        self._log(f"Tổng trọng số MST = {res['total']}")
+        self._draw(mst_edges=self._mst_names(res))
+
+    def _mst_names(self, res):
+        names = self.csr.names
+        return [(names[u], names[v]) for u, v, _ in res["mst"]]
 
 
     # ================== Graph Coloring ==================
-    def graph_coloring(self):
-        colors = {}
-        self.status.append("=== Graph Coloring ===")
-        for v in self.G.nodes():
-            used = {colors[n] for n in self.G.neighbors(v) if n in colors}
-            c = 1
-            while c in used:
-                c += 1
-            colors[v] = c
-            self.status.append(f"Đỉnh {v} → màu {c}")
-            if self.vis:
-                self.vis.draw(coloring=colors)
-        self.status.append(f"Số màu sử dụng: {len(set(colors.values()))}")
-        if self.vis:
-            self.vis.draw(coloring=colors)
+    def graph_coloring(self, method="auto"):
+        """method: "natural" / "largest_first" / "smallest_last" / "dsatur" / "jones_plassmann" / "auto" (algorithms/coloring.py)"""
+        self._log("=== Graph Coloring ===")
+        res = self._cached(("Graph Coloring", None, method),
+                           lambda: coloring.solve(self.csr, method, self._observer()))
+        self._log(f"Số màu sử dụng: {len(set(res['color']))}")
+        self._draw(coloring=dict(zip(self.csr.names, res["color"])))
+        return res
+
+
+    # ================== Headless ==================
+    def compute(self, algo_name, start_vertex=None, execution=None):
+        """
+        Chạy thuật toán không log, không vẽ (không cần Qt) và trả về kết quả theo tên đỉnh:
+        DFS/BFS: order (+ pred), Dijkstra/Bellman-Ford: dist, pred (+ cycle), Prim/Kruskal: mst, total,
+        Connected Components: component, Graph Coloring: color. Thiếu / sai đỉnh bắt đầu thì raise ValueError.
+        execution: "client" / "server", None = theo self.execution
+        """
+        with phase(self.profiler, f"compute:{algo_name}"):
+            return self._compute(algo_name, start_vertex, execution)
+
+    def _compute(self, algo_name, start_vertex, execution):
+        if execution is None:
+            execution = self.execution.get(algo_name, "client")
+        if execution == "server":
+            if self.server is None:
+                raise ValueError("Chưa có ServerBackend để chạy trên server")
+            return self.server.compute(algo_name, start_vertex)
+        if execution != "client":
+            raise ValueError(f"execution không hợp lệ: {execution}")
+        csr = self.csr
+        if algo_name in ("Kruskal", "Graph Coloring", "Connected Components"):
+            fn = {"Kruskal": mst.kruskal, "Graph Coloring": coloring.solve,
+                  "Connected Components": cores.connected_components}[algo_name]
+            variant = "auto" if algo_name == "Graph Coloring" else None
+            return cores.named(csr, self._cached((algo_name, None, variant), lambda: fn(csr)))
+        fn = {
+            "DFS": cores.dfs, "BFS": cores.bfs,
+            "Dijkstra": cores.dijkstra, "Bellman-Ford": bellman_ford.solve,
+            "Prim": mst.prim,
+        }.get(algo_name)
+        if fn is None:
+            raise ValueError(f"Thuật toán chưa được triển khai: {algo_name}")
+        if start_vertex not in csr.index:
+            raise ValueError(f"Không có đỉnh bắt đầu {start_vertex} trong đồ thị")
+        s = csr.index[start_vertex]
+        variant = "auto" if algo_name == "Bellman-Ford" else None
+        return cores.named(csr, self._cached((algo_name, s, variant), lambda: fn(csr, s)))
+
+
+    # ================== Sửa đồ thị ==================
+    @property
+    def version(self):
+        """Số lần đồ thị đã được sửa qua add_edge / remove_edge"""
+        return self.csr.version
+
+    def add_edge(self, u, v, w=1.0):
+        """
+        Thêm cạnh u -> v trọng số w (đỉnh chưa có thì thêm vào), cạnh đã có thì đổi trọng số.
+        Kết quả đã cache của đồ thị cũ được cập nhật dần sang đồ thị mới nếu được
+        (algorithms/incremental.py): Dijkstra / Bellman-Ford khi thêm cạnh hoặc giảm trọng số,
+        Prim / Kruskal khi thêm một cạnh. Trả về version mới.
+        """
+        old = self.csr
+        iu, iv = old.index.get(u), old.index.get(v)
+        before = back = None
+        if iu is not None and iv is not None:
+            before = old.arc_weight(iu, iv)
+            if old.directed:
+                back = old.arc_weight(iv, iu)
+        csr = old.with_edge(u, v, float(w))
+        return self._replace(csr, incremental.Edit(csr.index[u], csr.index[v], float(w), before, back))
+
+    def remove_edge(self, u, v):
+        """Bỏ cạnh u -> v (không có thì raise ValueError); kết quả cũ không dùng lại được. Trả về version mới."""
+        return self._replace(self.csr.without_edge(u, v), None)
+
+    def _replace(self, csr, edit):
+        if self.cache is not None:
+            fp = csr.fingerprint()
+            for key, res, state in self.cache.take(self.csr.fingerprint()):
+                out = incremental.update(key[1], csr, res, state, edit) if edit is not None else None
+                if out is not None:
+                    self.cache.put((fp,) + key[1:], *out)
+        # không sửa G của bên gọi (có thể là nx graph dùng chung), chỉ trỏ sang đồ thị mới
+        self.G = self.csr = csr
+        return csr.version
+
+
+    # ================== Nhiều nguồn / mọi cặp đỉnh ==================
+    def multi_source(self, algo_name, sources, processes=None):
+        """
+        Dijkstra / Bellman-Ford từ nhiều đỉnh nguồn (tên đỉnh), chia cho process pool
+        (xem algorithms/shortest_paths.py). Trả về dist / pred theo từng nguồn.
+        """
+        missing = [s for s in sources if s not in self.csr.index]
+        if missing:
+            raise ValueError(f"Không có đỉnh nguồn {missing[0]} trong đồ thị")
+        index = self.csr.index
+        res = shortest_paths.multi_source(self.csr, [index[s] for s in sources], algo_name, processes)
+        return shortest_paths.named(self.csr, res)
+
+    def all_pairs(self, method="auto", processes=None):
+        """Khoảng cách giữa mọi cặp đỉnh; method: "floyd-warshall" (dày), "johnson" (thưa), "auto" (tự chọn)"""
+        return shortest_paths.named(self.csr, shortest_paths.all_pairs(self.csr, method, processes))
 
 
     # ================== Run general ==================
-    def run(self, algo_name, start_vertex=None):
+    def run(self, algo_name, start_vertex=None, target_vertex=None):
+        with phase(self.profiler, f"run:{algo_name}"):
+            return self._run(algo_name, start_vertex, target_vertex)
+
+    def _run(self, algo_name, start_vertex, target_vertex):
+        for v in (start_vertex, target_vertex):
+            if v and v not in self.csr.index:
+                return self._log(f"Không có đỉnh {v} trong đồ thị")
         if algo_name=="DFS":
-            if not start_vertex: return self.status.append("DFS cần đỉnh bắt đầu")
-            self.dfs(start_vertex)
+            if not start_vertex: return self._log("DFS cần đỉnh bắt đầu")
+            res = self.dfs(start_vertex)
         elif algo_name=="BFS":
-            if not start_vertex: return self.status.append("BFS cần đỉnh bắt đầu")
-            self.bfs(start_vertex)
+            if not start_vertex: return self._log("BFS cần đỉnh bắt đầu")
+            res = self.bfs(start_vertex)
         elif algo_name=="Dijkstra":
-            if not start_vertex: return self.status.append("Dijkstra cần đỉnh bắt đầu")
-            self.dijkstra(start_vertex)
+            if not start_vertex: return self._log("Dijkstra cần đỉnh bắt đầu")
+            res = self.dijkstra(start_vertex)
         elif algo_name=="Bellman-Ford":
-            if not start_vertex: return self.status.append("Bellman-Ford cần đỉnh bắt đầu")
-            self.bellman_ford(start_vertex)
+            if not start_vertex: return self._log("Bellman-Ford cần đỉnh bắt đầu")
+            res = self.bellman_ford(start_vertex)
+        elif algo_name=="Shortest Path":
+            if not start_vertex or not target_vertex:
+                return self._log("Tìm đường cần đỉnh bắt đầu và đỉnh đích")
+            res = self.shortest_path(start_vertex, target_vertex)
         elif algo_name=="Prim":
-            if not start_vertex: return self.status.append("Prim cần đỉnh bắt đầu")
-            self.prim(start_vertex)
+            if not start_vertex: return self._log("Prim cần đỉnh bắt đầu")
+            res = self.prim(start_vertex)
         elif algo_name=="Kruskal":
-            self.kruskal()
+            res = self.kruskal()
         elif algo_name=="Graph Coloring":
-            self.graph_coloring()
+            res = self.graph_coloring()
         else:
-            self.status.append("Thuật toán chưa được triển khai")
+            return self._log("Thuật toán chưa được triển khai")
+        return cores.named(self.csr, res)
+
+
+    # ================== Ghi trace ==================
+    def record(self, algo_name, start_vertex=None, target_vertex=None, path=None):
+        """
+        run() và ghi lại mọi bước (algorithms/trace_log.py) để phát lại / xuất GIF, MP4 sau
+        (visualization/trace_player.py) mà không chạy lại. Không lấy kết quả từ cache (không có bước nào).
+        path: ghi ra file .atrace. Trả về (kết quả như run(), TraceLog).
+        """
+        recorder = TraceRecorder(self.csr, algo_name)
+        observer, cache = self.observer, self.cache
+        self.observer = recorder.observe if observer is None else recorder.chain(observer)
+        self.cache = None
+        try:
+            res = self.run(algo_name, start_vertex, target_vertex)
+        finally:
+            self.observer, self.cache = observer, cache
+        return res, (recorder.save(path) if path else recorder.log())
 
 
 
@@ -0,0 +1,243 @@
+# algorithms/incremental.py
+"""
+Cập nhật dần kết quả đã tính khi đồ thị được sửa một cạnh (CSRGraph.with_edge), thay vì tính
+lại cả đồ thị. edit = Edit(u, v, w, old, back) theo chỉ số trên đồ thị MỚI:
+    u, v, w : cạnh u -> v (vô hướng: u - v) sau khi sửa có trọng số w
+    old     : trọng số u -> v trước khi sửa, None = cạnh mới thêm
+    back    : (có hướng) trọng số v -> u trước khi sửa, None nếu không có
+- đường đi ngắn nhất một nguồn (Dijkstra, Bellman-Ford):
+    thêm cạnh / giảm trọng số: chỉ các đỉnh có khoảng cách giảm được xét lại — hàng đợi ưu tiên
+    bắt đầu từ đầu cạnh vừa sửa, lan ra như Dijkstra nhưng dừng ở đỉnh không giảm được nữa.
+    Lan ngược về u (có hướng) nghĩa là vừa tạo chu trình âm qua cạnh mới -> tính lại; một đỉnh
+    giảm tới n lần nghĩa là chạm chu trình âm vốn không tới được từ nguồn -> tính lại.
+    tăng trọng số: cạnh không nằm trên cây đường đi (pred) thì kết quả giữ nguyên.
+- rừng khung nhỏ nhất (Prim, Kruskal, Borůvka — cùng một rừng):
+    state = Forest: rừng có gốc (parent / trọng số cạnh lên cha) dựng một lần ở lần sửa đầu.
+    thêm cạnh u - v: khác cây thì nối hai cây; cùng cây thì cạnh nặng nhất trên đường u .. v
+    (leo từ u, v lên tới tổ tiên chung) bị thay nếu nặng hơn w. Chi phí theo độ sâu của u, v
+    chứ không theo kích thước đồ thị. Cạnh cùng trọng số có thể chọn khác lần tính lại từ đầu
+    (tổng trọng số và số cây vẫn như nhau).
+    giảm trọng số cạnh trong rừng / tăng trọng số cạnh ngoài rừng: rừng giữ nguyên.
+Trường hợp khác (xoá cạnh, tăng trọng số cạnh đang dùng, kết quả có chu trình âm...) trả về
+None: kết quả cũ bị bỏ, lần chạy sau tính lại từ đầu.
+"""
+import heapq
+from collections import namedtuple
+
+INF = float("inf")
+
+Edit = namedtuple("Edit", "u v w old back")
+
+
+def _arcs(csr, edit):
+    if csr.directed or edit.u == edit.v:
+        return [(edit.u, edit.v)]
+    return [(edit.u, edit.v), (edit.v, edit.u)]
+
+
+# ================== Đường đi ngắn nhất một nguồn ==================
+def shortest_paths(csr, res, edit, negative=False):
+    """
+    res: dist / pred (+ order của Dijkstra) từ một nguồn trên đồ thị trước khi sửa.
+    negative: kết quả của Bellman-Ford (đồ thị được có cạnh âm), False = Dijkstra
+    """
+    if res.get("negative_cycle"):
+        return None
+    arcs = _arcs(csr, edit)
+    pred = res["pred"]
+    if edit.old is not None and edit.w > edit.old:
+        if any(pred[b] == a for a, b in arcs):
+            return None
+        return res
+    if edit.w < 0 and not (negative and csr.directed):
+        return None
+    if not negative and csr.weights.min(initial=0) < 0:
+        # Dijkstra trên đồ thị có cạnh âm: kết quả cũ không phải đường ngắn nhất, không lan tiếp được
+        return None
+    n = csr.n
+    dist = res["dist"] + [INF] * (n - len(res["dist"]))
+    pred = pred + [-1] * (n - len(pred))
+    heap = []
+    for a, b in arcs:
+        nd = dist[a] + edit.w
+        if nd < dist[b]:
+            dist[b] = nd
+            pred[b] = a
+            heap.append((nd, b))
+    if not heap:
+        if len(dist) == len(res["dist"]):
+            return res
+        return dict(res, dist=dist, pred=pred)
+    heapq.heapify(heap)
+    tail = edit.u if csr.directed else -1
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    changed = set()
+    relaxed = {}
+    while heap:
+        d, x = heapq.heappop(heap)
+        if d > dist[x]:
+            continue
+        changed.add(x)
+        lo, hi = indptr[x], indptr[x + 1]
+        for y, wt in zip(indices[lo:hi].tolist(), weights[lo:hi].tolist()):
+            nd = d + wt
+            if nd < dist[y]:
+                if y == tail:
+                    return None
+                # một đỉnh giảm tới n lần: chu trình âm cũ (trước đây không tới được) vừa nối vào nguồn
+                relaxed[y] = relaxed.get(y, 0) + 1
+                if relaxed[y] >= n:
+                    return None
+                dist[y] = nd
+                pred[y] = x
+                heapq.heappush(heap, (nd, y))
+    out = dict(res, dist=dist, pred=pred)
+    if "order" in res:
+        # thứ tự chốt: đỉnh không đổi giữ thứ tự cũ, đỉnh vừa giảm chèn vào theo khoảng cách mới
+        key = dist.__getitem__
+        keep = [x for x in res["order"] if x not in changed]
+        out["order"] = list(heapq.merge(keep, sorted(changed, key=key), key=key))
+    return out
+
+
+# ================== Rừng khung nhỏ nhất ==================
+class Forest:
+    """
+    Rừng khung có gốc: parent[x] (-1 = gốc), up[x] = trọng số cạnh x - parent[x],
+    slot[(min, max)] = vị trí cạnh trong list mst của kết quả
+    """
+
+    def __init__(self, n, mst):
+        self.parent = [-1] * n
+        self.up = [0] * n
+        self.slot = {}
+        adj = {}
+        for i, (a, b, w) in enumerate(mst):
+            adj.setdefault(a, []).append((b, w))
+            adj.setdefault(b, []).append((a, w))
+            self.slot[(a, b) if a <= b else (b, a)] = i
+        seen = set()
+        for root in adj:
+            if root in seen:
+                continue
+            seen.add(root)
+            stack = [root]
+            while stack:
+                x = stack.pop()
+                for y, w in adj[x]:
+                    if y not in seen:
+                        seen.add(y)
+                        self.parent[y] = x
+                        self.up[y] = w
+                        stack.append(y)
+
+    def grow(self, n):
+        extra = n - len(self.parent)
+        self.parent += [-1] * extra
+        self.up += [0] * extra
+
+    def reroot(self, x):
+        """Đảo chiều các cạnh trên đường x -> gốc, x thành gốc cây của nó"""
+        prev, prev_w = -1, 0
+        while x != -1:
+            nxt, w = self.parent[x], self.up[x]
+            self.parent[x], self.up[x] = prev, prev_w
+            prev, prev_w = x, w
+            x = nxt
+
+    def path(self, a, b):
+        """(các đỉnh con của cạnh trên đường a .. tổ tiên chung, ... b .. tổ tiên chung), None nếu khác cây"""
+        parent = self.parent
+        pos = {}
+        side_a = []
+        x = a
+        while x != -1:
+            pos[x] = len(side_a)
+            side_a.append(x)
+            x = parent[x]
+        side_b = []
+        x = b
+        while x not in pos:
+            if x == -1:
+                return None
+            side_b.append(x)
+            x = parent[x]
+        return side_a[:pos[x]], side_b
+
+    def link(self, a, b, w):
+        """Nối cây chứa b vào a bằng cạnh a - b (a, b đang khác cây)"""
+        self.reroot(b)
+        self.parent[b] = a
+        self.up[b] = w
+
+    def cut(self, x):
+        self.parent[x] = -1
+        self.up[x] = 0
+
+
+def spanning_forest(csr, res, state, edit):
+    """Trả về (kết quả mới, Forest) hoặc None"""
+    u, v, w = edit.u, edit.v, edit.w
+    if csr.directed and edit.back is not None:
+        # cạnh bỏ hướng u - v đã có từ chiều v -> u: trọng số của nó theo cách bỏ hướng, tính lại
+        return None
+    # số đỉnh lúc tính res: trees = n - số cạnh
+    forest = state if state is not None else Forest(res["trees"] + len(res["mst"]), res["mst"])
+    forest.grow(csr.n)
+    key = (u, v) if u <= v else (v, u)
+    mst, total = res["mst"], res["total"]
+    if u == v:
+        return dict(res, trees=csr.n - len(mst)), forest
+    if edit.old is not None and key in forest.slot:
+        if w > edit.old:
+            return None
+        # cạnh trong rừng nhẹ đi: rừng giữ nguyên, chỉ đổi trọng số
+        i = forest.slot[key]
+        mst = list(mst)
+        mst[i] = (mst[i][0], mst[i][1], w)
+        child = u if forest.parent[u] == v else v
+        forest.up[child] = w
+        return dict(res, mst=mst, total=total + w - edit.old, trees=csr.n - len(mst)), forest
+    if edit.old is not None and w >= edit.old:
+        return dict(res, trees=csr.n - len(mst)), forest
+    found = forest.path(u, v)
+    mst = list(mst)
+    if found is None:
+        forest.link(u, v, w)
+        forest.slot[key] = len(mst)
+        mst.append((u, v, w))
+        return dict(res, mst=mst, total=total + w, trees=csr.n - len(mst)), forest
+    side_u, side_v = found
+    heaviest = max(side_u + side_v, key=forest.up.__getitem__)
+    if forest.up[heaviest] <= w:
+        return dict(res, trees=csr.n - len(mst)), forest
+    top = forest.parent[heaviest]
+    removed = forest.up[heaviest]
+    i = forest.slot.pop((heaviest, top) if heaviest <= top else (top, heaviest))
+    forest.cut(heaviest)
+    # đầu nào nằm dưới cạnh vừa cắt thì thành gốc của phần bị tách rồi nối sang đầu kia
+    if heaviest in side_u:
+        forest.link(v, u, w)
+    else:
+        forest.link(u, v, w)
+    forest.slot[key] = i
+    mst[i] = (u, v, w)
+    return dict(res, mst=mst, total=total + w - removed, trees=csr.n - len(mst)), forest
+
+
+UPDATERS = {
+    "Dijkstra": lambda csr, res, state, edit: _stateless(shortest_paths(csr, res, edit)),
+    "Bellman-Ford": lambda csr, res, state, edit: _stateless(shortest_paths(csr, res, edit, negative=True)),
+    "Prim": spanning_forest,
+    "Kruskal": spanning_forest,
+}
+
+
+def _stateless(res):
+    return None if res is None else (res, None)
+
+
+def update(algo_name, csr, res, state, edit):
+    """(kết quả mới, state) cho đồ thị csr sau khi sửa edit, None = không cập nhật dần được"""
+    fn = UPDATERS.get(algo_name)
+    return None if fn is None else fn(csr, res, state, edit)
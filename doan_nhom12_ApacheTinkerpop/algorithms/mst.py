@@ -0,0 +1,240 @@
+# algorithms/mst.py
+"""
+Cây khung nhỏ nhất / rừng khung nhỏ nhất (đồ thị không liên thông: mỗi thành phần một cây),
+tính trên đồ thị bỏ hướng (CSRGraph.undirected()). Cùng dạng kết quả:
+    mst   : list (u, v, w) các cạnh được chọn, theo thứ tự chọn
+    total : tổng trọng số
+    trees : số cây trong rừng (= số thành phần liên thông, kể cả đỉnh cô lập)
+- "kruskal": cạnh sắp bằng numpy argsort, union-find trên list số nguyên (union theo rank,
+             path halving, không đệ quy); dừng khi đã đủ n - 1 cạnh
+- "prim"   : heap nhị phân có chỉ mục (vị trí từng đỉnh trong heap) với decrease-key, mỗi đỉnh
+             nằm trong heap tối đa một lần thay vì một bản ghi cho mỗi cạnh; hết thành phần thì
+             bắt đầu lại từ đỉnh chưa thăm tiếp theo
+- "boruvka": numpy theo vòng: mỗi thành phần chọn cùng lúc cạnh nhẹ nhất đi ra, gộp bằng nhảy
+             con trỏ — tối đa log2(n) vòng, hợp với đồ thị lớn
+- "auto"   : boruvka khi đồ thị đủ nhiều cạnh, không thì kruskal
+Cạnh cùng trọng số được so thêm theo vị trí trong danh sách cạnh, nên ba cách cho cùng một rừng.
+"""
+import numpy as np
+
+AUTO_BORUVKA_EDGES = 500000    # ít cạnh hơn thì kruskal (vòng Python qua cạnh đã sắp vẫn nhanh)
+
+
+def _edges(csr):
+    g = csr.undirected()
+    return g, g.edge_lists()
+
+
+def _trees(n, mst):
+    return n - len(mst)
+
+
+# ================== Kruskal ==================
+def kruskal(csr, observer=None):
+    g, (src, dst, w) = _edges(csr)
+    n = g.n
+    parent = list(range(n))
+    rank = [0] * n
+    mst = []
+    total = 0
+    for k in np.argsort(g.w, kind="stable").tolist():
+        u, v = src[k], dst[k]
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        if u == v:
+            continue
+        if rank[u] < rank[v]:
+            u, v = v, u
+        parent[v] = u
+        if rank[u] == rank[v]:
+            rank[u] += 1
+        mst.append((src[k], dst[k], w[k]))
+        total += w[k]
+        if observer:
+            observer("choose_edge", src[k], dst[k], w[k])
+        if len(mst) == n - 1:
+            break
+    return {"mst": mst, "total": total, "trees": _trees(n, mst)}
+
+
+# ================== Prim ==================
+def prim(csr, s=0, observer=None):
+    """
+    Prim từ s, rồi từ các đỉnh chưa thăm theo thứ tự chỉ số (rừng khung).
+    heap / hkey: các đỉnh trong heap và khoá của chúng (hai list song song, đỡ một lần tra
+    key[heap[i]] mỗi phép so); pos[v]: vị trí của v trong heap (-1 = chưa vào, -2 = đã vào cây).
+    Khoá = hạng (trọng số, vị trí cạnh) của cạnh nhẹ nhất nối v với cây — so số nguyên thay
+    cho tuple; via[v]: ô kề của cạnh đó (đỉnh trong cây + trọng số).
+    """
+    g = csr.undirected()
+    indptr, indices, weights = g.lists()
+    n = g.n
+    rank = _arc_ranks(g)
+    owner = g.arcs()[0].tolist()
+    pos = [-1] * n
+    via = [-1] * n
+    heap = []
+    hkey = []
+    mst = []
+    total = 0
+
+    def sift_up(i, v, kv):
+        while i:
+            p = (i - 1) >> 1
+            kp = hkey[p]
+            if kp <= kv:
+                break
+            u = heap[p]
+            heap[i] = u
+            hkey[i] = kp
+            pos[u] = i
+            i = p
+        heap[i] = v
+        hkey[i] = kv
+        pos[v] = i
+
+    def sift_down(i, v, kv):
+        size = len(heap)
+        while True:
+            c = 2 * i + 1
+            if c >= size:
+                break
+            kc = hkey[c]
+            if c + 1 < size and hkey[c + 1] < kc:
+                c += 1
+                kc = hkey[c]
+            if kv <= kc:
+                break
+            u = heap[c]
+            heap[i] = u
+            hkey[i] = kc
+            pos[u] = i
+            i = c
+        heap[i] = v
+        hkey[i] = kv
+        pos[v] = i
+
+    for root in ([s] if n else []) + list(range(n)):
+        if pos[root] != -1:
+            continue
+        pos[root] = -2
+        u = root
+        while True:
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                p = pos[v]
+                if p == -2:
+                    continue
+                kv = rank[k]
+                if p == -1:
+                    via[v] = k
+                    heap.append(v)
+                    hkey.append(kv)
+                    sift_up(len(heap) - 1, v, kv)
+                elif kv < hkey[p]:
+                    via[v] = k
+                    sift_up(p, v, kv)
+            if not heap:
+                break
+            u = heap[0]
+            last = heap.pop()
+            klast = hkey.pop()
+            if heap:
+                sift_down(0, last, klast)
+            pos[u] = -2
+            k = via[u]
+            wt = weights[k]
+            mst.append((owner[k], u, wt))
+            total += wt
+            if observer:
+                observer("choose_edge", owner[k], u, wt)
+    return {"mst": mst, "total": total, "trees": _trees(n, mst)}
+
+
+def _arc_ranks(g):
+    """
+    Hạng của từng ô kề (cung) của đồ thị vô hướng g theo (trọng số, vị trí cạnh gốc trong
+    src / dst) — cùng thứ tự với argsort ổn định của kruskal
+    """
+    n = g.n
+    a, b, _ = g.arcs()
+    lo = np.minimum(a, b).astype(np.int64)
+    hi = np.maximum(a, b).astype(np.int64)
+    edge_key = g.src.astype(np.int64) * n + g.dst
+    by_key = np.argsort(edge_key)
+    eid = by_key[np.searchsorted(edge_key[by_key], lo * n + hi)]
+    edge_rank = np.empty(len(edge_key), dtype=np.int64)
+    edge_rank[np.argsort(g.w, kind="stable")] = np.arange(len(edge_key))
+    return edge_rank[eid].tolist()
+
+
+# ================== Boruvka ==================
+def boruvka(csr, observer=None):
+    """
+    Mỗi vòng: mỗi thành phần lấy cạnh đi ra có hạng (trọng số, vị trí cạnh) nhỏ nhất bằng
+    np.minimum.at; các cạnh này không tạo chu trình vì hạng khác nhau từng đôi. Gộp: thành phần
+    trỏ tới thành phần bên kia cạnh đã chọn (hai bên chọn cùng cạnh thì bên số nhỏ làm gốc),
+    rồi nhảy con trỏ tới gốc. Cạnh đã nằm trong một thành phần bị bỏ ở vòng sau.
+    """
+    g, (src_list, dst_list, w_list) = _edges(csr)
+    n = g.n
+    order = np.argsort(g.w, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    src, dst = g.src.astype(np.int64), g.dst.astype(np.int64)
+    live = np.flatnonzero(src != dst)
+    comp = np.arange(n)
+    none = len(order)
+    mst = []
+    total = 0
+    rounds = 0
+    while len(live):
+        if observer:
+            observer("round", None, None, rounds)
+        rounds += 1
+        cu, cv, r = comp[src[live]], comp[dst[live]], rank[live]
+        best = np.full(n, none, dtype=np.int64)
+        np.minimum.at(best, cu, r)
+        np.minimum.at(best, cv, r)
+        heads = np.flatnonzero(best < none)
+        chosen = order[best[heads]]
+        # nối mỗi thành phần tới thành phần bên kia cạnh nó chọn
+        a, b = comp[src[chosen]], comp[dst[chosen]]
+        other = np.where(a == heads, b, a)
+        parent = np.arange(n)
+        parent[heads] = other
+        mutual = parent[other] == heads
+        keep = heads[mutual & (heads < other)]
+        parent[keep] = keep
+        while True:
+            nxt = parent[parent]
+            if (nxt == parent).all():
+                break
+            parent = nxt
+        for k in np.unique(chosen).tolist():
+            mst.append((src_list[k], dst_list[k], w_list[k]))
+            total += w_list[k]
+            if observer:
+                observer("choose_edge", src_list[k], dst_list[k], w_list[k])
+        comp = parent[comp]
+        live = live[comp[src[live]] != comp[dst[live]]]
+    return {"mst": mst, "total": total, "trees": _trees(n, mst), "rounds": rounds}
+
+
+METHODS = {"kruskal": kruskal, "prim": prim, "boruvka": boruvka}
+
+
+def solve(csr, method="auto", observer=None):
+    """Rừng khung nhỏ nhất theo method (xem đầu file); "auto" chọn theo số cạnh"""
+    if method == "auto":
+        method = "boruvka" if csr.m >= AUTO_BORUVKA_EDGES else "kruskal"
+    fn = METHODS.get(method)
+    if fn is None:
+        raise ValueError(f"Cách tìm cây khung không hợp lệ: {method}")
+    if method == "prim":
+        return fn(csr, 0, observer)
+    return fn(csr, observer)
@@ -0,0 +1,136 @@
+# algorithms/observers.py
+"""
+Observer cho các lõi trong algorithms/cores.py.
+Observer là một callable(kind, u, v, x) với u, v là chỉ số đỉnh nguyên.
+Với luồng sự kiện (cores.dfs_events / bfs_events): pump() đẩy sự kiện vào observer,
+sample() lọc / thưa bớt sự kiện trước khi tới bên tiêu thụ.
+"""
+from itertools import islice
+
+# sự kiện chỉ cập nhật trạng thái, không ghi log / vẽ và không tính vào lấy mẫu
+SILENT = {"discover", "finish", "tree_edge", "back_edge", "forward_edge", "cross_edge", "non_tree_edge"}
+
+
+def pump(events, *observers, limit=None):
+    """Kéo tối đa limit sự kiện (None = hết) và gọi lần lượt từng observer; trả về số sự kiện"""
+    count = 0
+    for event in islice(events, limit):
+        for observer in observers:
+            observer(*event)
+        count += 1
+    return count
+
+
+def sample(events, every=1, kinds=None):
+    """Chỉ giữ sự kiện có kind trong kinds (None = mọi loại), rồi lấy 1 trên mỗi every sự kiện đó"""
+    i = 0
+    for event in events:
+        if kinds is not None and event[0] not in kinds:
+            continue
+        if i % every == 0:
+            yield event
+        i += 1
+
+
+class StepState:
+    """
+    Gộp dần các sự kiện thành trạng thái vẽ (visited / active / mst_edges / coloring)
+    theo tên đỉnh, đúng như các lần gọi GraphAnimator.draw() trước đây.
+    """
+
+    def __init__(self, names):
+        self.names = names
+        self.visited = set()
+        self.active = None
+        self.mst_edges = []
+        self.coloring = {}
+        self.kind = None
+
+    def update(self, kind, u, v, x):
+        names = self.names
+        self.kind = kind
+        if kind == "discover":
+            self.visited.add(names[u])
+        elif kind == "visit":
+            self.visited.add(names[u])
+            self.active = names[u]
+        elif kind == "settle":
+            # Dijkstra vẽ mọi đỉnh là "đã biết" như bản gốc
+            if len(self.visited) != len(names):
+                self.visited = set(names)
+            self.active = names[u]
+        elif kind == "reach":
+            self.visited.add(names[u])
+            self.active = names[u]
+        elif kind == "relax":
+            self.active = names[v]
+        elif kind == "choose_edge":
+            self.mst_edges.append((names[u], names[v]))
+        elif kind == "color":
+            self.coloring[names[u]] = x
+
+    def draw_kwargs(self):
+        kind = self.kind
+        if kind in ("visit", "settle", "reach"):
+            return {"visited": self.visited, "active": self.active}
+        if kind == "relax":
+            return {"active": self.active}
+        if kind == "choose_edge":
+            return {"mst_edges": self.mst_edges}
+        if kind == "color":
+            return {"coloring": self.coloring}
+        return None
+
+
+class TraceObserver:
+    """
+    Observer ghi log vào status (QTextEdit hoặc bất kỳ thứ gì có append) và vẽ qua vis.
+    every: chỉ ghi log / vẽ 1 trên mỗi `every` bước (lấy mẫu); trạng thái vẫn cập nhật
+    đủ nên hình vẽ luôn đúng. Dòng "Vòng lặp" luôn được ghi.
+    hook: observer khác được gọi trước với mọi sự kiện (không lấy mẫu).
+    """
+
+    def __init__(self, names, status=None, vis=None, label="", every=1, hook=None):
+        self.names = names
+        self.status = status
+        self.vis = vis
+        self.label = label
+        self.every = max(1, int(every))
+        self.state = StepState(names)
+        self.steps = 0
+        self.hook = hook
+
+    def message(self, kind, u, v, x):
+        names = self.names
+        if kind == "visit":
+            return f"{self.label} thăm: {names[u]}"
+        if kind in ("settle", "reach"):
+            return f"Chọn đỉnh {names[u]}, khoảng cách = {x}"
+        if kind == "round":
+            return f"Vòng lặp {x+1}"
+        if kind == "relax":
+            return f"  Relax {names[u]}->{names[v]}, dist={x}"
+        if kind == "choose_edge":
+            return f"Chọn cạnh {names[u]}-{names[v]} (w={x})"
+        if kind == "color":
+            return f"Đỉnh {names[u]} → màu {x}"
+        return None
+
+    def __call__(self, kind, u, v, x):
+        if self.hook is not None:
+            self.hook(kind, u, v, x)
+        self.state.update(kind, u, v, x)
+        if kind in SILENT:
+            return
+        if kind != "round":
+            self.steps += 1
+            if self.steps % self.every:
+                return
+        text = self.message(kind, u, v, x)
+        if text is not None and self.status is not None:
+            self.status.append(text)
+        if self.vis is not None:
+            kwargs = self.state.draw_kwargs()
+            if kwargs is not None:
+                self.vis.draw(**kwargs)
+
@@ -0,0 +1,80 @@
+# algorithms/result_cache.py
+"""
+Cache kết quả thuật toán (dict theo chỉ số đỉnh, như algorithms/cores.py) cho AlgorithmController.
+Khoá: (CSRGraph.fingerprint(), tên thuật toán, đỉnh nguồn hoặc None, biến thể / method) —
+chạy lại cùng thuật toán trên cùng cấu trúc đồ thị (kể cả dựng lại từ cùng file) thì lấy ngay.
+Giới hạn theo số mục (max_entries) và tổng kích thước (max_items: tổng độ dài các list / dict
+trong kết quả, xấp xỉ bộ nhớ), vượt thì bỏ mục dùng lâu nhất (LRU).
+Mỗi mục còn giữ state: dữ liệu phụ để cập nhật dần kết quả khi đồ thị được sửa
+(algorithms/incremental.py), None = chưa dựng.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_ITEMS = 20_000_000
+
+
+def _size(result):
+    return sum(len(v) for v in result.values() if isinstance(v, (list, dict)))
+
+
+class ResultCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_items=DEFAULT_MAX_ITEMS):
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self._entries = OrderedDict()      # khoá -> [kết quả, state, kích thước]
+        self._items = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Kết quả đã lưu (đánh dấu vừa dùng) hoặc None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def put(self, key, result, state=None):
+        size = _size(result)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._items -= old[2]
+            if size > self.max_items:
+                return
+            self._entries[key] = [result, state, size]
+            self._items += size
+            while len(self._entries) > self.max_entries or self._items > self.max_items:
+                _, evicted = self._entries.popitem(last=False)
+                self._items -= evicted[2]
+                self.stats["evictions"] += 1
+
+    def take(self, fingerprint):
+        """
+        Lấy ra (khoá, kết quả, state) của mọi mục thuộc đồ thị fingerprint, state được tách khỏi
+        mục (state chỉ thuộc về một đồ thị: cập nhật dần xong thì gắn vào mục của đồ thị mới).
+        """
+        with self._lock:
+            out = []
+            for key, entry in self._entries.items():
+                if key[0] == fingerprint:
+                    out.append((key, entry[0], entry[1]))
+                    entry[1] = None
+            return out
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._items = 0
+
+
+# cache dùng chung cho mọi AlgorithmController trong tiến trình (mặc định)
+SHARED = ResultCache()
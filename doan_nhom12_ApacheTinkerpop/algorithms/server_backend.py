@@ -0,0 +1,237 @@
+# algorithms/server_backend.py
+"""
+Chạy thuật toán ngay trên Gremlin Server thay vì kéo cả đồ thị về client
+(GremlinManager.get_edges) để dựng networkx / CSR:
+- DFS / BFS           : repeat() + aggregate('seen'), server chỉ trả (đỉnh, đỉnh cha)
+- Dijkstra            : g.withComputer()...shortestPath() nếu server có GraphComputer,
+                        không thì relax theo frontier (mỗi vòng server chỉ trả cạnh ra
+                        của các đỉnh vừa giảm khoảng cách)
+- Bellman-Ford        : relax theo frontier như trên, phát hiện chu trình âm
+- Connected Components: g.withComputer()...connectedComponent(), không thì BFS both()
+                        trên server cho từng thành phần
+- Graph Coloring      : tham lam theo bậc giảm dần (Welsh-Powell); bậc và danh sách láng giềng
+                        lấy về trong một traversal, màu giữ ở client (không ghi lên server)
+Kết quả cùng dạng với AlgorithmController.compute (theo id đỉnh = tên đỉnh).
+Thứ tự trong cùng một tầng BFS, thứ tự DFS và cách chọn giữa các đường / màu bằng nhau
+do server quyết định nên có thể khác chạy ở client (tập đỉnh, khoảng cách thì như nhau).
+"""
+from gremlin_python.driver.protocol import GremlinServerError
+
+SERVER_ALGORITHMS = ("DFS", "BFS", "Dijkstra", "Bellman-Ford", "Connected Components", "Graph Coloring")
+FRONTIER_CHUNK = 1000     # số đỉnh frontier tối đa mỗi request
+
+# Script theo hướng cạnh: True = có hướng (out), False = vô hướng (both).
+# 'p' đánh dấu đỉnh cha trong repeat(); aggregate('seen') chặn theo tầng (BFS),
+# aggregate(local, 'seen') không chặn (DFS)
+HAS_VERTEX_SCRIPT = "g.V(s).count()"
+BFS_SCRIPTS = {
+    True: "g.V(s).aggregate('seen')"
+          ".repeat(__.as('p').out(lbl).where(without('seen')).dedup().aggregate('seen')).emit()"
+          ".project('v','p').by(id).by(select(Pop.last, 'p').id())",
+    False: "g.V(s).aggregate('seen')"
+           ".repeat(__.as('p').both(lbl).where(without('seen')).dedup().aggregate('seen')).emit()"
+           ".project('v','p').by(id).by(select(Pop.last, 'p').id())",
+}
+DFS_SCRIPTS = {
+    True: "g.V(s).aggregate(local, 'seen')"
+          ".repeat(__.as('p').out(lbl).where(without('seen')).dedup().aggregate(local, 'seen')).emit()"
+          ".project('v','p').by(id).by(select(Pop.last, 'p').id())",
+    False: "g.V(s).aggregate(local, 'seen')"
+           ".repeat(__.as('p').both(lbl).where(without('seen')).dedup().aggregate(local, 'seen')).emit()"
+           ".project('v','p').by(id).by(select(Pop.last, 'p').id())",
+}
+# Một đường ngắn nhất tới mỗi đỉnh (có cả cạnh): v = đỉnh cuối, p = đỉnh trước cạnh cuối,
+# d = tổng trọng số cạnh trên đường (đỉnh không có property trọng số nên tính 0)
+SHORTEST_PATH_SCRIPTS = {
+    True: "g.withComputer().V(s).shortestPath()"
+          ".with(ShortestPath.edges, outE(lbl)).with(ShortestPath.distance, key)"
+          ".with(ShortestPath.includeEdges, true)"
+          ".project('v','p','d').by(tail(local).id()).by(tail(local, 3).limit(local, 1).id())"
+          ".by(unfold().coalesce(values(key), constant(0)).sum())",
+    False: "g.withComputer().V(s).shortestPath()"
+           ".with(ShortestPath.edges, bothE(lbl)).with(ShortestPath.distance, key)"
+           ".with(ShortestPath.includeEdges, true)"
+           ".project('v','p','d').by(tail(local).id()).by(tail(local, 3).limit(local, 1).id())"
+           ".by(unfold().coalesce(values(key), constant(0)).sum())",
+}
+# Cạnh kề của một lô đỉnh frontier dạng (u, v, w), u thuộc frontier
+EXPAND_SCRIPTS = {
+    True: "g.V(ids).outE(lbl).project('u','v','w').by(outV().id()).by(inV().id()).by(key)",
+    False: "g.V(ids).as('u').bothE(lbl).as('e').otherV()"
+           ".project('u','v','w').by(select('u').id()).by(id).by(select('e').values(key))",
+}
+COMPONENT_SCRIPT = (
+    "g.withComputer().V().connectedComponent().with(ConnectedComponent.edges, bothE(lbl))"
+    ".project('v','c').by(id).by(ConnectedComponent.component)"
+)
+# láng giềng của mỗi đỉnh, lặp lại theo cạnh song song (độ dài = bậc như networkx)
+ADJACENCY_SCRIPT = "g.V().project('v','n').by(id).by(both(lbl).id().fold())"
+
+
+class ServerBackend:
+    """
+    Chạy thuật toán trên dữ liệu đang nằm ở Gremlin Server (qua GremlinManager).
+    directed: duyệt theo out() hay both()
+    olap: True / False = luôn / không bao giờ dùng g.withComputer();
+          None = thử một lần, server từ chối thì chuyển sang cách OLTP và nhớ lại
+    """
+
+    def __init__(self, manager, directed=False, edge_label="edge", weight_key="weight", olap=None):
+        self.manager = manager
+        self.directed = directed
+        self.edge_label = edge_label
+        self.weight_key = weight_key
+        self.olap = olap
+
+    def _submit(self, script, bindings=None):
+        return self.manager._submit(script, bindings)
+
+    def _check_start(self, start):
+        if start is None or not self._submit(HAS_VERTEX_SCRIPT, {"s": start})[0]:
+            raise ValueError(f"Không có đỉnh bắt đầu {start} trong đồ thị")
+
+    def _olap(self, script, bindings):
+        """Chạy script withComputer(); None nếu server không có GraphComputer"""
+        if self.olap is False:
+            return None
+        try:
+            return self._submit(script, bindings)
+        except GremlinServerError:
+            if self.olap:
+                raise
+            self.olap = False
+            return None
+
+    # ================== DFS / BFS ==================
+    def _reach(self, scripts, start):
+        self._check_start(start)
+        rows = self._submit(scripts[self.directed], {"s": start, "lbl": self.edge_label})
+        order = [start]
+        pred = {}
+        for r in rows:
+            order.append(r["v"])
+            pred[r["v"]] = r["p"]
+        return order, pred
+
+    def dfs(self, start):
+        order, _ = self._reach(DFS_SCRIPTS, start)
+        return {"order": order}
+
+    def bfs(self, start):
+        order, pred = self._reach(BFS_SCRIPTS, start)
+        return {"order": order, "pred": pred}
+
+    # ================== Dijkstra / Bellman-Ford ==================
+    def _all_vertices(self):
+        return self.manager.get_vertices()
+
+    def _relax_frontier(self, start, max_rounds=None):
+        """
+        Bellman-Ford chỉ trên các đỉnh vừa giảm khoảng cách: mỗi vòng lấy cạnh kề của frontier
+        từ server. Trả về (dist, pred, số vòng, vòng thứ max_rounds còn giảm khoảng cách không).
+        Với max_rounds = số đỉnh, vòng cuối còn giảm nghĩa là có chu trình âm tới được từ start
+        (đường ngắn nhất không chu trình có tối đa n - 1 cạnh).
+        """
+        dist = {start: 0}
+        pred = {}
+        frontier = [start]
+        rounds = 0
+        script = EXPAND_SCRIPTS[self.directed]
+        while frontier:
+            if max_rounds is not None and rounds >= max_rounds:
+                return dist, pred, rounds, True
+            rounds += 1
+            improved = {}
+            for lo in range(0, len(frontier), FRONTIER_CHUNK):
+                rows = self._submit(script, {"ids": frontier[lo:lo + FRONTIER_CHUNK],
+                                             "lbl": self.edge_label, "key": self.weight_key})
+                for r in rows:
+                    u, v = r["u"], r["v"]
+                    nd = dist[u] + r.get("w", 1)
+                    if nd < dist.get(v, float("inf")):
+                        dist[v] = nd
+                        pred[v] = u
+                        improved[v] = None
+            frontier = list(improved)
+        return dist, pred, rounds, False
+
+    def dijkstra(self, start):
+        self._check_start(start)
+        dist = pred = None
+        rows = self._olap(SHORTEST_PATH_SCRIPTS[self.directed],
+                          {"s": start, "lbl": self.edge_label, "key": self.weight_key})
+        if rows is not None:
+            dist, pred = {}, {}
+            for r in rows:
+                v = r["v"]
+                if v not in dist or r["d"] < dist[v]:
+                    dist[v] = r["d"]
+                    if v != start:
+                        pred[v] = r["p"]
+        vertices = self._all_vertices()
+        if rows is None:
+            # giới hạn như Bellman-Ford: cạnh âm tạo chu trình thì frontier không bao giờ rỗng
+            dist, pred, _, negative = self._relax_frontier(start, max(len(vertices), 1))
+            if negative:
+                raise ValueError("Dijkstra: đồ thị có chu trình âm tới được từ đỉnh bắt đầu, dùng Bellman-Ford")
+        order = sorted(dist, key=dist.__getitem__)
+        inf = float("inf")
+        full = {v: dist.get(v, inf) for v in vertices}
+        return {"dist": full, "pred": pred, "order": order}
+
+    def bellman_ford(self, start):
+        self._check_start(start)
+        vertices = self._all_vertices()
+        dist, pred, rounds, negative = self._relax_frontier(start, max(len(vertices), 1))
+        inf = float("inf")
+        full = {v: dist.get(v, inf) for v in vertices}
+        return {"dist": full, "pred": pred, "rounds": rounds, "negative_cycle": negative}
+
+    # ================== Connected Components ==================
+    def connected_components(self):
+        rows = self._olap(COMPONENT_SCRIPT, {"lbl": self.edge_label})
+        label = {}
+        component = {}
+        if rows is not None:
+            for r in rows:
+                component[r["v"]] = label.setdefault(r["c"], len(label))
+            return {"component": component}
+        script = BFS_SCRIPTS[False]
+        for v in self._all_vertices():
+            if v in component:
+                continue
+            k = len(label)
+            label[v] = k
+            component[v] = k
+            for r in self._submit(script, {"s": v, "lbl": self.edge_label}):
+                component[r["v"]] = k
+        return {"component": component}
+
+    # ================== Graph Coloring ==================
+    def graph_coloring(self):
+        # bậc giảm dần, cùng bậc giữ thứ tự server trả về (sort ổn định)
+        rows = sorted(self._submit(ADJACENCY_SCRIPT, {"lbl": self.edge_label}), key=lambda r: -len(r["n"]))
+        color = {}
+        for r in rows:
+            v = r["v"]
+            used = {color.get(u) for u in r["n"] if u != v}
+            c = 1
+            while c in used:
+                c += 1
+            color[v] = c
+        return {"color": color}
+
+    # ================== Chạy theo tên ==================
+    def compute(self, algo_name, start_vertex=None):
+        """Cùng giao diện với AlgorithmController.compute; thuật toán không chạy được trên server -> ValueError"""
+        if algo_name == "Connected Components":
+            return self.connected_components()
+        if algo_name == "Graph Coloring":
+            return self.graph_coloring()
+        fn = {
+            "DFS": self.dfs, "BFS": self.bfs,
+            "Dijkstra": self.dijkstra, "Bellman-Ford": self.bellman_ford,
+        }.get(algo_name)
+        if fn is None:
+            raise ValueError(f"Thuật toán không chạy được trên server: {algo_name}")
+        return fn(start_vertex)
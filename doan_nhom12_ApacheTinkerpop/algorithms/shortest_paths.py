@@ -0,0 +1,262 @@
+# algorithms/shortest_paths.py
+"""
+Đường đi ngắn nhất từ nhiều nguồn và giữa mọi cặp đỉnh trên CSRGraph:
+- multi_source : Dijkstra (cores.dijkstra) / Bellman-Ford (bellman_ford.solve) cho từng nguồn,
+                 các nguồn chia cho một process pool. Mảng CSR và ma trận kết quả nằm trong
+                 shared memory: worker chỉ nhận tên các block nên đồ thị không bị pickle
+                 sang từng process, kết quả cũng không phải gửi ngược về
+- floyd_warshall: numpy, mỗi vòng k cập nhật cả ma trận n x n — hợp với đồ thị dày
+- johnson      : Bellman-Ford vector hoá một lần để lấy thế năng, đổi trọng số cho hết âm
+                 rồi Dijkstra từ mọi đỉnh (song song như multi_source) — hợp với đồ thị thưa
+- all_pairs    : chọn một trong hai cách trên theo mật độ / trọng số âm
+
+Kết quả dạng chỉ số nguyên (dùng named() để đổi sang tên):
+    sources : list chỉ số đỉnh nguồn, hàng i của ma trận ứng với sources[i]
+    dist    : ndarray float64 (k, n), inf = không tới được
+    pred    : ndarray int32 (k, n), -1 = không có đỉnh trước
+    negative_cycle : Bellman-Ford: ndarray bool (k,) theo từng nguồn;
+                     all-pairs: bool, True thì dist / pred không có nghĩa
+    cycle          : all-pairs: một chu trình âm (list chỉ số đỉnh, [] nếu không có)
+"""
+import os
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+from algorithms import bellman_ford, cores
+from algorithms.csr_graph import CSRGraph
+
+CHUNKS_PER_PROCESS = 4      # chia nhỏ nguồn để các process xong gần cùng lúc
+FW_MAX_VERTICES = 4000      # ma trận n x n của Floyd-Warshall: ~3 bản float64 / int32
+FW_DENSITY = 64             # auto chọn Floyd-Warshall khi n * n <= FW_DENSITY * số cạnh kề
+
+
+# ================== Shared memory ==================
+def _open_block(name):
+    try:
+        # Python >= 3.13: process chỉ gắn vào block không đăng ký với resource tracker
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedArrays:
+    """
+    Một nhóm mảng numpy đặt trong multiprocessing.shared_memory.
+    spec() là bản mô tả nhỏ (tên block, dtype, shape) gửi cho worker thay cho dữ liệu;
+    attach(spec) ở worker trả về các mảng dùng chung, không sao chép.
+    Process tạo ra phải gọi close() (giải phóng block) khi xong.
+    """
+
+    def __init__(self, arrays):
+        self._blocks = []
+        self.arrays = {}
+        self._spec = {}
+        for key, a in arrays.items():
+            a = np.ascontiguousarray(a)
+            # block 0 byte không hợp lệ
+            shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+            view = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)
+            view[...] = a
+            self._blocks.append(shm)
+            self.arrays[key] = view
+            self._spec[key] = (shm.name, a.dtype.str, a.shape)
+
+    def spec(self):
+        return dict(self._spec)
+
+    @staticmethod
+    def attach(spec):
+        """(các mảng theo key, các block phải giữ tham chiếu cho tới khi dùng xong)"""
+        arrays, blocks = {}, []
+        for key, (name, dtype, shape) in spec.items():
+            shm = _open_block(name)
+            blocks.append(shm)
+            arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        return arrays, blocks
+
+    def close(self):
+        self.arrays = {}
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_CSR_FIELDS = ("indptr", "indices", "weights", "src", "dst", "w")
+
+
+def _csr_arrays(csr):
+    return {f: getattr(csr, f) for f in _CSR_FIELDS}
+
+
+def _csr_from_arrays(arrays, n, directed):
+    # tên đỉnh là chính chỉ số: worker không cần tên thật
+    a = arrays
+    return CSRGraph(range(n), a["indptr"], a["indices"], a["weights"],
+                    a["src"], a["dst"], a["w"], directed)
+
+
+# ================== Worker ==================
+_CORES = {"Dijkstra": cores.dijkstra, "Bellman-Ford": bellman_ford.solve}
+_worker = {}
+
+
+def _init_worker(spec, n, directed, algo):
+    arrays, blocks = SharedArrays.attach(spec)
+    _worker.update(csr=_csr_from_arrays(arrays, n, directed), out=arrays,
+                   fn=_CORES[algo], blocks=blocks)
+
+
+def _run_rows(rows):
+    """Chạy lõi cho các (hàng, nguồn), ghi thẳng vào ma trận dùng chung; trả về hàng có chu trình âm"""
+    csr, out, fn = _worker["csr"], _worker["out"], _worker["fn"]
+    dist, pred = out["dist"], out["pred"]
+    negative = []
+    for row, s in rows:
+        res = fn(csr, s)
+        dist[row] = res["dist"]
+        pred[row] = res["pred"]
+        if res.get("negative_cycle"):
+            negative.append(row)
+    return negative
+
+
+def _chunks(sources, processes):
+    rows = list(enumerate(sources))
+    size = max(1, -(-len(rows) // (processes * CHUNKS_PER_PROCESS)))
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+
+# ================== Nhiều nguồn ==================
+def multi_source(csr, sources, algo="Dijkstra", processes=None):
+    """
+    Khoảng cách từ mỗi đỉnh trong sources (chỉ số) theo Dijkstra hoặc Bellman-Ford.
+    processes: số process, None = os.cpu_count(); 1 (hoặc chỉ một nguồn) thì chạy
+    ngay trong process hiện tại, không tạo pool / shared memory.
+    """
+    if algo not in _CORES:
+        raise ValueError(f"Thuật toán không hỗ trợ nhiều nguồn: {algo}")
+    sources = list(sources)
+    k, n = len(sources), csr.n
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, k))
+    negative = np.zeros(k, dtype=bool)
+    out = {"dist": np.empty((k, n), dtype=np.float64), "pred": np.empty((k, n), dtype=np.int32)}
+
+    if processes == 1:
+        _worker.update(csr=csr, out=out, fn=_CORES[algo], blocks=[])
+        try:
+            negative[_run_rows(list(enumerate(sources)))] = True
+        finally:
+            _worker.clear()
+        result = {"sources": sources, "dist": out["dist"], "pred": out["pred"]}
+    else:
+        with SharedArrays({**_csr_arrays(csr), **out}) as shared:
+            ctx = get_context()
+            with ctx.Pool(processes, _init_worker,
+                          (shared.spec(), n, csr.directed, algo)) as pool:
+                for rows in pool.imap_unordered(_run_rows, _chunks(sources, processes)):
+                    negative[rows] = True
+            # chép ra khỏi shared memory trước khi giải phóng block
+            result = {"sources": sources, "dist": shared.arrays["dist"].copy(),
+                      "pred": shared.arrays["pred"].copy()}
+    if algo == "Bellman-Ford":
+        result["negative_cycle"] = negative
+    return result
+
+
+# ================== Mọi cặp đỉnh ==================
+def floyd_warshall(csr):
+    """Floyd-Warshall vector hoá: O(n^3) phép tính nhưng chỉ n vòng lặp Python"""
+    n = csr.n
+    a, b, w = csr.arcs()
+    dist = np.full((n, n), np.inf)
+    np.fill_diagonal(dist, 0.0)
+    np.minimum.at(dist, (a, b), w)
+    pred = np.full((n, n), -1, dtype=np.int32)
+    hit = (dist[a, b] == w) & (a != b)
+    pred[a[hit], b[hit]] = a[hit]
+    via = np.empty_like(dist)
+    better = np.empty((n, n), dtype=bool)
+    for k in range(n):
+        np.add(dist[:, k, None], dist[None, k, :], out=via)
+        np.less(via, dist, out=better)
+        if not better.any():
+            continue
+        np.copyto(dist, via, where=better)
+        np.copyto(pred, np.broadcast_to(pred[k].copy(), (n, n)), where=better)
+    negative = bool((np.diagonal(dist) < 0).any())
+    # pred của Floyd-Warshall khi có chu trình âm không đáng tin: lấy chu trình từ Bellman-Ford
+    cycle = bellman_ford.potentials(csr)[1] if negative else []
+    return {"sources": list(range(n)), "dist": dist, "pred": pred,
+            "negative_cycle": negative, "cycle": cycle}
+
+
+def johnson(csr, processes=None):
+    """Johnson: thế năng Bellman-Ford, đổi trọng số cho không âm, rồi Dijkstra từ mọi đỉnh"""
+    n = csr.n
+    if not (csr.weights < 0).any():
+        h = np.zeros(n)
+        reweighted = csr
+    else:
+        h, cycle = bellman_ford.potentials(csr)
+        if h is None:
+            return {"sources": list(range(n)), "dist": None, "pred": None,
+                    "negative_cycle": True, "cycle": cycle}
+        a, b, w = csr.arcs()
+        # w + h[u] - h[v] >= 0 về lý thuyết; kẹp sai số làm tròn
+        weights = np.maximum(w + h[a] - h[b], 0.0)
+        edge_w = np.maximum(csr.w + h[csr.src] - h[csr.dst], 0.0)
+        reweighted = CSRGraph(range(n), csr.indptr, csr.indices, weights,
+                              csr.src, csr.dst, edge_w, csr.directed)
+    res = multi_source(reweighted, range(n), "Dijkstra", processes)
+    res["dist"] += h[None, :] - h[:, None]
+    res["negative_cycle"] = False
+    res["cycle"] = []
+    return res
+
+
+def all_pairs(csr, method="auto", processes=None):
+    """
+    method: "floyd-warshall" / "johnson" / "auto".
+    auto: Floyd-Warshall khi đồ thị đủ dày và đủ nhỏ để giữ vài ma trận n x n, không thì Johnson.
+    """
+    if method == "auto":
+        dense = csr.n <= FW_MAX_VERTICES and csr.n * csr.n <= FW_DENSITY * len(csr.indices)
+        method = "floyd-warshall" if dense else "johnson"
+    if method == "floyd-warshall":
+        return floyd_warshall(csr)
+    if method == "johnson":
+        return johnson(csr, processes)
+    raise ValueError(f"Cách tính mọi cặp đỉnh không hợp lệ: {method}")
+
+
+# ================== Đổi kết quả sang tên đỉnh ==================
+def named(csr, result):
+    """
+    {"dist": {nguồn: {đỉnh: khoảng cách}}, "pred": {nguồn: {đỉnh: đỉnh trước}}} theo tên đỉnh,
+    như cores.named() cho từng nguồn; negative_cycle theo nguồn (Bellman-Ford) hoặc một bool
+    """
+    names = csr.names
+    sources = [names[s] for s in result["sources"]]
+    out = {"sources": sources}
+    if result["dist"] is not None:
+        out["dist"] = {s: dict(zip(names, row)) for s, row in zip(sources, result["dist"].tolist())}
+        out["pred"] = {s: {names[i]: names[p] for i, p in enumerate(row) if p >= 0}
+                       for s, row in zip(sources, result["pred"].tolist())}
+    if "cycle" in result:
+        out["cycle"] = [names[i] for i in result["cycle"]]
+    negative = result.get("negative_cycle")
+    if isinstance(negative, np.ndarray):
+        out["negative_cycle"] = dict(zip(sources, negative.tolist()))
+    elif negative is not None:
+        out["negative_cycle"] = negative
+    return out
@@ -0,0 +1,261 @@
+# algorithms/trace_log.py
+"""
+Ghi lại một lần chạy (các sự kiện observer của algorithms/cores.py) để phát lại / xuất file
+mà không phải chạy lại thuật toán (visualization/trace_player.py).
+
+- TraceRecorder: observer ghi sự kiện vào các cột array (kind uint8, u / v int32, x float64,
+  17 byte mỗi sự kiện), mỗi sự kiện chỉ vài lần append — để bật được cho lần chạy 1M bước.
+  Các sự kiện cạnh của DFS / BFS (tree_edge, back_edge...) không được ghi.
+- TraceLog: log đã ghi, kèm tên đỉnh và danh sách cạnh nên phát lại được ở bất kỳ đâu;
+  save() ra file .atrace, TraceLog.open() đọc lại với các cột là np.memmap (chỉ đọc).
+  state_at(i) tính trạng thái vẽ sau i sự kiện bằng numpy trên các cột (không lặp từng bước).
+
+File .atrace (little-endian):
+    header (TRACE_HEADER), tên đỉnh (utf-8, ngăn bởi "\\n"), nhãn, đệm tới bội 8
+    src, dst (int32 x m), đệm — các cạnh như CSRGraph.src / dst
+    kind (uint8 x k), đệm, u (int32 x k), v (int32 x k), x (float64 x k)
+u / v = -1 và x = NaN thay cho None.
+"""
+import math
+import struct
+from array import array
+
+import numpy as np
+
+from algorithms.observers import StepState
+
+TRACE_MAGIC = b"ALGTRACE"
+TRACE_VERSION = 1
+# magic, version, flags (bit 0: có hướng), số đỉnh, số cạnh, số sự kiện, độ dài khối tên, độ dài nhãn
+TRACE_HEADER = struct.Struct("<8sIIQQQQQ")
+
+# mã sự kiện = vị trí trong KINDS (đổi thứ tự thì phải tăng TRACE_VERSION)
+KINDS = ("visit", "settle", "reach", "relax", "choose_edge", "color", "round", "discover", "finish")
+CODES = {kind: i for i, kind in enumerate(KINDS)}
+VISIT, SETTLE, REACH, RELAX, CHOOSE_EDGE, COLOR, ROUND, DISCOVER, FINISH = range(len(KINDS))
+# sự kiện được vẽ (StepState.draw_kwargs khác None) — mỗi sự kiện là một khung hình
+DRAWN = (VISIT, SETTLE, REACH, RELAX, CHOOSE_EDGE, COLOR)
+# x là số nguyên (thứ tự thăm, vòng lặp, màu)
+INT_KINDS = {VISIT, COLOR, ROUND, FINISH}
+NAN = float("nan")
+
+
+def _pad8(size):
+    return -size % 8
+
+
+class TraceRecorder:
+    """
+    Ghi lại mọi sự kiện của một lần chạy trên csr: observer là recorder.observe
+    (closure với các append đã gắn sẵn, rẻ hơn gọi method), chain() để ghép với observer khác.
+    log() trả về TraceLog trên chính bộ nhớ đã ghi, save(path) ghi ra file.
+    """
+
+    def __init__(self, csr, label=""):
+        self.csr = csr
+        self.label = label
+        self.kind = array("B")
+        self.u = array("i")
+        self.v = array("i")
+        self.x = array("d")
+        self.observe = self._observer()
+
+    def _observer(self):
+        code_of = CODES.get
+        add_kind, add_u, add_v, add_x = self.kind.append, self.u.append, self.v.append, self.x.append
+
+        def observe(kind, u, v, x):
+            code = code_of(kind)
+            if code is None:
+                return
+            add_kind(code)
+            add_u(-1 if u is None else u)
+            add_v(-1 if v is None else v)
+            add_x(NAN if x is None else x)
+        return observe
+
+    def chain(self, observer):
+        """Observer gọi recorder rồi tới observer (VD: tiến độ / huỷ của AlgorithmWorker)"""
+        observe = self.observe
+
+        def both(kind, u, v, x):
+            observe(kind, u, v, x)
+            observer(kind, u, v, x)
+        return both
+
+    def log(self):
+        csr = self.csr
+        return TraceLog(csr.names, csr.src, csr.dst, csr.directed, self.label,
+                        np.frombuffer(self.kind, dtype=np.uint8),
+                        np.frombuffer(self.u, dtype=np.int32),
+                        np.frombuffer(self.v, dtype=np.int32),
+                        np.frombuffer(self.x, dtype=np.float64))
+
+    def save(self, path):
+        log = self.log()
+        log.save(path)
+        return log
+
+
+class TraceLog:
+    """Các cột sự kiện (numpy hoặc np.memmap) cùng tên đỉnh / cạnh của đồ thị đã chạy"""
+
+    def __init__(self, names, src, dst, directed, label, kind, u, v, x):
+        self.names = list(names)
+        self.src = src
+        self.dst = dst
+        self.directed = directed
+        self.label = label
+        self.kind = kind
+        self.u = u
+        self.v = v
+        self.x = x
+
+    def __len__(self):
+        return len(self.kind)
+
+    @property
+    def n(self):
+        return len(self.names)
+
+    @property
+    def m(self):
+        return len(self.src)
+
+    # ================== Đọc / ghi file ==================
+    def save(self, path):
+        names = "\n".join(map(str, self.names)).encode("utf-8")
+        label = self.label.encode("utf-8")
+        k, m = len(self), self.m
+        with open(path, "wb") as f:
+            f.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, 1 if self.directed else 0,
+                                      self.n, m, k, len(names), len(label)))
+            f.write(names)
+            f.write(label)
+            f.write(b"\0" * _pad8(len(names) + len(label)))
+            f.write(np.asarray(self.src, dtype="<i4").tobytes())
+            f.write(np.asarray(self.dst, dtype="<i4").tobytes())
+            f.write(b"\0" * _pad8(8 * m))
+            f.write(np.asarray(self.kind, dtype="<u1").tobytes())
+            f.write(b"\0" * _pad8(k))
+            f.write(np.asarray(self.u, dtype="<i4").tobytes())
+            f.write(np.asarray(self.v, dtype="<i4").tobytes())
+            f.write(np.asarray(self.x, dtype="<f8").tobytes())
+
+    @classmethod
+    def open(cls, path, mmap=True):
+        """Đọc .atrace; mmap=True: các cột là np.memmap chỉ đọc, chỉ phần được dùng mới nạp vào bộ nhớ"""
+        with open(path, "rb") as f:
+            header = f.read(TRACE_HEADER.size)
+            if len(header) < TRACE_HEADER.size:
+                raise ValueError("File trace quá ngắn")
+            magic, version, flags, n, m, k, names_len, label_len = TRACE_HEADER.unpack(header)
+            if magic != TRACE_MAGIC or version != TRACE_VERSION:
+                raise ValueError(f"Không phải file trace (magic={magic!r}, version={version})")
+            names = f.read(names_len).decode("utf-8").split("\n") if n else []
+            label = f.read(label_len).decode("utf-8")
+        offset = TRACE_HEADER.size + names_len + label_len
+        offset += _pad8(offset)
+
+        def column(dtype, count):
+            nonlocal offset
+            size = np.dtype(dtype).itemsize * count
+            if not count:
+                arr = np.zeros(0, dtype=dtype)
+            elif mmap:
+                arr = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+            else:
+                arr = np.fromfile(path, dtype=dtype, count=count, offset=offset)
+            offset += size
+            return arr
+
+        src, dst = column("<i4", m), column("<i4", m)
+        offset += _pad8(8 * m)
+        kind = column("<u1", k)
+        offset += _pad8(k)
+        u, v, x = column("<i4", k), column("<i4", k), column("<f8", k)
+        return cls(names, src, dst, bool(flags & 1), label, kind, u, v, x)
+
+    def close(self):
+        """Bỏ các cột (memmap của TraceLog.open thì đóng file); log không dùng được nữa"""
+        columns = (self.src, self.dst, self.kind, self.u, self.v, self.x)
+        self.src = self.dst = np.zeros(0, dtype=np.int32)
+        self.kind = np.zeros(0, dtype=np.uint8)
+        self.u = self.v = np.zeros(0, dtype=np.int32)
+        self.x = np.zeros(0, dtype=np.float64)
+        for col in columns:
+            mm = getattr(col, "_mmap", None)
+            if mm is not None:
+                try:
+                    mm.close()
+                except BufferError:
+                    pass    # còn view đang dùng, đóng khi view được giải phóng
+        self.names = []
+
+    # ================== Duyệt sự kiện ==================
+    def event(self, i):
+        """Sự kiện thứ i dạng (kind, u, v, x) như observer nhận (None thay cho -1 / NaN)"""
+        code = int(self.kind[i])
+        u, v, x = int(self.u[i]), int(self.v[i]), float(self.x[i])
+        if math.isnan(x):
+            x = None
+        elif code in INT_KINDS:
+            x = int(x)
+        return KINDS[code], (None if u < 0 else u), (None if v < 0 else v), x
+
+    def events(self, start=0, stop=None):
+        """Các sự kiện [start, stop) dạng (kind, u, v, x), đọc theo khối từ các cột"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for lo in range(start, stop, 65536):
+            hi = min(stop, lo + 65536)
+            kinds = self.kind[lo:hi].tolist()
+            us, vs, xs = self.u[lo:hi].tolist(), self.v[lo:hi].tolist(), self.x[lo:hi].tolist()
+            for code, u, v, x in zip(kinds, us, vs, xs):
+                if x != x:
+                    x = None
+                elif code in INT_KINDS:
+                    x = int(x)
+                yield KINDS[code], (None if u < 0 else u), (None if v < 0 else v), x
+
+    def frames(self, every=1):
+        """Vị trí các sự kiện được vẽ (1 trên mỗi every) — mỗi vị trí là một khung hình"""
+        idx = np.flatnonzero(np.isin(self.kind, DRAWN))
+        return idx[::max(1, int(every))]
+
+    def state_at(self, step):
+        """
+        StepState sau step sự kiện đầu, tính thẳng từ các cột (không phát lại từng sự kiện):
+        cùng visited / active / mst_edges / coloring / kind như khi update() lần lượt.
+        """
+        names = self.names
+        state = StepState(names)
+        step = max(0, min(step, len(self)))
+        if not step:
+            return state
+        kind = np.asarray(self.kind[:step])
+        u = np.asarray(self.u[:step])
+        state.kind = KINDS[int(kind[-1])]
+        if (kind == SETTLE).any():
+            state.visited = set(names)
+        else:
+            mask = np.isin(kind, (VISIT, REACH, DISCOVER))
+            state.visited = {names[i] for i in np.unique(u[mask]).tolist()}
+        act = np.flatnonzero(np.isin(kind, (VISIT, SETTLE, REACH, RELAX)))
+        if len(act):
+            i = int(act[-1])
+            state.active = names[int(self.v[i] if kind[i] == RELAX else u[i])]
+        chosen = np.flatnonzero(kind == CHOOSE_EDGE)
+        if len(chosen):
+            v = np.asarray(self.v[:step])
+            state.mst_edges = [(names[a], names[b]) for a, b in zip(u[chosen].tolist(), v[chosen].tolist())]
+        colored = np.flatnonzero(kind == COLOR)
+        if len(colored):
+            # màu sau cùng của mỗi đỉnh: lần xuất hiện đầu tiên khi duyệt ngược
+            rev = colored[::-1]
+            cu, first = np.unique(u[rev], return_index=True)
+            cx = np.asarray(self.x[:step])[rev[first]].astype(np.int64)
+            # giữ thứ tự tô như update() (dict theo lần tô đầu tiên của mỗi đỉnh)
+            _, order = np.unique(u[colored], return_index=True)
+            last = dict(zip(cu.tolist(), cx.tolist()))
+            state.coloring = {names[a]: last[a] for a in u[colored[np.sort(order)]].tolist()}
+        return state
@@ -0,0 +1,62 @@
+# benchmarks/bench_async_pipeline.py
+"""
+Đo tốc độ thêm đỉnh khi pipeline request (AsyncGremlinManager) so với gọi tuần tự,
+trên Gremlin Server giả lập có độ trễ mạng cố định.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_async_pipeline --n 500 --latency 0.005
+"""
+import argparse
+import asyncio
+import time
+
+from gremlin_connection import GremlinManager, AsyncGremlinManager
+from gremlin_standin import StandInServer, StandInClient
+
+
+def make_manager(latency, pool_size=4, max_in_flight=64):
+    server = StandInServer()
+    per_client = max(1, max_in_flight // pool_size)
+    return GremlinManager(
+        pool_size=pool_size, max_in_flight=max_in_flight,
+        client_factory=lambda: StandInClient(server, latency=latency, max_workers=per_client)
+    )
+
+
+def run_sync(n, latency):
+    manager = make_manager(latency)
+    start = time.perf_counter()
+    for i in range(n):
+        manager.add_vertex(f"v{i}")
+    elapsed = time.perf_counter() - start
+    manager.close()
+    return n / elapsed
+
+
+def run_async(n, latency, concurrency):
+    manager = make_manager(latency)
+    am = AsyncGremlinManager(manager, concurrency=concurrency)
+    calls = (("add_vertex", (f"v{i}",)) for i in range(n))
+    start = time.perf_counter()
+    results = asyncio.run(am.pipeline(calls))
+    elapsed = time.perf_counter() - start
+    manager.close()
+    errors = sum(isinstance(r, Exception) for r in results)
+    return n / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    base = run_sync(args.n, args.latency)
+    print(f"tuần tự            {base:8.0f} ops/s")
+    for c in (1, 4, 16, 64):
+        ops, errors = run_async(args.n, args.latency, c)
+        print(f"pipeline c={c:<3d}     {ops:8.0f} ops/s  x{ops / base:5.1f}  lỗi={errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_bellman_ford.py
+"""
+So sánh các cách chạy Bellman-Ford (algorithms/bellman_ford.py): rounds (n-1 vòng Python),
+spfa (hàng đợi) và vectorized (numpy) trên đồ thị có hướng ngẫu nhiên 10k .. 1M cung.
+Trọng số có cạnh âm nhưng không có chu trình âm (w = gốc >= 0 + p[u] - p[v]);
+--cycle chèn thêm một chu trình âm và kiểm tra chu trình trả về có thật và âm.
+rounds chỉ chạy khi số cung <= --rounds-max (chậm nhất).
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_bellman_ford
+    python -m benchmarks.bench_bellman_ford --sizes 10000 100000 1000000 --cycle
+"""
+import argparse
+import time
+
+import numpy as np
+
+from algorithms import bellman_ford
+from algorithms.csr_graph import CSRGraph
+
+METHODS = ("rounds", "spfa", "vectorized")
+
+
+def make_csr(m, cycle, seed=42):
+    rnd = np.random.default_rng(seed)
+    n = max(2, m // 4)
+    src = rnd.integers(0, n, m)
+    dst = rnd.integers(0, n, m)
+    p = rnd.integers(0, 50, n)
+    w = rnd.integers(0, 100, m) + p[src] - p[dst]
+    if cycle:
+        # chu trình 3 đỉnh tổng trọng số -1, nối từ đỉnh 0
+        a, b, c = n // 3, n // 2, n - 1
+        src = np.concatenate([src, [0, a, b, c]])
+        dst = np.concatenate([dst, [a, b, c, a]])
+        w = np.concatenate([w, [1, 1, 1, -3]])
+    names = list(range(n))
+    return CSRGraph.from_index_arrays(names, src, dst, w.astype(float), directed=True)
+
+
+def cycle_weight(csr, cycle):
+    """Tổng trọng số chu trình (cung nhẹ nhất giữa hai đỉnh liên tiếp), None nếu thiếu cung"""
+    total = 0.0
+    for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+        nbrs = csr.neighbors(u)
+        ws = csr.weights[csr.indptr[u]:csr.indptr[u + 1]][nbrs == v]
+        if len(ws) == 0:
+            return None
+        total += ws.min()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--rounds-max", type=int, default=100000)
+    parser.add_argument("--cycle", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'số cung':>9s} {'cách':11s} {'thời gian (s)':>14s} {'khớp':>5s} {'chu trình':>10s}")
+    for m in args.sizes:
+        csr = make_csr(m, args.cycle)
+        csr.lists()
+        csr.arcs()
+        base = None
+        for method in METHODS:
+            if method == "rounds" and m > args.rounds_max:
+                continue
+            start = time.perf_counter()
+            res = bellman_ford.solve(csr, 0, method)
+            elapsed = time.perf_counter() - start
+            if res["negative_cycle"]:
+                weight = cycle_weight(csr, res["cycle"])
+                ok = weight is not None and weight < 0
+                note = f"{len(res['cycle'])} đỉnh"
+            else:
+                if base is None:
+                    base = res["dist"]
+                ok = res["dist"] == base and not args.cycle
+                note = "-"
+            print(f"{m:9d} {method:11s} {elapsed:14.3f} {'có' if ok else 'KHÔNG':>5s} {note:>10s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_bound_scripts.py
+"""
+So sánh ops/giây khi thêm đỉnh bằng script literal (f-string) và script cố định + bindings,
+chạy trên Gremlin Server giả lập trong tiến trình (gremlin_standin).
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_bound_scripts --n 5000
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from gremlin_connection import GremlinManager
+from gremlin_standin import StandInServer, StandInClient
+
+
+def literal_add_vertex(manager, v_id):
+    # cách cũ: script mới cho mỗi lần gọi -> server phải biên dịch lại
+    script = f"g.V('{v_id}').fold().coalesce(unfold(), addV('{v_id}').property(T.id, '{v_id}'))"
+    with manager.pool.connection() as conn:
+        conn.submit(script).all().result()
+
+
+def run(mode, n, threads=1, pool_size=1, latency=0.0):
+    server = StandInServer()
+    # mỗi client giả lập chỉ có một kết nối (một request tại một thời điểm)
+    manager = GremlinManager(
+        pool_size=pool_size, max_in_flight=max(threads, pool_size),
+        client_factory=lambda: StandInClient(server, latency=latency, max_workers=1)
+    )
+    if mode == "literal":
+        op = lambda i: literal_add_vertex(manager, f"v{i}")
+    else:
+        op = lambda i: manager.add_vertex(f"v{i}")
+
+    start = time.perf_counter()
+    if threads == 1:
+        for i in range(n):
+            op(i)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as ex:
+            list(ex.map(op, range(n)))
+    elapsed = time.perf_counter() - start
+    manager.close()
+    return n / elapsed, server.stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.002,
+                        help="độ trễ mạng giả lập (giây) cho phần đo pool")
+    args = parser.parse_args()
+
+    print(f"== add_vertex x{args.n}, 1 luồng ==")
+    for mode in ("literal", "bound"):
+        ops, stats = run(mode, args.n)
+        print(f"{mode:8s} {ops:10.0f} ops/s  (biên dịch {stats['compiled']}, "
+              f"cache hit {stats['cache_hits']})")
+
+    n = min(args.n, 1000)
+    print(f"== add_vertex x{n}, {args.threads} luồng, latency {args.latency * 1000:.1f} ms ==")
+    for pool_size in (1, 4, args.threads):
+        ops, _ = run("bound", n, threads=args.threads, pool_size=pool_size, latency=args.latency)
+        print(f"pool_size={pool_size:<3d} {ops:10.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
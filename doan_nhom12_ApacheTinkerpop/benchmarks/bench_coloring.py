@@ -0,0 +1,97 @@
+# benchmarks/bench_coloring.py
+"""
+Số màu và thời gian của các cách tô màu (algorithms/coloring.py) so với cores.graph_coloring
+(tham lam theo thứ tự đỉnh, thử màu 1, 2, 3... bằng set) trên ba loại đồ thị:
+- thưa   : ngẫu nhiên, bậc trung bình --degree
+- dày    : ngẫu nhiên G(n, p) với --dense-vertices đỉnh, p = --density
+- hình học: điểm ngẫu nhiên trong mặt phẳng, nối các cặp gần hơn bán kính r (nhiều tam giác,
+            khác biệt giữa các thứ tự rõ hơn)
+Mọi kết quả được kiểm tra là cách tô hợp lệ (hai đầu cạnh khác màu).
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_coloring --vertices 200000 --degree 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+from algorithms import coloring, cores
+from algorithms.csr_graph import CSRGraph
+
+
+def make_sparse(n, degree, seed=42):
+    rnd = np.random.default_rng(seed)
+    m = n * degree // 2
+    return CSRGraph.from_index_arrays(list(range(n)), rnd.integers(0, n, m), rnd.integers(0, n, m),
+                                      np.ones(m))
+
+
+def make_dense(n, p, seed=42):
+    rnd = np.random.default_rng(seed)
+    src, dst = np.triu_indices(n, 1)
+    keep = rnd.random(len(src)) < p
+    return CSRGraph.from_index_arrays(list(range(n)), src[keep], dst[keep], np.ones(keep.sum()))
+
+
+def make_geometric(n, degree, seed=42):
+    rnd = np.random.default_rng(seed)
+    xy = rnd.random((n, 2))
+    r = np.sqrt(degree / (np.pi * n))
+    # sắp theo ô lưới cạnh r: chỉ cần so với điểm trong ô bên cạnh
+    cells = max(1, int(1 / r))
+    cell = np.minimum((xy * cells).astype(np.int64), cells - 1)
+    key = cell[:, 0] * cells + cell[:, 1]
+    order = np.argsort(key, kind="stable")
+    start = np.searchsorted(key[order], np.arange(cells * cells + 1))
+    src, dst = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx_, ny_ = cell[:, 0] + dx, cell[:, 1] + dy
+            ok = (nx_ >= 0) & (nx_ < cells) & (ny_ >= 0) & (ny_ < cells)
+            nb = nx_ * cells + ny_
+            for i in np.flatnonzero(ok).tolist():
+                js = order[start[nb[i]]:start[nb[i] + 1]]
+                js = js[js > i]
+                near = js[np.hypot(*(xy[js] - xy[i]).T) < r]
+                src.extend([i] * len(near))
+                dst.extend(near.tolist())
+    return CSRGraph.from_index_arrays(list(range(n)), src, dst, np.ones(len(src)))
+
+
+def valid(csr, color):
+    color = np.asarray(color)
+    loop = csr.src == csr.dst
+    return bool((color > 0).all() and (color[csr.src[~loop]] != color[csr.dst[~loop]]).all())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=200000)
+    parser.add_argument("--degree", type=int, default=10, help="bậc trung bình")
+    parser.add_argument("--dense-vertices", type=int, default=2000)
+    parser.add_argument("--density", type=float, default=0.5)
+    args = parser.parse_args()
+
+    graphs = [
+        ("thưa", make_sparse(args.vertices, args.degree)),
+        ("dày", make_dense(args.dense_vertices, args.density)),
+        ("hình học", make_geometric(args.vertices // 4, args.degree)),
+    ]
+    methods = [("cores (cũ)", cores.graph_coloring)] + list(coloring.METHODS.items())
+    print(f"{'đồ thị':9s} {'cách':16s} {'số màu':>7s} {'thời gian (s)':>14s} {'hợp lệ':>7s}")
+    for label, csr in graphs:
+        csr.lists()
+        csr.arcs()
+        print(f"-- {label}: {csr.n} đỉnh, {csr.m} cạnh")
+        for name, fn in methods:
+            start = time.perf_counter()
+            res = fn(csr)
+            elapsed = time.perf_counter() - start
+            ok = valid(csr, res["color"])
+            print(f"{label:9s} {name:16s} {max(res['color'], default=0):7d} {elapsed:14.3f} "
+                  f"{'có' if ok else 'KHÔNG':>7s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# benchmarks/bench_csr.py
+"""
+So sánh AlgorithmController cũ (duyệt dict kề của networkx) với bản chạy trên CSRGraph:
+thời gian từng thuật toán và bộ nhớ cấu trúc đồ thị (tracemalloc).
+Log được đổ vào một sink rỗng và không vẽ, để chỉ đo phần tính toán.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_csr --vertices 20000 --edges 100000
+"""
+import argparse
+import heapq
+import random
+import time
+import tracemalloc
+from collections import deque
+
+from algorithms.csr_graph import CSRGraph
+from algorithms.gremlin_controller import AlgorithmController
+from graph.nx_builder import build_nx_graph
+
+
+class NullStatus:
+    def append(self, text):
+        pass
+
+
+# ================== Bản dict (networkx) để đối chiếu ==================
+# giữ nguyên các dòng log như controller để hai bên tốn cùng chi phí định dạng chuỗi
+STATUS = NullStatus()
+
+
+def nx_bfs(G, start):
+    visited = {start}
+    queue = deque([start])
+    while queue:
+        v = queue.popleft()
+        STATUS.append(f"BFS thăm: {v}")
+        for n in G.neighbors(v):
+            if n not in visited:
+                visited.add(n)
+                queue.append(n)
+
+
+def nx_dijkstra(G, start):
+    dist = {v: float("inf") for v in G.nodes()}
+    dist[start] = 0
+    pq = [(0, start)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        STATUS.append(f"Chọn đỉnh {u}, khoảng cách = {dist[u]}")
+        for v in G.neighbors(u):
+            w = G[u][v].get("weight", 1.0)
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                heapq.heappush(pq, (dist[v], v))
+
+
+def nx_kruskal(G):
+    parent = {v: v for v in G.nodes()}
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    edges = sorted(((u, v, G[u][v].get("weight", 1.0)) for u, v in G.edges()), key=lambda x: x[2])
+    for u, v, w in edges:
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            parent[rv] = ru
+            STATUS.append(f"Chọn cạnh {u}-{v} (w={w})")
+
+
+def nx_coloring(G):
+    colors = {}
+    for v in G.nodes():
+        used = {colors[n] for n in G.neighbors(v) if n in colors}
+        c = 1
+        while c in used:
+            c += 1
+        colors[v] = c
+        STATUS.append(f"Đỉnh {v} → màu {c}")
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def measure_memory(fn):
+    tracemalloc.start()
+    obj = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=20000)
+    parser.add_argument("--edges", type=int, default=100000)
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    names = [f"v{i}" for i in range(args.vertices)]
+    edges = [[rnd.choice(names), rnd.choice(names), rnd.randint(1, 100)] for _ in range(args.edges)]
+
+    G, nx_bytes = measure_memory(lambda: build_nx_graph(names, edges, weighted=True))
+    csr, csr_bytes = measure_memory(lambda: CSRGraph.from_networkx(G))
+    print(f"Bộ nhớ: networkx {nx_bytes / 2**20:.1f} MB, CSR {csr_bytes / 2**20:.1f} MB "
+          f"(mảng numpy {csr.nbytes / 2**20:.1f} MB)")
+
+    ctrl = AlgorithmController(csr, NullStatus())
+    ctrl.csr.lists()
+    ctrl.csr.edge_lists()
+    start = names[0]
+    rows = [
+        ("BFS", timed(nx_bfs, G, start), timed(ctrl.bfs, start)),
+        ("Dijkstra", timed(nx_dijkstra, G, start), timed(ctrl.dijkstra, start)),
+        ("Kruskal", timed(nx_kruskal, G), timed(ctrl.kruskal)),
+        ("Graph Coloring", timed(nx_coloring, G), timed(ctrl.graph_coloring, "natural")),
+    ]
+    print(f"{'thuật toán':16s} {'networkx (s)':>13s} {'CSR (s)':>10s} {'tăng tốc':>9s}")
+    for name, t_nx, t_csr in rows:
+        print(f"{name:16s} {t_nx:13.3f} {t_csr:10.3f} {t_nx / t_csr:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_headless.py
+"""
+So sánh chế độ traced (log từng bước) với chế độ headless (AlgorithmController.compute)
+trên cùng một đồ thị. Mặc định log vào list Python (chi phí log thấp nhất có thể);
+--qt log vào QTextEdit thật (nền offscreen) như trong giao diện;
+--draw vẽ thêm từng bước bằng GraphAnimator (backend Agg, delay 1 ms).
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_headless --vertices 20000 --edges 100000
+    python -m benchmarks.bench_headless --vertices 2000 --edges 10000 --qt
+    python -m benchmarks.bench_headless --vertices 100 --edges 300 --qt --draw
+"""
+import argparse
+import os
+import random
+import time
+
+from algorithms.gremlin_controller import AlgorithmController
+from graph.nx_builder import build_nx_graph
+
+ALGOS = ["DFS", "BFS", "Dijkstra", "Bellman-Ford", "Prim", "Kruskal", "Graph Coloring"]
+
+
+def make_status(use_qt):
+    if not use_qt:
+        return []
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication, QTextEdit
+    make_status.app = QApplication.instance() or QApplication([])
+    return QTextEdit()
+
+
+def make_animator(G):
+    import matplotlib
+    matplotlib.use("Agg")
+    from visualization.graph_animator import GraphAnimator
+    # delay=0 với Agg khiến plt.pause chờ vô hạn (start_event_loop(0))
+    return GraphAnimator(G, delay=0.001)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=20000)
+    parser.add_argument("--edges", type=int, default=100000)
+    parser.add_argument("--qt", action="store_true")
+    parser.add_argument("--draw", action="store_true")
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    names = [f"v{i}" for i in range(args.vertices)]
+    edges = [[rnd.choice(names), rnd.choice(names), rnd.randint(1, 100)] for _ in range(args.edges)]
+    G = build_nx_graph(names, edges, weighted=True)
+    headless = AlgorithmController(G)
+    headless.csr.lists()
+    headless.csr.edge_lists()
+    vis = make_animator(G) if args.draw else None
+
+    print(f"{'thuật toán':16s} {'traced (s)':>11s} {'headless (s)':>13s} {'tăng tốc':>9s}")
+    for algo in ALGOS:
+        traced = AlgorithmController(headless.csr, make_status(args.qt), vis)
+        start = time.perf_counter()
+        traced.run(algo, names[0])
+        t_traced = time.perf_counter() - start
+        start = time.perf_counter()
+        headless.compute(algo, names[0])
+        t_headless = time.perf_counter() - start
+        print(f"{algo:16s} {t_traced:11.3f} {t_headless:13.3f} {t_traced / t_headless:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
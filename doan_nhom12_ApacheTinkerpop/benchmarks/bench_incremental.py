@@ -0,0 +1,72 @@
+# benchmarks/bench_incremental.py
+"""
+Cache kết quả và cập nhật dần khi sửa đồ thị (algorithms/result_cache.py, algorithms/incremental.py):
+- chạy lại: cùng thuật toán trên đồ thị không đổi, lấy thẳng từ cache
+- sửa: --edits lần AlgorithmController.add_edge (cạnh ngẫu nhiên, trọng số nhỏ để hay đổi kết quả),
+  sau mỗi lần chạy lại Dijkstra / Prim / Kruskal: cập nhật dần so với tính lại từ đầu trên cùng đồ thị.
+Kết quả cập nhật dần phải cùng khoảng cách (Dijkstra) và cùng tổng trọng số (Prim / Kruskal) với tính lại.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_incremental --vertices 10000 100000 --edits 20
+"""
+import argparse
+import math
+import random
+import time
+
+from algorithms import result_cache
+from algorithms.gremlin_controller import AlgorithmController
+from graph.generators import generate
+
+ALGOS = [("Dijkstra", lambda c, s: c.dijkstra(s), "dist"),
+         ("Prim", lambda c, s: c.prim(s), "total"),
+         ("Kruskal", lambda c, s: c.kruskal(), "total")]
+
+
+def _same(a, b):
+    if isinstance(a, list):
+        return len(a) == len(b) and all(x == y or math.isclose(x, y) for x, y in zip(a, b))
+    return math.isclose(a, b)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'số đỉnh':>9s} {'thuật toán':10s} {'lần đầu (s)':>12s} {'chạy lại (s)':>13s} "
+          f"{'cập nhật (s)':>13s} {'tính lại (s)':>13s} {'khớp':>5s}")
+    for n in args.vertices:
+        csr = generate("random", n, seed=args.seed).to_csr()
+        start = csr.names[0]
+        rnd = random.Random(args.seed)
+        edits = [(rnd.choice(csr.names), rnd.choice(csr.names), float(rnd.randint(1, 5)))
+                 for _ in range(args.edits)]
+        for name, fn, field in ALGOS:
+            c = AlgorithmController(csr, cache=result_cache.ResultCache())
+            t0 = time.perf_counter()
+            fn(c, start)
+            first = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            fn(c, start)
+            again = time.perf_counter() - t0
+            inc = full = 0.0
+            ok = True
+            for u, v, w in edits:
+                t0 = time.perf_counter()
+                c.add_edge(u, v, w)
+                res = fn(c, start)
+                inc += time.perf_counter() - t0
+                t0 = time.perf_counter()
+                ref = fn(AlgorithmController(c.csr), start)
+                full += time.perf_counter() - t0
+                ok = ok and _same(res[field], ref[field])
+            k = max(1, len(edits))
+            print(f"{n:9d} {name:10s} {first:12.4f} {again:13.6f} {inc / k:13.6f} {full / k:13.4f} "
+                  f"{'có' if ok else 'KHÔNG':>5s}")
+
+
+if __name__ == "__main__":
+    main()
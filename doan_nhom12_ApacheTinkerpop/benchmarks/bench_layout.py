@@ -0,0 +1,61 @@
+# benchmarks/bench_layout.py
+"""
+Thời gian tính layout theo số đỉnh:
+- spring   : nx.spring_layout(G, seed=42) như GraphAnimator cũ (>500 đỉnh cần scipy)
+- layout   : visualization.layout.compute_layout (tự chọn đủ cặp / lưới / BFS)
+- cache    : layout_for() lần thứ hai trên cùng đồ thị (đọc .npz từ cache)
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_layout --sizes 200 1000 5000 20000 50000
+"""
+import argparse
+import random
+import tempfile
+import time
+
+import networkx as nx
+
+from visualization.layout import LayoutCache, compute_layout, layout_for
+
+
+def random_graph(n, m, seed=42):
+    rnd = random.Random(seed)
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    for _ in range(m):
+        G.add_edge(rnd.randrange(n), rnd.randrange(n))
+    return G
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 5000, 20000, 50000])
+    parser.add_argument("--spring-max", type=int, default=5000,
+                        help="bỏ qua spring_layout khi đồ thị lớn hơn (quá chậm)")
+    args = parser.parse_args()
+
+    print(f"{'đỉnh':>8s} {'spring (s)':>11s} {'layout (s)':>11s} {'cache (s)':>10s}")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LayoutCache(tmp)
+        for n in args.sizes:
+            G = random_graph(n, 2 * n)
+            spring = float("nan")
+            if n <= args.spring_max:
+                try:
+                    spring = timed(lambda: nx.spring_layout(G, seed=42))
+                except ImportError:
+                    pass   # thiếu scipy
+            t_layout = timed(lambda: compute_layout(G))
+            layout_for(G, cache)
+            t_cache = timed(lambda: layout_for(G, cache))
+            print(f"{n:8d} {spring:11.2f} {t_layout:11.2f} {t_cache:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
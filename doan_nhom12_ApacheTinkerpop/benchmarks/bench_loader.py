@@ -0,0 +1,85 @@
+# benchmarks/bench_loader.py
+"""
+Thời gian và bộ nhớ đỉnh (tracemalloc) khi nạp một file đồ thị lớn:
+- json.load + nx : cách cũ (json.load cả file, dựng nx graph rồi CSR), chưa tính ô nhập
+- stream json    : graph_loader.load_json -> CSR
+- csv            : graph_loader.load_edge_list -> CSR
+- binary         : graph_loader.load_binary (memmap) -> CSR
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_loader --vertices 100000 --edges 1000000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from algorithms.csr_graph import CSRGraph
+from graph.graph_loader import load_binary, load_edge_list, load_json, save_binary
+from graph.nx_builder import build_nx_graph
+
+
+def old_path(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    edges = [list(map(str, e)) for e in data["edges"]]
+    G = build_nx_graph(data["vertices"], edges, data["directed"], data["weighted"])
+    return CSRGraph.from_networkx(G)
+
+
+def measure(fn, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    csr = fn(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, csr
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=100000)
+    parser.add_argument("--edges", type=int, default=1000000)
+    parser.add_argument("--skip-old", action="store_true")
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    n, m = args.vertices, args.edges
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "g.json")
+        csv_path = os.path.join(tmp, "g.csv")
+        bin_path = os.path.join(tmp, "g.gbin")
+        edges = [(rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 100)) for _ in range(m)]
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write('{"name": "bench", "directed": false, "weighted": true, "vertices": [')
+            f.write(", ".join(f'"v{i}"' for i in range(n)))
+            f.write('], "edges": [')
+            f.write(", ".join(f'["v{u}", "v{v}", {w}]' for u, v, w in edges))
+            f.write("]}")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("source,target,weight\n")
+            f.writelines(f"v{u},v{v},{w}\n" for u, v, w in edges)
+        del edges
+        save_binary(bin_path, load_json(json_path))
+
+        rows = [
+            ("stream json", lambda p: load_json(p).to_csr(), json_path),
+            ("csv", lambda p: load_edge_list(p).to_csr(), csv_path),
+            ("binary", lambda p: load_binary(p).to_csr(), bin_path),
+        ]
+        if not args.skip_old:
+            rows.insert(0, ("json.load + nx", old_path, json_path))
+
+        print(f"{n} đỉnh, {m} cạnh")
+        print(f"{'cách nạp':16s} {'thời gian (s)':>14s} {'bộ nhớ đỉnh (MB)':>17s}")
+        for name, fn, path in rows:
+            elapsed, peak, csr = measure(fn, path)
+            print(f"{name:16s} {elapsed:14.2f} {peak / 2**20:17.1f}")
+
+
+if __name__ == "__main__":
+    main()
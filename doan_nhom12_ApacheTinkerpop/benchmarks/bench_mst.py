@@ -0,0 +1,79 @@
+# benchmarks/bench_mst.py
+"""
+Cây khung nhỏ nhất: các cách trong algorithms/mst.py so với cores.prim (heap lười, một bản ghi
+mỗi cạnh) và cores.kruskal trên đồ thị ngẫu nhiên vô hướng 10k .. 1M cạnh.
+Đồ thị gồm --parts thành phần rời nhau: cores.prim chỉ phủ thành phần chứa đỉnh bắt đầu,
+các cách mới trả về rừng khung (cột "cây"); tổng trọng số phải bằng rừng của cores.kruskal.
+Thêm một đồ thị có hướng cùng cỡ, một nửa số cung có thêm cung ngược với trọng số khác: đồ thị
+bỏ hướng phải lấy cung nhẹ hơn (cores.prim chỉ đi theo cung ra nên bỏ qua ở đây).
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_mst --sizes 10000 100000 1000000 --parts 3
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from algorithms import cores, mst
+from algorithms.csr_graph import CSRGraph
+
+
+def make_csr(m, parts, seed=42):
+    rnd = np.random.default_rng(seed)
+    n = max(parts, m // 5)
+    # đỉnh chia đều cho các thành phần, cạnh chỉ nối trong cùng thành phần
+    part = rnd.integers(0, parts, m)
+    size = n // parts
+    src = part * size + rnd.integers(0, size, m)
+    dst = part * size + rnd.integers(0, size, m)
+    w = rnd.integers(1, 1000, m).astype(float)
+    return CSRGraph.from_index_arrays(list(range(n)), src, dst, w, directed=False)
+
+
+def make_directed_csr(m, parts, seed=42):
+    """Như make_csr nhưng có hướng, một nửa số cung có thêm cung ngược (trọng số ngẫu nhiên khác)"""
+    g = make_csr(m, parts, seed)
+    rnd = np.random.default_rng(seed + 1)
+    back = rnd.random(g.m) < 0.5
+    src = np.concatenate([g.src, g.dst[back]])
+    dst = np.concatenate([g.dst, g.src[back]])
+    w = np.concatenate([g.w, rnd.integers(1, 1000, int(back.sum())).astype(float)])
+    return CSRGraph.from_index_arrays(g.names, src, dst, w, directed=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--parts", type=int, default=3)
+    args = parser.parse_args()
+
+    methods = [("cores.kruskal", cores.kruskal),
+               ("cores.prim", lambda csr: cores.prim(csr, 0)),
+               ("kruskal", mst.kruskal),
+               ("prim", lambda csr: mst.prim(csr, 0)),
+               ("boruvka", mst.boruvka)]
+    print(f"{'số cạnh':>9s} {'loại':8s} {'cách':14s} {'thời gian (s)':>14s} {'cạnh chọn':>10s} "
+          f"{'cây':>6s} {'khớp':>5s}")
+    for m, kind in [(m, kind) for m in args.sizes for kind in ("vô hướng", "có hướng")]:
+        csr = make_csr(m, args.parts) if kind == "vô hướng" else make_directed_csr(m, args.parts)
+        csr.lists()
+        csr.edge_lists()
+        csr.arcs()
+        ref = None
+        for name, fn in methods:
+            if csr.directed and name == "cores.prim":
+                continue
+            start = time.perf_counter()
+            res = fn(csr)
+            elapsed = time.perf_counter() - start
+            trees = res.get("trees", "-")
+            if ref is None:
+                ref = res["total"]
+            ok = "có" if math.isclose(res["total"], ref) else "KHÔNG"
+            print(f"{csr.m:9d} {kind:8s} {name:14s} {elapsed:14.3f} {len(res['mst']):10d} {trees:>6} {ok:>5s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bench_multi_source.py
+"""
+Đo algorithms/shortest_paths.py:
+- nhiều nguồn: Dijkstra / Bellman-Ford từ --sources đỉnh với 1, 2, 4, ... process
+  (tới --processes, mặc định os.cpu_count()), tăng tốc so với 1 process;
+  kết quả phải trùng với 1 process
+- mọi cặp đỉnh: Floyd-Warshall (numpy) và Johnson trên đồ thị --apsp-vertices đỉnh,
+  so khoảng cách hai cách với nhau
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_multi_source --vertices 20000 --edges 100000 --sources 256
+    python -m benchmarks.bench_multi_source --apsp-vertices 800 --apsp-edges 20000 --negative
+"""
+import argparse
+import os
+import random
+import time
+
+import numpy as np
+
+from algorithms import shortest_paths
+from algorithms.csr_graph import CSRGraph
+
+
+def make_csr(n, m, directed, negative, seed=42):
+    rnd = random.Random(seed)
+    names = [f"v{i}" for i in range(n)]
+    # trọng số âm chỉ trên cạnh i -> j với i < j (có hướng, không có chu trình âm)
+    edges = []
+    for _ in range(m):
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        w = rnd.randint(1, 100)
+        if negative and u < v and rnd.random() < 0.2:
+            w = -rnd.randint(1, 10)
+        edges.append([names[u], names[v], w])
+    return CSRGraph.from_edges(names, edges, directed, weighted=True)
+
+
+def process_counts(top):
+    counts = []
+    p = 1
+    while p < top:
+        counts.append(p)
+        p *= 2
+    return counts + [top]
+
+
+def bench_multi_source(csr, algo, k, top):
+    sources = random.Random(1).sample(range(csr.n), min(k, csr.n))
+    print(f"== {algo}: {len(sources)} nguồn, {csr.n} đỉnh, {csr.m} cạnh ==")
+    print(f"{'process':>8s} {'thời gian (s)':>14s} {'tăng tốc':>9s} {'khớp':>5s}")
+    base = None
+    for p in process_counts(top):
+        start = time.perf_counter()
+        res = shortest_paths.multi_source(csr, sources, algo, processes=p)
+        elapsed = time.perf_counter() - start
+        if base is None:
+            base, t1 = res, elapsed
+        same = np.array_equal(res["dist"], base["dist"])
+        print(f"{p:8d} {elapsed:14.3f} {t1 / elapsed:8.2f}x {'có' if same else 'KHÔNG':>5s}")
+
+
+def bench_all_pairs(csr):
+    print(f"== mọi cặp đỉnh: {csr.n} đỉnh, {csr.m} cạnh ==")
+    results = {}
+    for method in ("floyd-warshall", "johnson"):
+        start = time.perf_counter()
+        results[method] = shortest_paths.all_pairs(csr, method)
+        print(f"{method:16s} {time.perf_counter() - start:10.3f} s")
+    fw, jo = results["floyd-warshall"], results["johnson"]
+    if fw["negative_cycle"] or jo["negative_cycle"]:
+        print("chu trình âm:", fw["negative_cycle"], jo["negative_cycle"])
+        return
+    same = np.allclose(fw["dist"], jo["dist"])
+    print(f"khoảng cách khớp: {'có' if same else 'KHÔNG'}")
+    if not same:
+        raise SystemExit("Floyd-Warshall và Johnson cho kết quả khác nhau")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=20000)
+    parser.add_argument("--edges", type=int, default=100000)
+    parser.add_argument("--sources", type=int, default=256)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="số process lớn nhất (mặc định số core)")
+    parser.add_argument("--apsp-vertices", type=int, default=800)
+    parser.add_argument("--apsp-edges", type=int, default=20000)
+    parser.add_argument("--negative", action="store_true",
+                        help="thêm cạnh trọng số âm (đồ thị có hướng, không chu trình âm)")
+    args = parser.parse_args()
+
+    csr = make_csr(args.vertices, args.edges, args.negative, args.negative)
+    bench_multi_source(csr, "Dijkstra" if not args.negative else "Bellman-Ford", args.sources, args.processes)
+    bench_all_pairs(make_csr(args.apsp_vertices, args.apsp_edges, args.negative, args.negative))
+
+
+if __name__ == "__main__":
+    main()
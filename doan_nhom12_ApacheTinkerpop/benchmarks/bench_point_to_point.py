@@ -0,0 +1,89 @@
+# benchmarks/bench_point_to_point.py
+"""
+Tìm đường giữa hai đỉnh (AlgorithmController.shortest_path) so với Dijkstra chốt cả đồ thị:
+số đỉnh đã chốt và thời gian trung bình trên --pairs cặp đỉnh ngẫu nhiên.
+Đồ thị là lưới điểm ngẫu nhiên trong mặt phẳng, mỗi đỉnh nối --k đỉnh gần nhất,
+trọng số = khoảng cách Euclid x (1 + nhiễu) nên heuristic Euclid của A* là admissible.
+Mọi cách phải cho cùng độ dài đường đi với Dijkstra đầy đủ.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_point_to_point --vertices 100000 --pairs 50
+"""
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from algorithms import cores
+from algorithms.csr_graph import CSRGraph
+from algorithms.gremlin_controller import AlgorithmController
+
+
+def make_geometric(n, k, seed=42):
+    rnd = np.random.default_rng(seed)
+    xy = rnd.random((n, 2))
+    # k láng giềng gần nhất trong ô lưới xung quanh (không cần scipy)
+    cells = max(1, int(math.sqrt(n / 4)))
+    cell = np.minimum((xy * cells).astype(int), cells - 1)
+    buckets = {}
+    for i, (cx, cy) in enumerate(cell.tolist()):
+        buckets.setdefault((cx, cy), []).append(i)
+    src, dst = [], []
+    for i, (cx, cy) in enumerate(cell.tolist()):
+        near = [j for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                for j in buckets.get((cx + dx, cy + dy), ()) if j != i]
+        d = np.hypot(*(xy[near] - xy[i]).T)
+        for j in np.array(near)[np.argsort(d)[:k]].tolist():
+            src.append(i)
+            dst.append(j)
+    src, dst = np.array(src), np.array(dst)
+    w = np.hypot(*(xy[src] - xy[dst]).T) * (1 + rnd.random(len(src)))
+    names = [f"v{i}" for i in range(n)]
+    csr = CSRGraph.from_index_arrays(names, src, dst, w, directed=False)
+    return csr, {names[i]: tuple(p) for i, p in enumerate(xy.tolist())}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=100000)
+    parser.add_argument("--k", type=int, default=4, help="số láng giềng gần nhất mỗi đỉnh")
+    parser.add_argument("--pairs", type=int, default=50)
+    args = parser.parse_args()
+
+    csr, coords = make_geometric(args.vertices, args.k)
+    controller = AlgorithmController(csr)
+    csr.lists()
+    csr.reverse().lists()
+    rnd = random.Random(1)
+    pairs = [(rnd.choice(csr.names), rnd.choice(csr.names)) for _ in range(args.pairs)]
+    print(f"== {csr.n} đỉnh, {csr.m} cạnh, {len(pairs)} cặp ==")
+
+    full = []
+    start = time.perf_counter()
+    for s, t in pairs:
+        res = cores.dijkstra(csr, csr.index[s])
+        full.append((res["dist"][csr.index[t]], len(res["order"])))
+    t_full = (time.perf_counter() - start) / len(pairs)
+    settled_full = sum(n for _, n in full) / len(pairs)
+
+    print(f"{'cách':16s} {'đỉnh chốt (TB)':>15s} {'giảm':>7s} {'ms / cặp':>9s} {'khớp':>5s}")
+    print(f"{'dijkstra (đủ)':16s} {settled_full:15.0f} {1:6.1f}x {t_full * 1000:9.2f} {'-':>5s}")
+    for method in ("dijkstra", "bidirectional", "astar"):
+        settled = 0
+        same = True
+        start = time.perf_counter()
+        for (s, t), (d, _) in zip(pairs, full):
+            res = controller.shortest_path(s, t, method, coords if method == "astar" else None)
+            settled += res["settled"]
+            found = math.isclose(res["distance"], d) if d != math.inf else res["path"] == []
+            same = same and found
+        elapsed = (time.perf_counter() - start) / len(pairs)
+        settled /= len(pairs)
+        print(f"{method:16s} {settled:15.0f} {settled_full / settled:6.1f}x {elapsed * 1000:9.2f} "
+              f"{'có' if same else 'KHÔNG':>5s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_redraw.py
+"""
+Thời gian một khung hình của GraphAnimator.draw() theo kích thước đồ thị:
+- full       : cách vẽ cũ, ax.clear() rồi nx.draw_networkx toàn bộ đồ thị mỗi bước
+- incremental: GraphAnimator hiện tại, chỉ đổi màu đỉnh thay đổi rồi blit
+và theo số đỉnh đổi màu mỗi khung (đồ thị cố định) để thấy chi phí đi theo phần thay đổi.
+Dùng backend Agg (không cần màn hình), toạ độ ngẫu nhiên để không đo layout.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_redraw --sizes 100 1000 5000 --frames 20
+"""
+import argparse
+import random
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from visualization.graph_animator import GraphAnimator
+
+
+def random_graph(n, m, seed=42):
+    rnd = random.Random(seed)
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    for _ in range(m):
+        G.add_edge(rnd.randrange(n), rnd.randrange(n))
+    pos = {v: (rnd.random(), rnd.random()) for v in G.nodes()}
+    return G, pos
+
+
+def full_redraw(G, pos, ax, visited, active):
+    ax.clear()
+    colors = ["red" if n == active else "lightgreen" if n in visited else "lightgray"
+              for n in G.nodes()]
+    nx.draw_networkx(G, pos=pos, ax=ax, with_labels=True, node_color=colors, edge_color="black")
+    ax.figure.canvas.draw()
+
+
+def frame_time_full(G, pos, frames):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    visited = set()
+    start = time.perf_counter()
+    for v in range(frames):
+        visited.add(v)
+        full_redraw(G, pos, ax, visited, v)
+    elapsed = time.perf_counter() - start
+    plt.close(fig)
+    return elapsed / frames
+
+
+def frame_time_incremental(G, pos, frames, changed=1):
+    anim = GraphAnimator(G, delay=0, pos=pos)
+    anim.draw()   # khung đầu: vẽ đầy đủ và chụp nền
+    visited = set()
+    nodes = list(G.nodes())
+    start = time.perf_counter()
+    for f in range(frames):
+        visited.update(nodes[(f * changed) % len(nodes):(f * changed) % len(nodes) + changed])
+        anim.draw(visited=visited, active=nodes[f % len(nodes)])
+    elapsed = time.perf_counter() - start
+    plt.close(anim.fig)
+    return elapsed / frames
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--full-max", type=int, default=2000,
+                        help="bỏ qua cách vẽ cũ khi đồ thị lớn hơn (quá chậm)")
+    args = parser.parse_args()
+
+    print("Theo kích thước đồ thị (1 đỉnh đổi màu mỗi khung, m = 3n)")
+    print(f"{'đỉnh':>8s} {'full (ms)':>11s} {'incremental (ms)':>17s}")
+    for n in args.sizes:
+        G, pos = random_graph(n, 3 * n)
+        full = frame_time_full(G, pos, args.frames) * 1e3 if n <= args.full_max else float("nan")
+        inc = frame_time_incremental(G, pos, args.frames) * 1e3
+        print(f"{n:8d} {full:11.1f} {inc:17.1f}")
+
+    n = max(args.sizes)
+    G, pos = random_graph(n, 3 * n)
+    print(f"\nTheo số đỉnh đổi màu mỗi khung ({n} đỉnh)")
+    print(f"{'đổi':>8s} {'incremental (ms)':>17s}")
+    for changed in (1, 10, 100, 1000):
+        inc = frame_time_incremental(G, pos, args.frames, changed) * 1e3
+        print(f"{changed:8d} {inc:17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# benchmarks/bench_server_backend.py
+"""
+Kiểm tra và đo ServerBackend (algorithms/server_backend.py) trên Gremlin Server giả lập
+(gremlin_standin): chạy từng thuật toán ở client (CSR) và trên server rồi so kết quả.
+- olap : server có GraphComputer (shortestPath() / connectedComponent() qua withComputer())
+- oltp : StandInServer(computer=False), backend tự chuyển sang cách OLTP
+So sánh theo những gì không phụ thuộc thứ tự duyệt của server: tập đỉnh tới được, độ sâu BFS,
+khoảng cách, phân hoạch thành phần liên thông, tô màu hợp lệ.
+Ngoài đồ thị ngẫu nhiên (đường kính nhỏ) còn chạy một chuỗi v0 -> v1 -> ... dài --chain đỉnh:
+đường ngắn nhất đi qua mọi đỉnh, kiểm tra giới hạn số vòng relax của Bellman-Ford / Dijkstra OLTP.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_server_backend --vertices 500 --edges 1500
+    python -m benchmarks.bench_server_backend --directed --latency 0.001
+    python -m benchmarks.bench_server_backend --chain 200
+"""
+import argparse
+import random
+import time
+
+from algorithms.gremlin_controller import AlgorithmController
+from algorithms.server_backend import ServerBackend, SERVER_ALGORITHMS
+from gremlin_connection import GremlinManager
+from gremlin_standin import StandInServer, StandInClient
+from graph.nx_builder import build_nx_graph
+
+
+def make_graph(n, m, directed, negative, seed=42):
+    rnd = random.Random(seed)
+    names = [f"v{i}" for i in range(n)]
+    low = -2 if negative else 1
+    edges = [[rnd.choice(names), rnd.choice(names), rnd.randint(low, 20)] for _ in range(m)]
+    return build_nx_graph(names, edges, directed, weighted=True)
+
+
+def make_chain(n, directed):
+    names = [f"v{i}" for i in range(n)]
+    edges = [[names[i], names[i + 1], 1 + i % 3] for i in range(n - 1)]
+    return build_nx_graph(names, edges, directed, weighted=True)
+
+
+def load_server(G, computer, latency):
+    server = StandInServer(computer=computer)
+    manager = GremlinManager(client_factory=lambda: StandInClient(server, latency=latency))
+    for v in G.nodes():
+        manager.add_vertex(v)
+    for u, v, w in G.edges(data="weight"):
+        manager.add_edge(u, v, w)
+    return server, manager
+
+
+# ================== So kết quả ==================
+def _depths(order, pred):
+    depth = {order[0]: 0}
+    for v in order[1:]:
+        depth[v] = depth[pred[v]] + 1
+    return depth
+
+
+def _has_edge(G, u, v):
+    return G.has_edge(u, v)
+
+
+def check(algo, G, client, server):
+    if algo == "DFS":
+        return server["order"][0] == client["order"][0] and set(server["order"]) == set(client["order"])
+    if algo == "BFS":
+        if set(server["order"]) != set(client["order"]):
+            return False
+        if any(not _has_edge(G, p, v) for v, p in server["pred"].items()):
+            return False
+        return _depths(server["order"], server["pred"]) == _depths(client["order"], client["pred"])
+    if algo == "Dijkstra":
+        return server["dist"] == client["dist"]
+    if algo == "Bellman-Ford":
+        if server["negative_cycle"] or client.get("negative_cycle"):
+            return server["negative_cycle"] == client.get("negative_cycle")
+        return server["dist"] == client["dist"]
+    if algo == "Connected Components":
+        def groups(comp):
+            out = {}
+            for v, k in comp.items():
+                out.setdefault(k, set()).add(v)
+            return sorted(sorted(g) for g in out.values())
+        return groups(server["component"]) == groups(client["component"])
+    if algo == "Graph Coloring":
+        color = server["color"]
+        return set(color) == set(G.nodes()) and all(color[u] != color[v] for u, v in G.edges() if u != v)
+    return False
+
+
+def run(G, computer, latency, negative=False):
+    server, manager = load_server(G, computer, latency)
+    start = next(iter(G.nodes()))
+    backend = ServerBackend(manager, directed=G.is_directed())
+    controller = AlgorithmController(G, server=backend)
+    rows = []
+    for algo in SERVER_ALGORITHMS:
+        if negative and algo == "Dijkstra":
+            # trọng số âm: Dijkstra phía client (cores.dijkstra) không dừng khi có chu trình âm
+            continue
+        t0 = time.perf_counter()
+        client = controller.compute(algo, start, "client")
+        t1 = time.perf_counter()
+        before = server.stats["requests"]
+        remote = controller.compute(algo, start, "server")
+        t2 = time.perf_counter()
+        rows.append((algo, check(algo, G, client, remote), t1 - t0, t2 - t1,
+                     server.stats["requests"] - before))
+    manager.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=500)
+    parser.add_argument("--edges", type=int, default=1500)
+    parser.add_argument("--directed", action="store_true")
+    parser.add_argument("--negative", action="store_true",
+                        help="cho phép trọng số âm (Bellman-Ford, dùng với --directed; bỏ qua Dijkstra)")
+    parser.add_argument("--latency", type=float, default=0.0, help="độ trễ mạng giả lập (giây)")
+    parser.add_argument("--chain", type=int, default=50, help="số đỉnh của đồ thị chuỗi (0 = bỏ qua)")
+    args = parser.parse_args()
+
+    graphs = [("ngẫu nhiên", make_graph(args.vertices, args.edges, args.directed, args.negative), args.negative)]
+    if args.chain:
+        graphs.append(("chuỗi", make_chain(args.chain, args.directed), False))
+    ok = True
+    for kind, G, negative in graphs:
+        print(f"== {kind}: {G.number_of_nodes()} đỉnh, {G.number_of_edges()} cạnh, "
+              f"{'có hướng' if args.directed else 'vô hướng'} ==")
+        print(f"{'thuật toán':22s} {'chế độ':6s} {'khớp':>5s} {'client (s)':>11s} "
+              f"{'server (s)':>11s} {'request':>8s}")
+        for mode, computer in (("olap", True), ("oltp", False)):
+            for algo, same, t_client, t_server, requests in run(G, computer, args.latency, negative):
+                ok = ok and same
+                print(f"{algo:22s} {mode:6s} {'có' if same else 'KHÔNG':>5s} {t_client:11.4f} "
+                      f"{t_server:11.4f} {requests:8d}")
+    if not ok:
+        raise SystemExit("Kết quả server khác client")
+
+
+if __name__ == "__main__":
+    main()
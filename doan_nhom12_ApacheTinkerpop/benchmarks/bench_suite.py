@@ -0,0 +1,202 @@
+# benchmarks/bench_suite.py
+"""
+Bộ benchmark tổng: với mỗi loại đồ thị tổng hợp (graph/generators.py) và mỗi kích thước, đo
+theo giai đoạn bằng profiling.Profiler rồi ghi kết quả ra JSON để so giữa các lần chạy:
+- load:json / load:gbin : đọc file (graph_loader.load_graph) thành CSR
+- ingest:bulk_build     : GraphManager.bulk_build vào Gremlin Server giả lập trong tiến trình
+                          (gremlin_standin.py, không cần server thật) — đếm round trip
+- csr                   : dựng các mảng kề (lists / edge_lists / arcs) dùng chung cho thuật toán
+- compute:<thuật toán>  : AlgorithmController.compute (headless)
+- run:<thuật toán>      : AlgorithmController.run có log (vào list), đếm số bước theo loại sự kiện
+- draw:setup / draw     : dựng GraphAnimator (backend Agg) và từng khung hình draw()
+Giai đoạn đắt bị bỏ qua khi đồ thị lớn hơn ngưỡng --ingest-max / --traced-max / --draw-max.
+--memory ghi thêm peak bộ nhớ mỗi giai đoạn (tracemalloc, thời gian khi đó chậm hơn);
+--baseline so với file JSON của lần chạy trước, giai đoạn chậm hơn --tolerance thì báo và
+thoát với mã 1.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_suite --vertices 10000 100000 --output bench_suite.json
+    python -m benchmarks.bench_suite --graphs grid chain --vertices 10000 --memory
+    python -m benchmarks.bench_suite --vertices 10000 --baseline bench_suite.json --output new.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from algorithms.gremlin_controller import AlgorithmController
+from graph.generators import KINDS, generate
+from graph.graph_loader import load_graph, save_binary, save_json
+from graph.graph_manager import GraphManager
+from graph.nx_builder import build_nx_graph
+from gremlin_standin import StandInServer, StandInClient, StandInRemoteConnection
+from profiling import Profiler
+from visualization.graph_animator import GraphAnimator
+
+COMPUTE_ALGOS = ["DFS", "BFS", "Dijkstra", "Bellman-Ford", "Prim", "Kruskal", "Graph Coloring",
+                 "Connected Components"]
+RUN_ALGOS = ["DFS", "BFS", "Dijkstra", "Bellman-Ford", "Prim", "Kruskal", "Graph Coloring"]
+
+
+def bench_loader(data, tmp, prof):
+    json_path = os.path.join(tmp, "g.json")
+    bin_path = os.path.join(tmp, "g.gbin")
+    save_json(json_path, data)
+    save_binary(bin_path, data)
+    sizes = {}
+    for fmt, path in (("json", json_path), ("gbin", bin_path)):
+        with prof.phase(f"load:{fmt}"):
+            load_graph(path).to_csr()
+        sizes[fmt] = os.path.getsize(path)
+    return sizes
+
+
+def bench_ingest(data, prof, batch_size):
+    server = StandInServer()
+    manager = GraphManager(connection=StandInRemoteConnection(server),
+                           client_factory=lambda: StandInClient(server), profiler=prof)
+    manager.bulk_build(data.names, data.rows(), data.directed, data.weighted, batch_size)
+    manager.close()
+
+
+def bench_algorithms(data, prof, traced):
+    with prof.phase("csr"):
+        csr = data.to_csr()
+        csr.lists()
+        csr.edge_lists()
+        csr.arcs()
+    headless = AlgorithmController(csr, profiler=prof)
+    for algo in COMPUTE_ALGOS:
+        headless.compute(algo, data.start_vertex)
+    if traced:
+        for algo in RUN_ALGOS:
+            AlgorithmController(csr, status_widget=[], profiler=prof).run(algo, data.start_vertex)
+    return csr
+
+
+def bench_redraw(data, csr, prof, frames, seed=42):
+    rnd = random.Random(seed)
+    G = build_nx_graph(data.names, data.rows(), data.directed, data.weighted)
+    pos = {v: (rnd.random(), rnd.random()) for v in data.names}
+    with prof.phase("draw:setup"):
+        anim = GraphAnimator(G, delay=0, pos=pos, profiler=prof)
+        anim.draw()   # khung đầu: vẽ đầy đủ và chụp nền
+    order = AlgorithmController(csr).compute("BFS", data.start_vertex)["order"]
+    visited = set()
+    for v in order[:frames]:
+        visited.add(v)
+        anim.draw(visited=visited, active=v)
+    plt.close(anim.fig)
+
+
+def run_one(kind, n, args):
+    data = generate(kind, n, args.degree, args.directed, weighted=True, seed=args.seed)
+    prof = Profiler(memory=args.memory)
+    skipped = []
+    with tempfile.TemporaryDirectory() as tmp:
+        file_bytes = bench_loader(data, tmp, prof)
+    if data.n <= args.ingest_max:
+        bench_ingest(data, prof, args.batch_size)
+    else:
+        skipped.append("ingest")
+    traced = data.n <= args.traced_max
+    if not traced:
+        skipped.append("run")
+    csr = bench_algorithms(data, prof, traced)
+    if data.n <= args.draw_max:
+        bench_redraw(data, csr, prof, args.frames)
+    else:
+        skipped.append("draw")
+    prof.close()
+    return {"graph": kind, "vertices": data.n, "edges": data.m, "file_bytes": file_bytes,
+            "skipped": skipped, "phases": prof.report()}
+
+
+def print_run(run):
+    print(f"-- {run['graph']}: {run['vertices']} đỉnh, {run['edges']} cạnh"
+          + (f" (bỏ qua: {', '.join(run['skipped'])})" if run["skipped"] else ""))
+    for name, rec in run["phases"].items():
+        steps = sum(rec["steps"].values())
+        peak = f"{rec['peak_bytes'] / 2**20:10.1f}" if "peak_bytes" in rec else f"{'-':>10s}"
+        print(f"   {name:28s} {rec['calls']:6d} {rec['seconds']:11.3f} {steps:12d} {peak}")
+
+
+def compare(runs, baseline_path, tolerance):
+    """Các giai đoạn chậm hơn baseline quá tolerance (tỉ lệ), bỏ qua giai đoạn quá ngắn"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    old = {(r["graph"], r["vertices"]): r["phases"] for r in baseline["runs"]}
+    slower = []
+    for run in runs:
+        phases = old.get((run["graph"], run["vertices"]), {})
+        for name, rec in run["phases"].items():
+            ref = phases.get(name)
+            if ref is None or ref["seconds"] < 1e-3:
+                continue
+            ratio = rec["seconds"] / ref["seconds"]
+            if ratio > 1 + tolerance:
+                slower.append((run["graph"], run["vertices"], name, ref["seconds"], rec["seconds"], ratio))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--graphs", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--vertices", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--degree", type=int, default=3)
+    parser.add_argument("--directed", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--ingest-max", type=int, default=20000, help="số đỉnh tối đa cho ingest")
+    # server giả lập lồng một generator cho mỗi step: lô 500 cạnh (3 step / cạnh) vượt giới hạn đệ quy
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--traced-max", type=int, default=100000, help="số đỉnh tối đa cho run()")
+    parser.add_argument("--draw-max", type=int, default=5000, help="số đỉnh tối đa cho draw()")
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--memory", action="store_true", help="đo peak bộ nhớ (chậm hơn)")
+    parser.add_argument("--output", default="bench_suite.json")
+    parser.add_argument("--baseline", help="JSON của lần chạy trước để so")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    runs = []
+    print(f"   {'giai đoạn':28s} {'lần':>6s} {'giây':>11s} {'bước':>12s} {'peak (MB)':>10s}")
+    for kind in args.graphs:
+        for n in args.vertices:
+            run = run_one(kind, n, args)
+            print_run(run)
+            runs.append(run)
+
+    result = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "runs": runs,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"Đã ghi {args.output}")
+
+    if args.baseline:
+        slower = compare(runs, args.baseline, args.tolerance)
+        for kind, n, name, old, new, ratio in slower:
+            print(f"CHẬM HƠN: {kind} {n} {name}: {old:.3f}s -> {new:.3f}s ({ratio:.2f}x)")
+        if slower:
+            sys.exit(1)
+        print("Không có giai đoạn nào chậm hơn baseline")
+
+
+if __name__ == "__main__":
+    main()
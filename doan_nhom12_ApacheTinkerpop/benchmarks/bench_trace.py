@@ -0,0 +1,64 @@
+# benchmarks/bench_trace.py
+"""
+Ghi trace (algorithms/trace_log.py): chi phí ghi so với chạy headless (observer=None) và với
+một observer rỗng (chi phí tối thiểu của việc phát sự kiện), rồi ghi file, mở lại bằng
+memmap và seek tới giữa / cuối log (TraceLog.state_at).
+Đồ thị ngẫu nhiên vô hướng, --vertices đỉnh, bậc trung bình 4: BFS / Dijkstra / Kruskal
+sinh khoảng 1M sự kiện ở 500k đỉnh.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_trace --vertices 100000 500000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from algorithms import cores, mst
+from algorithms.trace_log import TraceLog, TraceRecorder
+from graph.generators import generate
+
+ALGOS = [("BFS", lambda csr, obs: cores.bfs(csr, 0, obs)),
+         ("Dijkstra", lambda csr, obs: cores.dijkstra(csr, 0, obs)),
+         ("Kruskal", lambda csr, obs: mst.kruskal(csr, obs))]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[100000, 500000])
+    args = parser.parse_args()
+
+    print(f"{'số đỉnh':>9s} {'thuật toán':10s} {'sự kiện':>9s} {'headless':>9s} {'rỗng':>8s} "
+          f"{'ghi':>8s} {'+%':>6s} {'save':>7s} {'MB':>6s} {'open':>7s} {'seek':>7s}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.atrace")
+        for n in args.vertices:
+            csr = generate("random", n, degree=4).to_csr()
+            csr.lists()
+            csr.edge_lists()
+            for name, fn in ALGOS:
+                headless = _timed(lambda: fn(csr, None))
+                empty = _timed(lambda: fn(csr, lambda kind, u, v, x: None))
+                recorder = TraceRecorder(csr, name)
+                recorded = _timed(lambda: fn(csr, recorder.observe))
+                log = recorder.log()
+                save = _timed(lambda: log.save(path))
+                t0 = time.perf_counter()
+                opened = TraceLog.open(path)
+                load = time.perf_counter() - t0
+                seek = _timed(lambda: (opened.state_at(len(log) // 2), opened.state_at(len(log))))
+                # đóng memmap trước khi lần chạy sau ghi đè path
+                opened.close()
+                extra = 100 * (recorded - empty) / empty if empty else 0.0
+                print(f"{n:9d} {name:10s} {len(log):9d} {headless:9.3f} {empty:8.3f} {recorded:8.3f} "
+                      f"{extra:6.1f} {save:7.3f} {os.path.getsize(path) / 1e6:6.1f} {load:7.4f} {seek / 2:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# benchmarks/bench_traversal.py
+"""
+Duyệt đồ thị: cores.bfs / cores.dfs và luồng sự kiện của chúng (cores.bfs_events, dfs_events).
+1. BFS trên đồ thị ngẫu nhiên đường kính nhỏ: cores.bfs (hàng đợi) so với BFS đổi hướng
+   top-down / bottom-up (frontier_bfs.direction_optimizing_bfs); level phải trùng nhau.
+2. DFS trên đường thẳng --path đỉnh (độ sâu = số đỉnh): bản đệ quy sẽ tràn stack,
+   bản dùng stack tường minh và dfs_events chạy hết.
+3. Chi phí luồng sự kiện: kéo hết dfs_events / bfs_events, qua observers.pump với bộ lọc
+   sample (chỉ giữ visit, 1 / --every sự kiện) và dừng sớm sau --limit sự kiện.
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_traversal --vertices 200000 --degree 16 --path 100000
+"""
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+
+from algorithms import cores
+from algorithms.csr_graph import CSRGraph
+from algorithms.frontier_bfs import direction_optimizing_bfs
+from algorithms.observers import pump, sample
+
+
+def make_random(n, degree, directed, seed=42):
+    rnd = np.random.default_rng(seed)
+    m = n * degree // (1 if directed else 2)
+    src, dst = rnd.integers(0, n, m), rnd.integers(0, n, m)
+    return CSRGraph.from_index_arrays(list(range(n)), src, dst, np.ones(m), directed=directed)
+
+
+def make_path(n):
+    src = np.arange(n - 1)
+    return CSRGraph.from_index_arrays(list(range(n)), src, src + 1, np.ones(n - 1), directed=False)
+
+
+def levels(csr, res, s):
+    level = [-1] * csr.n
+    level[s] = 0
+    for v in res["order"][1:]:
+        level[v] = level[res["pred"][v]] + 1
+    return level
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    res = fn(*args)
+    return res, time.perf_counter() - start
+
+
+def drain(events):
+    count = 0
+    for _ in events:
+        count += 1
+    return count
+
+
+def bench_bfs(args):
+    print("== BFS ==")
+    print(f"{'đồ thị':10s} {'cách':16s} {'thời gian (s)':>14s} {'khớp':>5s}")
+    for directed in (False, True):
+        csr = make_random(args.vertices, args.degree, directed)
+        csr.lists()
+        csr.reverse().arcs()
+        label = "có hướng" if directed else "vô hướng"
+        ref, t_ref = timed(cores.bfs, csr, 0)
+        print(f"{label:10s} {'hàng đợi':16s} {t_ref:14.3f} {'-':>5s}")
+        out, t_do = timed(direction_optimizing_bfs, csr, 0)
+        ok = out["level"] == levels(csr, ref, 0)
+        print(f"{label:10s} {'đổi hướng':16s} {t_do:14.3f} {'có' if ok else 'KHÔNG':>5s}")
+
+
+def dfs_recursive(csr, s):
+    indptr, indices, _ = csr.lists()
+    seen = [False] * csr.n
+    order = []
+
+    def go(u):
+        seen[u] = True
+        order.append(u)
+        for k in range(indptr[u], indptr[u + 1]):
+            if not seen[indices[k]]:
+                go(indices[k])
+
+    go(s)
+    return order
+
+
+def bench_deep(args):
+    print(f"== DFS trên đường thẳng {args.path} đỉnh ==")
+    csr = make_path(args.path)
+    try:
+        dfs_recursive(csr, 0)
+        print("đệ quy: chạy hết")
+    except RecursionError:
+        print("đệ quy: RecursionError")
+    res, elapsed = timed(cores.dfs, csr, 0)
+    print(f"stack tường minh: {len(res['order'])} đỉnh, {elapsed:.3f} s")
+    count, elapsed = timed(drain, cores.dfs_events(csr, 0))
+    print(f"dfs_events: {count} sự kiện, {elapsed:.3f} s")
+
+
+def bench_stream(args):
+    print("== Luồng sự kiện ==")
+    csr = make_random(args.vertices, args.degree, False)
+    csr.lists()
+    _, t_plain = timed(cores.bfs, csr, 0)
+    print(f"{'cách':34s} {'sự kiện':>10s} {'thời gian (s)':>14s}")
+    print(f"{'cores.bfs (không observer)':34s} {'-':>10s} {t_plain:14.3f}")
+    for name, gen in (("bfs_events", cores.bfs_events), ("dfs_events", cores.dfs_events)):
+        count, elapsed = timed(drain, gen(csr, 0))
+        print(f"{name + ' (kéo hết)':34s} {count:10d} {elapsed:14.3f}")
+    kept = deque(maxlen=1)
+    events = sample(cores.bfs_events(csr, 0), every=args.every, kinds={"visit"})
+    count, elapsed = timed(pump, events, lambda *e: kept.append(e))
+    print(f"{f'bfs_events, visit 1/{args.every}':34s} {count:10d} {elapsed:14.3f}")
+    count, elapsed = timed(lambda: pump(cores.bfs_events(csr, 0), lambda *e: None, limit=args.limit))
+    print(f"{f'bfs_events, dừng sau {args.limit}':34s} {count:10d} {elapsed:14.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=200000)
+    parser.add_argument("--degree", type=int, default=16, help="bậc trung bình")
+    parser.add_argument("--path", type=int, default=100000)
+    parser.add_argument("--every", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+    bench_bfs(args)
+    bench_deep(args)
+    bench_stream(args)
+
+
+if __name__ == "__main__":
+    main()
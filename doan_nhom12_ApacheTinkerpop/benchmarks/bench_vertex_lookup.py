@@ -0,0 +1,51 @@
+# benchmarks/bench_vertex_lookup.py
+"""
+Độ trễ thêm một cạnh (GraphManager.add_edge) theo số đỉnh của graph:
+- scan : backend không có index, lookup has("graph").has("id") quét toàn bộ đỉnh
+- index: backend kiểu TinkerGraph, GraphManager.ensure_index() tạo index (graph, id)
+- cache: backend không có index, dùng cache tên đỉnh -> handle phía client
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_vertex_lookup --sizes 1000 4000 16000
+"""
+import argparse
+import random
+import time
+
+from graph.graph_manager import GraphManager
+from gremlin_standin import StandInServer, StandInClient, StandInRemoteConnection
+
+
+def per_edge_latency(mode, n_vertices, n_edges):
+    server = StandInServer(backend="TinkerGraph" if mode == "index" else "none")
+    manager = GraphManager(connection=StandInRemoteConnection(server),
+                           client_factory=lambda: StandInClient(server))
+    names = [f"v{i}" for i in range(n_vertices)]
+    manager.bulk_build(names, [], batch_size=1000)
+    if mode != "cache":
+        manager._handles = {}
+
+    rnd = random.Random(42)
+    pairs = [(rnd.choice(names), rnd.choice(names)) for _ in range(n_edges)]
+    start = time.perf_counter()
+    for u, v in pairs:
+        manager.add_edge(u, v)
+    elapsed = time.perf_counter() - start
+    manager.close()
+    return elapsed / n_edges * 1e6, manager.indexed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000, 16000])
+    parser.add_argument("--edges", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'đỉnh':>8s} {'scan (µs)':>12s} {'index (µs)':>12s} {'cache (µs)':>12s}")
+    for n in args.sizes:
+        row = [per_edge_latency(mode, n, args.edges)[0] for mode in ("scan", "index", "cache")]
+        print(f"{n:8d} {row[0]:12.1f} {row[1]:12.1f} {row[2]:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
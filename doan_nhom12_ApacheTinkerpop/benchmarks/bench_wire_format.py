@@ -0,0 +1,97 @@
+# benchmarks/bench_wire_format.py
+"""
+Kích thước trên đường truyền và thời gian giải mã kết quả get_edges (project('u','v','w'))
+với GraphSON v2, GraphSON v3 và GraphBinary (gremlin_wire.py), không cần Gremlin Server:
+phản hồi được ghi sẵn một lần bằng chính bộ ghi của gremlinpython theo đúng khuôn dạng
+message server gửi về (status 200, result.data = list map {u, v, w}), rồi mỗi serializer
+giải mã lại bản ghi đó. Thời gian tính cả bước đổi sang list (u, v, w) như GremlinManager.
+"graphbinary (chung)" là bộ đọc GraphBinary tổng quát của gremlinpython (dựng dict từng cạnh).
+
+Chạy từ thư mục project:
+    python -m benchmarks.bench_wire_format --edges 100000 --repeat 3
+"""
+import argparse
+import json
+import random
+import struct
+import time
+import uuid
+
+from gremlin_python.driver import serializer
+from gremlin_python.structure.io import graphbinaryV1, graphsonV2d0, graphsonV3d0
+
+from gremlin_connection import _edge_rows
+from gremlin_wire import LeanGraphBinarySerializer, make_serializer
+
+REQUEST_ID = "41d2e28a-20a4-4ab0-b379-d810dede3786"
+
+
+def make_rows(m, seed=42):
+    rnd = random.Random(seed)
+    n = max(2, m // 5)
+    return [{"u": f"v{rnd.randrange(n)}", "v": f"v{rnd.randrange(n)}", "w": float(rnd.randint(1, 100))}
+            for _ in range(m)]
+
+
+def record_graphson(writer, rows, empty_map):
+    message = {"requestId": REQUEST_ID,
+               "status": {"message": "", "code": 200, "attributes": empty_map},
+               "result": {"data": writer.to_dict(rows), "meta": empty_map}}
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+def record_graphbinary(rows):
+    writer = graphbinaryV1.GraphBinaryWriter()
+    out = bytearray([0x81, 0x00])                   # version, requestId không null
+    out += uuid.UUID(REQUEST_ID).bytes
+    out += struct.pack(">i", 200)
+    out += b"\x01"                                  # status message = null
+    out += struct.pack(">i", 0)                     # status attributes: map rỗng
+    out += struct.pack(">i", 0)                     # result meta: map rỗng
+    writer.to_dict(rows, out)
+    return bytes(out)
+
+
+def recordings(rows):
+    return {
+        "graphson-v2": record_graphson(graphsonV2d0.GraphSONWriter(), rows, {}),
+        "graphson-v3": record_graphson(graphsonV3d0.GraphSONWriter(), rows,
+                                       {"@type": "g:Map", "@value": []}),
+        "graphbinary": record_graphbinary(rows),
+    }
+
+
+def decode(ser, payload):
+    if isinstance(ser, LeanGraphBinarySerializer):
+        # như request get_edges gửi kèm EDGE_ROWS_OPTION
+        ser.expect_edge_rows(REQUEST_ID)
+    return _edge_rows(ser.deserialize_message(payload)["result"]["data"])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--edges", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.edges)
+    expected = [(r["u"], r["v"], r["w"]) for r in rows]
+    recorded = recordings(rows)
+    cases = [(name, make_serializer(name), payload) for name, payload in recorded.items()]
+    cases.append(("graphbinary (chung)", serializer.GraphBinarySerializersV1(), recorded["graphbinary"]))
+
+    scale = 100000 / args.edges
+    print(f"== {args.edges} cạnh, số liệu quy về 100k cạnh ==")
+    print(f"{'định dạng':20s} {'byte':>12s} {'giải mã (s)':>12s} {'khớp':>5s}")
+    for name, ser, payload in cases:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            edges = decode(ser, payload)
+            best = min(best, time.perf_counter() - start)
+        ok = edges == expected
+        print(f"{name:20s} {len(payload) * scale:12,.0f} {best * scale:12.3f} {'có' if ok else 'KHÔNG':>5s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# graph/generators.py
+"""
+Đồ thị tổng hợp cho benchmark, cùng dạng GraphData như graph_loader (ghi ra file theo schema
+data/*.json bằng graph_loader.save_json). Đỉnh tên "v0", "v1", ...; có trọng số thì là số nguyên
+ngẫu nhiên 1..99. Mảng cạnh dựng bằng numpy nên tạo được đồ thị hàng triệu cạnh:
+- random    : n đỉnh, m cạnh chọn đều hai đầu mút (có thể có khuyên / cạnh lặp)
+- grid      : lưới rows x cols, mỗi ô nối ô phải và ô dưới (đường kính lớn, bậc <= 4)
+- scale_free: Barabási–Albert, mỗi đỉnh mới nối degree cạnh tới đỉnh cũ với xác suất tỉ lệ bậc
+              (vài đỉnh bậc rất lớn, như đồ thị mạng xã hội)
+- chain     : đường thẳng v0 - v1 - ... (DFS sâu nhất, BFS nhiều tầng nhất)
+
+Chạy từ thư mục project để ghi file:
+    python -m graph.generators scale_free 100000 data/sf_100k.json --degree 3 --weighted
+"""
+import argparse
+
+import numpy as np
+
+from graph.graph_loader import GraphData, save_binary, save_json
+
+
+def _data(kind, n, src, dst, directed, weighted, rng):
+    m = len(src)
+    w = rng.integers(1, 100, m).astype(np.float64) if weighted else np.ones(m)
+    return GraphData([f"v{i}" for i in range(n)], np.asarray(src, dtype=np.int64),
+                     np.asarray(dst, dtype=np.int64), w, directed, weighted, f"{kind}_{n}")
+
+
+def random_graph(n, m, directed=False, weighted=True, seed=42):
+    rng = np.random.default_rng(seed)
+    return _data("random", n, rng.integers(0, n, m), rng.integers(0, n, m), directed, weighted, rng)
+
+
+def grid_graph(rows, cols, directed=False, weighted=True, seed=42):
+    rng = np.random.default_rng(seed)
+    cell = np.arange(rows * cols).reshape(rows, cols)
+    src = np.concatenate([cell[:, :-1].ravel(), cell[:-1, :].ravel()])
+    dst = np.concatenate([cell[:, 1:].ravel(), cell[1:, :].ravel()])
+    return _data("grid", rows * cols, src, dst, directed, weighted, rng)
+
+
+def scale_free(n, degree=3, directed=False, weighted=True, seed=42):
+    """
+    Barabási–Albert theo "danh sách đầu mút": đỉnh 1..degree nối vào đỉnh 0, mỗi đỉnh t sau đó
+    thêm degree cạnh, đầu kia của mỗi cạnh là một đầu mút chọn đều trong các cạnh có trước
+    (đỉnh bậc d xuất hiện d lần nên được chọn với xác suất tỉ lệ bậc). Vị trí chọn ngẫu nhiên
+    tính trước hết bằng numpy; đầu mút được chọn có thể lại là một đầu "đã chọn" nên phân giải
+    bằng nhảy con trỏ (vài vòng) thay vì vòng Python qua từng đỉnh. Có thể có cạnh lặp.
+    """
+    rng = np.random.default_rng(seed)
+    k = max(1, int(degree))
+    if n <= k + 1:
+        return _data("scale_free", n, np.arange(1, n), np.zeros(max(0, n - 1), dtype=np.int64),
+                     directed, weighted, rng)
+    new = np.repeat(np.arange(k + 1, n), k)
+    src = np.concatenate([np.arange(1, k + 1), new])
+    m = len(src)
+    # ô 2e là đầu src của cạnh e (đã biết), ô 2e + 1 là đầu dst
+    node = np.empty(2 * m, dtype=np.int64)
+    node[0::2] = src
+    node[1:2 * k:2] = 0
+    ptr = np.arange(2 * m)
+    # cạnh của đỉnh t chọn trong các ô của mọi cạnh thêm trước đỉnh t
+    before = 2 * (k + (new - k - 1) * k)
+    ptr[2 * k + 1::2] = (rng.random(len(new)) * before).astype(np.int64)
+    while True:
+        nxt = ptr[ptr]
+        if (nxt == ptr).all():
+            break
+        ptr = nxt
+    dst = node[ptr[1::2]]
+    return _data("scale_free", n, src, dst, directed, weighted, rng)
+
+
+def chain(n, directed=False, weighted=True, seed=42):
+    rng = np.random.default_rng(seed)
+    return _data("chain", n, np.arange(n - 1), np.arange(1, n), directed, weighted, rng)
+
+
+def generate(kind, n, degree=3, directed=False, weighted=True, seed=42):
+    """
+    Đồ thị loại kind với khoảng n đỉnh (grid làm tròn thành lưới vuông);
+    degree: bậc trung bình của random (m = n * degree / 2), số cạnh mỗi đỉnh mới của scale_free
+    """
+    if kind == "random":
+        return random_graph(n, n * degree // 2, directed, weighted, seed)
+    if kind == "grid":
+        side = max(1, int(round(n ** 0.5)))
+        return grid_graph(side, side, directed, weighted, seed)
+    if kind == "scale_free":
+        return scale_free(n, degree, directed, weighted, seed)
+    if kind == "chain":
+        return chain(n, directed, weighted, seed)
+    raise ValueError(f"Loại đồ thị không hợp lệ: {kind} (chọn một trong {', '.join(KINDS)})")
+
+
+KINDS = ("random", "grid", "scale_free", "chain")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("kind", choices=KINDS)
+    parser.add_argument("vertices", type=int)
+    parser.add_argument("target", help=".json (schema data/) hoặc .gbin")
+    parser.add_argument("--degree", type=int, default=3)
+    parser.add_argument("--directed", action="store_true")
+    parser.add_argument("--weighted", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    data = generate(args.kind, args.vertices, args.degree, args.directed, args.weighted, args.seed)
+    if args.target.lower().endswith(".gbin"):
+        save_binary(args.target, data)
+    else:
+        save_json(args.target, data)
+    print(f"Đã ghi {args.target}: {data.n} đỉnh, {data.m} cạnh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+# graph/graph_loader.py
+"""
+Đọc file đồ thị thẳng vào mảng chỉ số (không qua ô nhập / json.load cả file):
+- .json : schema của data/ (name, directed, weighted, vertices, edges), đọc dần từng
+          phần tử của "vertices" / "edges" bằng JSONDecoder.raw_decode
+- .gbin : định dạng nhị phân (xem save_binary), mảng cạnh được memory-map
+- khác  : CSV / edge list, mỗi dòng "u v [w]" (.csv thì ngăn bởi dấu phẩy)
+Ghi lại: save_json (schema data/, VD đồ thị tổng hợp của graph/generators.py), save_binary.
+
+Chạy từ thư mục project để đổi sang .gbin:
+    python -m graph.graph_loader data/big.json data/big.gbin
+"""
+import argparse
+import json
+import os
+import struct
+from array import array
+
+import numpy as np
+
+from algorithms.csr_graph import CSRGraph
+
+CHUNK_SIZE = 1 << 20
+BINARY_MAGIC = b"GRAPHBIN"
+BINARY_VERSION = 1
+# magic, version, flags (bit 0: có hướng, bit 1: có trọng số), số đỉnh, số cạnh, độ dài khối tên
+BINARY_HEADER = struct.Struct("<8sIIQQQ")
+HEADER_NAMES = {"source", "src", "from", "u", "node1", "start"}
+
+
+class GraphData:
+    """Đồ thị đã đọc: tên đỉnh + mảng cạnh theo chỉ số (src[k] -> dst[k], trọng số w[k])"""
+
+    def __init__(self, names, src, dst, w, directed=False, weighted=False, name="", start_vertex=None):
+        self.names = names
+        self.src = src
+        self.dst = dst
+        self.w = w
+        self.directed = directed
+        self.weighted = weighted
+        self.name = name
+        self.start_vertex = start_vertex if start_vertex is not None else (names[0] if names else None)
+
+    @property
+    def n(self):
+        return len(self.names)
+
+    @property
+    def m(self):
+        return len(self.src)
+
+    def to_csr(self):
+        return CSRGraph.from_index_arrays(self.names, self.src, self.dst, self.w, self.directed)
+
+    def rows(self):
+        """Các dòng cạnh dạng chữ như trong ô nhập cạnh"""
+        names = self.names
+        if self.weighted:
+            for u, v, w in zip(self.src.tolist(), self.dst.tolist(), self.w.tolist()):
+                yield [names[u], names[v], f"{w:g}"]
+        else:
+            for u, v in zip(self.src.tolist(), self.dst.tolist()):
+                yield [names[u], names[v]]
+
+
+class _Builder:
+    """Gom đỉnh / cạnh vào dict tên -> chỉ số và array (không tạo list Python cho mỗi cạnh)"""
+
+    def __init__(self):
+        self.index = {}
+        self.src = array("q")
+        self.dst = array("q")
+        self.w = array("d")
+        self.first_vertex = None
+        self.listed = []            # đỉnh của danh sách "vertices" (khi đứng sau "edges")
+
+    def vertex(self, name):
+        name = str(name)
+        if self.first_vertex is None:
+            self.first_vertex = name
+        if len(self.src):
+            self.listed.append(name)
+        return self.index.setdefault(name, len(self.index))
+
+    def edge(self, u, v, w=1.0):
+        index = self.index
+        u, v = str(u), str(v)
+        self.src.append(index.setdefault(u, len(index)))
+        self.dst.append(index.setdefault(v, len(index)))
+        self.w.append(w)
+
+    def build(self, directed, weighted, name=""):
+        names = [None] * len(self.index)
+        for vname, i in self.index.items():
+            names[i] = vname
+        if self.listed:
+            # "vertices" đứng sau "edges": đánh số lại để đỉnh của danh sách lên trước,
+            # cùng thứ tự như khi dựng từ ô nhập (danh sách đỉnh rồi mới tới cạnh)
+            order = list(dict.fromkeys(self.listed))
+            listed = set(order)
+            order += [v for v in names if v not in listed]
+            perm = np.empty(len(names), dtype=np.int64)
+            perm[[self.index[v] for v in order]] = np.arange(len(order))
+            self.src = array("q", perm[np.frombuffer(self.src, dtype=np.int64)].tobytes())
+            self.dst = array("q", perm[np.frombuffer(self.dst, dtype=np.int64)].tobytes())
+            names = order
+        w = np.frombuffer(self.w, dtype=np.float64) if len(self.w) else np.zeros(0)
+        if not weighted:
+            w = np.ones(len(self.src))
+        return GraphData(
+            names,
+            np.frombuffer(self.src, dtype=np.int64) if len(self.src) else np.zeros(0, dtype=np.int64),
+            np.frombuffer(self.dst, dtype=np.int64) if len(self.dst) else np.zeros(0, dtype=np.int64),
+            w, directed, weighted, name, self.first_vertex,
+        )
+
+
+# ================== JSON đọc dần ==================
+class _JsonStream:
+    """Đọc một file JSON theo khối, giải mã từng giá trị bằng raw_decode"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError("File JSON kết thúc bất thường")
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            raise ValueError(f"JSON lỗi: cần '{ch}' ở gần ký tự {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+                # số ở cuối khối có thể bị cắt ngang: cần đọc thêm rồi giải mã lại
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                continue
+
+    def array(self, handle):
+        """Gọi handle(phần tử) cho từng phần tử của mảng, không giữ cả mảng trong bộ nhớ"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            handle(self.value())
+            ch = self.peek()
+            self.pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise ValueError(f"JSON lỗi: cần ',' hoặc ']' ở gần ký tự {self.pos}")
+
+
+def load_json(path, chunk_size=CHUNK_SIZE):
+    builder = _Builder()
+    meta = {}
+
+    def add_edge(e):
+        w = float(e[2]) if len(e) >= 3 else 1.0
+        builder.edge(e[0], e[1], w)
+
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect("{")
+        if stream.peek() != "}":
+            while True:
+                key = stream.value()
+                stream.expect(":")
+                if key == "vertices":
+                    stream.array(builder.vertex)
+                elif key == "edges":
+                    stream.array(add_edge)
+                else:
+                    meta[key] = stream.value()
+                ch = stream.peek()
+                stream.pos += 1
+                if ch == "}":
+                    break
+                if ch != ",":
+                    raise ValueError(f"JSON lỗi: cần ',' hoặc '}}' ở gần ký tự {stream.pos}")
+    return builder.build(bool(meta.get("directed", False)), bool(meta.get("weighted", False)),
+                         meta.get("name", os.path.basename(path)))
+
+
+# ================== Ghi JSON ==================
+def _json_number(w):
+    return str(int(w)) if w.is_integer() else repr(w)
+
+
+def save_json(path, data, chunk_size=100000):
+    """
+    Ghi GraphData theo schema của data/ (mỗi cạnh [u, v] hoặc [u, v, w]), ghi dần theo khối
+    chunk_size cạnh để không dựng cả chuỗi JSON của đồ thị lớn trong bộ nhớ
+    """
+    names = [json.dumps(v, ensure_ascii=False) for v in data.names]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(f'  "name": {json.dumps(data.name, ensure_ascii=False)},\n')
+        f.write(f'  "directed": {json.dumps(bool(data.directed))},\n')
+        f.write(f'  "weighted": {json.dumps(bool(data.weighted))},\n')
+        f.write(f'  "vertices": [{", ".join(names)}],\n')
+        f.write('  "edges": [')
+        for i in range(0, data.m, chunk_size):
+            src = np.asarray(data.src[i:i + chunk_size]).tolist()
+            dst = np.asarray(data.dst[i:i + chunk_size]).tolist()
+            if data.weighted:
+                w = np.asarray(data.w[i:i + chunk_size], dtype=float).tolist()
+                rows = [f"[{names[u]}, {names[v]}, {_json_number(x)}]" for u, v, x in zip(src, dst, w)]
+            else:
+                rows = [f"[{names[u]}, {names[v]}]" for u, v in zip(src, dst)]
+            f.write(",\n    " if i else "\n    ")
+            f.write(",\n    ".join(rows))
+        f.write("\n  ]\n}\n" if data.m else "]\n}\n")
+
+
+# ================== CSV / edge list ==================
+def load_edge_list(path, directed=False, weighted=None, delimiter=None):
+    """
+    Mỗi dòng: u v [w]; dòng trống và dòng bắt đầu bằng '#' bị bỏ qua, dòng tiêu đề
+    (source,target,...) được nhận ra và bỏ qua. weighted=None: tự nhận theo số cột.
+    """
+    if delimiter is None and path.lower().endswith(".csv"):
+        delimiter = ","
+    builder = _Builder()
+    has_weight = False
+    first = True
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            p = [x.strip() for x in line.split(delimiter)]
+            if first:
+                first = False
+                if p[0].lower() in HEADER_NAMES:
+                    continue
+            if len(p) < 2:
+                continue
+            if len(p) >= 3 and p[2]:
+                has_weight = True
+                builder.edge(p[0], p[1], float(p[2]))
+            else:
+                builder.edge(p[0], p[1])
+    if weighted is None:
+        weighted = has_weight
+    return builder.build(directed, weighted, os.path.basename(path))
+
+
+# ================== Nhị phân ==================
+def _pad8(n):
+    return (8 - n % 8) % 8
+
+
+def save_binary(path, data):
+    names = "\n".join(data.names).encode("utf-8")
+    flags = (1 if data.directed else 0) | (2 if data.weighted else 0)
+    with open(path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags, data.n, data.m, len(names)))
+        f.write(names)
+        f.write(b"\0" * _pad8(len(names)))
+        f.write(np.asarray(data.src, dtype="<i4").tobytes())
+        f.write(np.asarray(data.dst, dtype="<i4").tobytes())
+        f.write(b"\0" * _pad8(8 * data.m))
+        if data.weighted:
+            f.write(np.asarray(data.w, dtype="<f8").tobytes())
+
+
+def load_binary(path):
+    """Đọc .gbin; mảng cạnh là np.memmap (chỉ đọc), không nạp cả file vào bộ nhớ"""
+    with open(path, "rb") as f:
+        header = f.read(BINARY_HEADER.size)
+        if len(header) < BINARY_HEADER.size:
+            raise ValueError("File nhị phân quá ngắn")
+        magic, version, flags, n, m, names_len = BINARY_HEADER.unpack(header)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"Không phải file đồ thị nhị phân (magic={magic!r}, version={version})")
+        names = f.read(names_len).decode("utf-8").split("\n") if n else []
+    offset = BINARY_HEADER.size + names_len + _pad8(names_len)
+    if m:
+        src = np.memmap(path, dtype="<i4", mode="r", offset=offset, shape=(m,))
+        dst = np.memmap(path, dtype="<i4", mode="r", offset=offset + 4 * m, shape=(m,))
+    else:
+        src = dst = np.zeros(0, dtype=np.int32)
+    weighted = bool(flags & 2)
+    if weighted and m:
+        w = np.memmap(path, dtype="<f8", mode="r", offset=offset + 8 * m + _pad8(8 * m), shape=(m,))
+    else:
+        w = np.ones(m)
+    return GraphData(names, src, dst, w, bool(flags & 1), weighted, os.path.basename(path))
+
+
+# ================== Chọn theo đuôi file ==================
+LOADABLE_EXTENSIONS = (".json", ".gbin", ".csv", ".txt", ".edges", ".el")
+
+
+def load_graph(path, directed=False, weighted=None):
+    """directed / weighted chỉ dùng cho CSV / edge list (json và .gbin tự mang cờ)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        return load_json(path)
+    if ext == ".gbin":
+        return load_binary(path)
+    return load_edge_list(path, directed, weighted)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("source")
+    parser.add_argument("target")
+    parser.add_argument("--directed", action="store_true", help="cho CSV / edge list")
+    args = parser.parse_args()
+    data = load_graph(args.source, directed=args.directed)
+    save_binary(args.target, data)
+    print(f"Đã ghi {args.target}: {data.n} đỉnh, {data.m} cạnh")
+
+
+if __name__ == "__main__":
+    main()
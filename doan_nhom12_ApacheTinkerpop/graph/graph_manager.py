@@ -1,59 +1,405 @@
 
 import time
+from gremlin_python.driver import client
 from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+from gremlin_python.driver.protocol import GremlinServerError
 from gremlin_python.process.graph_traversal import __
 from gremlin_python.process.anonymous_traversal import traversal
+from gremlin_python.process.traversal import T
+
+from gremlin_wire import DEFAULT_SERIALIZER, make_serializer
+from profiling import phase
+
+# ================== Schema / index scripts ==================
+INDEX_NAME = "byGraphAndId"
+BACKEND_SCRIPT = "graph.getClass().getSimpleName()"
+# TinkerGraph chỉ có index một property: tạo index cho cả "graph" và "id"
+TINKER_CREATE_INDEX_SCRIPT = "graph.createIndex(key, Vertex.class)"
+TINKER_INDEXED_KEYS_SCRIPT = "graph.getIndexedKeys(Vertex.class)"
+# JanusGraph: composite index trên cặp (graph, id)
+JANUS_INDEX_STATUS_SCRIPT = (
+    "mgmt = graph.openManagement(); "
+    "idx = mgmt.getGraphIndex(name); "
+    "status = idx == null ? 'MISSING' : idx.getIndexStatus(mgmt.getPropertyKey('id')).toString(); "
+    "mgmt.rollback(); status"
+)
+JANUS_CREATE_INDEX_SCRIPT = (
+    "mgmt = graph.openManagement(); "
+    "keys = ['graph', 'id'].collect { k -> mgmt.containsPropertyKey(k) ? mgmt.getPropertyKey(k)"
+    " : mgmt.makePropertyKey(k).dataType(String.class).make() }; "
+    "builder = mgmt.buildIndex(name, Vertex.class); "
+    "keys.each { k -> builder.addKey(k) }; "
+    "builder.buildCompositeIndex(); mgmt.commit(); "
+    "ManagementSystem.awaitGraphIndexStatus(graph, name).call(); "
+    "mgmt = graph.openManagement(); "
+    "mgmt.updateIndex(mgmt.getGraphIndex(name), SchemaAction.REINDEX).get(); "
+    "mgmt.commit(); 'CREATED'"
+)
+
 
 class GraphManager:
-    def __init__(self):
+    def __init__(self, url="ws://localhost:8182/gremlin", connection=None, client_factory=None,
+                 serializer_name=DEFAULT_SERIALIZER, profiler=None):
         # Kết nối tới Gremlin Server
-        self.connection = DriverRemoteConnection("ws://localhost:8182/gremlin", "g")
+        # profiler: profiling.Profiler — đo build / bulk_build / rebuild theo giai đoạn
+        #           "ingest:<tên hàm>", đếm đỉnh, cạnh và số round trip
+        self.url = url
+        self.connection = connection or DriverRemoteConnection(url, "g")
         self.g = traversal().withRemote(self.connection)
         self.graph_prefix = f"graph_{int(time.time())}"
+        # client gửi script (schema / index), chỉ mở khi cần
+        self._client_factory = client_factory or (lambda: client.Client(
+            self.url, "g", message_serializer=make_serializer(serializer_name)))
+        self._client = None
+        self.indexed = None     # None: chưa kiểm tra; True/False: backend có index (graph, id)
+        self._handles = {}      # tên đỉnh -> id phía server của graph hiện tại
+        # snapshot cạnh của graph hiện tại: (u, v) -> (trọng số, số cạnh lưu); None = chưa biết,
+        # rebuild() khi đó tải lại từ server
+        self._edges = None
+        self.profiler = profiler
+
+    def _count(self, kind, n=1):
+        if self.profiler is not None:
+            self.profiler.count(kind, n)
+
+    # ================== Schema / index ==================
+    def ensure_index(self):
+        """
+        Khai báo index cho cặp property (graph, id) nếu backend hỗ trợ
+        (composite index của JanusGraph, index từng key của TinkerGraph) rồi kiểm tra lại.
+        Trả về True nếu index có hiệu lực; False thì các lookup dựa vào cache handle phía client.
+        """
+        try:
+            backend = self._script(BACKEND_SCRIPT)[0]
+            if "JanusGraph" in backend:
+                if self._script(JANUS_INDEX_STATUS_SCRIPT, {"name": INDEX_NAME})[0] != "ENABLED":
+                    self._script(JANUS_CREATE_INDEX_SCRIPT, {"name": INDEX_NAME})
+                status = self._script(JANUS_INDEX_STATUS_SCRIPT, {"name": INDEX_NAME})[0]
+                self.indexed = status == "ENABLED"
+            elif backend == "TinkerGraph":
+                keys = set(self._script(TINKER_INDEXED_KEYS_SCRIPT))
+                for key in ("graph", "id"):
+                    if key not in keys:
+                        self._script(TINKER_CREATE_INDEX_SCRIPT, {"key": key})
+                keys = set(self._script(TINKER_INDEXED_KEYS_SCRIPT))
+                self.indexed = {"graph", "id"} <= keys
+            else:
+                self.indexed = False
+        except GremlinServerError:
+            # server không cho chạy script quản trị
+            self.indexed = False
+        return self.indexed
+
+    def _check_index(self):
+        if self.indexed is None:
+            self.ensure_index()
+
+    def _script(self, script, bindings=None):
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client.submit(script, bindings).all().result()
+
+    def _vertex_ref(self, name):
+        """Traversal con tới đỉnh theo tên: dùng handle đã cache, nếu không thì lọc (graph, id)"""
+        handle = self._handles.get(name)
+        if handle is not None:
+            return __.V(handle)
+        return __.V().has("graph", self.graph_prefix).has("id", name)
 
     def reset(self):
-        """Xóa toàn bộ graph hiện tại (có phân biệt prefix)"""
-        self.g.V().drop().iterate()
+        """Xóa graph hiện tại (chỉ các đỉnh / cạnh có graph = graph_prefix)"""
+        self.drop_scope()
+
+    def drop_scope(self, prefix=None, batch_size=1000):
+        """
+        Xóa đỉnh và cạnh của một graph_prefix theo từng lô batch_size phần tử,
+        mỗi lô là một transaction nhỏ thay vì một g.V().drop() khổng lồ.
+        Trả về số đỉnh đã xóa.
+        """
+        prefix = prefix or self.graph_prefix
+        if prefix == self.graph_prefix:
+            self._handles = {}
+            self._edges = {}
+        # xóa cạnh trước để đỉnh bậc lớn không kéo theo quá nhiều cạnh trong một lô
+        self._drop_chunked(lambda: self.g.E().has("graph", prefix), batch_size)
+        return self._drop_chunked(lambda: self.g.V().has("graph", prefix), batch_size)
+
+    @staticmethod
+    def _drop_chunked(source, batch_size):
+        total = 0
+        while True:
+            n = source().limit(batch_size).sideEffect(__.drop()).count().next()
+            total += n
+            if n < batch_size:
+                return total
 
     def close(self):
         """Đóng kết nối"""
         self.connection.close()
+        if self._client is not None:
+            self._client.close()
 
-    def build(self, vertices, edges, directed=False, weighted=False):
+    def build(self, vertices, edges, directed=False, weighted=False, incremental=False):
         """
         vertices: list of vertex names (strings)
-        edges: list of [u, v] hoặc [u, v, weight]
+        edges: list of [u, v] hoặc [u, v, weight]; đầu mút chưa có trong vertices được thêm
+               thành đỉnh như build_nx_graph
         directed: bool
         weighted: bool
+        incremental: so sánh với graph đang lưu và chỉ áp dụng phần thay đổi
         """
+        if incremental:
+            return self.rebuild(vertices, edges, directed, weighted)
+        with phase(self.profiler, "ingest:build"):
+            self._build(vertices, edges, directed, weighted)
+
+    def _build(self, vertices, edges, directed, weighted):
+        self._check_index()
         self.reset()
+        rows = self._edge_rows(edges, directed, weighted)
 
         # Thêm các đỉnh với property graph để phân biệt nhiều graph
-        for v in vertices:
-            self.g.addV("vertex")\
-                  .property("id", str(v))\
-                  .property("graph", self.graph_prefix)\
-                  .next()
+        for v in self._with_endpoints(vertices, rows):
+            vertex = self.g.addV("vertex")\
+                           .property("id", str(v))\
+                           .property("graph", self.graph_prefix)\
+                           .next()
+            self._handles[str(v)] = vertex.id
+            self._count("vertices")
+            self._count("round_trips")
+
+        # Thêm các cạnh (vô hướng: _edge_rows đã thêm cạnh ngược)
+        for u, v, w in rows:
+            self.add_edge(u, v, w)
+
+    def add_edge(self, u, v, weight=1.0):
+        """Thêm cạnh u -> v (theo tên đỉnh) vào graph hiện tại"""
+        self.g.addE("edge")\
+              .from_(self._vertex_ref(str(u)))\
+              .to(self._vertex_ref(str(v)))\
+              .property("weight", weight)\
+              .property("graph", self.graph_prefix)\
+              .next()
+        if self._edges is not None:
+            key = (str(u), str(v))
+            self._edges[key] = (weight, self._edges[key][1] + 1 if key in self._edges else 1)
+        self._count("edges")
+        self._count("round_trips")
+
+    # ================== Bulk load ==================
+    def bulk_build(self, vertices, edges, directed=False, weighted=False,
+                   batch_size=500, progress=None):
+        """
+        Nạp đồ thị theo lô: mỗi lô nhiều đỉnh/cạnh được gộp thành MỘT traversal
+        (một round trip) thay vì một round trip cho mỗi phần tử.
+        batch_size: số đỉnh / cạnh trong một traversal
+        progress: callable(phase, done, total, rate) — phase là "vertices" hoặc "edges",
+                  rate là số phần tử / giây tính từ lúc bắt đầu
+        Trả về dict thống kê {vertices, edges, seconds, rate}
+        """
+        with phase(self.profiler, "ingest:bulk_build"):
+            return self._bulk_build(vertices, edges, directed, weighted, batch_size, progress)
+
+    def _bulk_build(self, vertices, edges, directed, weighted, batch_size, progress):
+        self._check_index()
+        self.reset()
+        start = time.perf_counter()
+
+        rows = self._edge_rows(edges, directed, weighted)
+        handles = self._bulk_add_vertices(self._with_endpoints(vertices, rows), batch_size, progress, start)
+        self._handles = handles
+        self._edges = None
+        n_edges = self._bulk_add_edges(rows, handles, batch_size, progress, start)
+        stored = {}
+        for u, v, w in rows:
+            stored[(u, v)] = (w, stored[(u, v)][1] + 1 if (u, v) in stored else 1)
+        self._edges = stored
+
+        elapsed = time.perf_counter() - start
+        total = len(handles) + n_edges
+        return {
+            "vertices": len(handles),
+            "edges": n_edges,
+            "seconds": elapsed,
+            "rate": total / elapsed if elapsed > 0 else float("inf"),
+        }
 
-        # Thêm các cạnh
+    def _bulk_add_vertices(self, vertices, batch_size, progress, start):
+        """Thêm đỉnh theo lô, trả về dict tên đỉnh -> id phía server (vertex handle)"""
+        names = [str(v) for v in vertices]
+        handles = {}
+        for i in range(0, len(names), batch_size):
+            batch = names[i:i + batch_size]
+            rows = self.g.inject(batch).unfold().as_("name")\
+                         .addV("vertex")\
+                         .property("id", __.select("name"))\
+                         .property("graph", self.graph_prefix)\
+                         .project("name", "vid")\
+                         .by(__.select("name"))\
+                         .by(T.id)\
+                         .toList()
+            for r in rows:
+                handles[r["name"]] = r["vid"]
+            self._count("vertices", len(batch))
+            self._count("round_trips")
+            self._report(progress, "vertices", len(handles), len(names), len(handles), start)
+        return handles
+
+    @staticmethod
+    def _edge_rows(edges, directed, weighted):
+        """Chuẩn hóa cạnh thành (u, v, w) theo tên đỉnh, thêm cạnh ngược nếu vô hướng"""
+        rows = []
         for e in edges:
             u, v = str(e[0]), str(e[1])
             w = float(e[2]) if weighted and len(e) == 3 else 1.0
+            rows.append((u, v, w))
+            if not directed:
+                rows.append((v, u, w))
+        return rows
 
-            # Add edge từ u -> v
-            self.g.addE("edge")\
-                  .from_(__.V().has("id", u).has("graph", self.graph_prefix))\
-                  .to(__.V().has("id", v).has("graph", self.graph_prefix))\
-                  .property("weight", w)\
-                  .next()
+    @staticmethod
+    def _with_endpoints(vertices, rows):
+        """Tên đỉnh (không trùng, giữ thứ tự) cùng các đầu mút cạnh chưa có, như build_nx_graph"""
+        names = dict.fromkeys(str(v) for v in vertices)
+        for u, v, _ in rows:
+            names.setdefault(u)
+            names.setdefault(v)
+        return list(names)
 
-            # Nếu vô hướng, thêm cạnh ngược
-            if not directed:
-                self.g.addE("edge")\
-                      .from_(__.V().has("id", v).has("graph", self.graph_prefix))\
-                      .to(__.V().has("id", u).has("graph", self.graph_prefix))\
-                      .property("weight", w)\
-                      .next()
+    def _bulk_add_edges(self, rows, handles, batch_size, progress, start):
+        """Thêm cạnh theo lô, dùng vertex handle nên không phải tìm lại hai đầu mút"""
+        for i in range(0, len(rows), batch_size):
+            t = self.g
+            for u, v, w in rows[i:i + batch_size]:
+                t = t.addE("edge")\
+                     .from_(__.V(handles[u]))\
+                     .to(__.V(handles[v]))\
+                     .property("weight", w)\
+                     .property("graph", self.graph_prefix)
+            t.iterate()
+            done = min(i + batch_size, len(rows))
+            self._count("edges", done - i)
+            self._count("round_trips")
+            self._report(progress, "edges", done, len(rows), len(handles) + done, start)
+        return len(rows)
+
+    @staticmethod
+    def _report(progress, phase, done, total, elements, start):
+        if progress is None:
+            return
+        elapsed = time.perf_counter() - start
+        rate = elements / elapsed if elapsed > 0 else float("inf")
+        progress(phase, done, total, rate)
+
+    # ================== Incremental rebuild ==================
+    def rebuild(self, vertices, edges, directed=False, weighted=False, batch_size=500):
+        """
+        So sánh danh sách đỉnh / cạnh mới với graph đang lưu (cùng graph_prefix)
+        và chỉ thêm / xóa / cập nhật trọng số phần khác nhau. Graph đang lưu lấy từ snapshot
+        phía client của lần build trước (cache handle + cạnh đã ghi); server chỉ nhận các
+        thao tác trên đỉnh / cạnh bị ảnh hưởng. Snapshot được đối chiếu số đỉnh / cạnh với
+        server (một round trip), lệch hoặc chưa có snapshot thì tải toàn bộ graph về để so.
+        Giả định chỉ GraphManager này ghi vào graph_prefix: client khác sửa mà không đổi số
+        đỉnh / cạnh (VD đổi trọng số) thì không phát hiện được.
+        Trả về dict số phần tử đã thay đổi theo từng loại.
+        """
+        with phase(self.profiler, "ingest:rebuild"):
+            return self._rebuild(vertices, edges, directed, weighted, batch_size)
+
+    def _rebuild(self, vertices, edges, directed, weighted, batch_size):
+        self._check_index()
+        start = time.perf_counter()
+        stored_v, stored_e = self._stored_graph()
+
+        rows = self._edge_rows(edges, directed, weighted)
+        want_v = self._with_endpoints(vertices, rows)
+        want_e = {}
+        for u, v, w in rows:
+            want_e[(u, v)] = w
+
+        want_v_set = set(want_v)
+        del_v = [name for name in stored_v if name not in want_v_set]
+        add_v = [name for name in want_v if name not in stored_v]
+        # cạnh của đỉnh bị xóa sẽ mất theo đỉnh
+        del_v_set = set(del_v)
+        del_e = [(u, v) for (u, v), (_, count) in stored_e.items()
+                 if (count > 1 or (u, v) not in want_e) and u not in del_v_set and v not in del_v_set]
+        add_e = []
+        upd_e = []
+        for (u, v), w in want_e.items():
+            stored = stored_e.get((u, v))
+            # cạnh (u, v) lưu trùng: xóa hết rồi thêm lại một cạnh
+            if stored is None or stored[1] > 1:
+                add_e.append((u, v, w))
+            elif stored[0] != w:
+                upd_e.append((u, v, w))
+
+        # snapshot chỉ đúng lại khi áp dụng xong (lỗi giữa chừng: lần sau tải lại từ server)
+        self._edges = None
+        self._edge_steps([self._arcs(stored_v, u, v).drop() for u, v in del_e], batch_size)
+        for i in range(0, len(del_v), batch_size):
+            self.g.V(*[stored_v[name] for name in del_v[i:i + batch_size]]).drop().iterate()
+            self._count("round_trips")
+        self._edge_steps([self._arcs(stored_v, u, v).property("weight", w) for u, v, w in upd_e],
+                         batch_size)
+
+        handles = {name: stored_v[name] for name in want_v_set if name in stored_v}
+        handles.update(self._bulk_add_vertices(add_v, batch_size, None, start))
+        self._bulk_add_edges(add_e, handles, batch_size, None, start)
+        self._edges = {key: (w, 1) for key, w in want_e.items()}
+        self._handles = handles
+
+        return {
+            "added_vertices": len(add_v),
+            "removed_vertices": len(del_v),
+            "added_edges": len(add_e),
+            "removed_edges": len(del_e),
+            "updated_edges": len(upd_e),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _stored_graph(self):
+        """
+        (tên đỉnh -> handle, (u, v) -> (trọng số, số cạnh lưu)) của graph hiện tại: lấy từ
+        snapshot phía client (cache handle + cạnh đã ghi) nếu có và khớp số đỉnh / cạnh trên
+        server, nếu không thì tải từ server.
+        """
+        prefix = self.graph_prefix
+        if self._edges is not None:
+            counts = self.g.inject(0).project("v", "e")\
+                           .by(__.V().has("graph", prefix).count())\
+                           .by(__.V().has("graph", prefix).outE("edge").count())\
+                           .next()
+            self._count("round_trips")
+            if counts["v"] == len(self._handles) and \
+                    counts["e"] == sum(count for _, count in self._edges.values()):
+                return self._handles, self._edges
+        stored_v = {r["id"]: r["vid"] for r in
+                    self.g.V().has("graph", prefix)
+                          .project("id", "vid").by("id").by(T.id).toList()}
+        stored_e = {}
+        for r in self.g.E().has("graph", prefix)\
+                     .project("u", "v", "w")\
+                     .by(__.outV().values("id")).by(__.inV().values("id")).by("weight")\
+                     .toList():
+            key = (r["u"], r["v"])
+            count = stored_e[key][1] + 1 if key in stored_e else 1
+            stored_e[key] = (r["w"], count)
+        return stored_v, stored_e
+
+    @staticmethod
+    def _arcs(handles, u, v):
+        """Traversal con tới các cạnh u -> v đang lưu, theo handle hai đầu mút"""
+        return __.V(handles[u]).outE("edge").where(__.inV().hasId(handles[v]))
+
+    def _edge_steps(self, steps, batch_size):
+        """Chạy các traversal con theo lô, mỗi lô một round trip (sideEffect trên một traverser)"""
+        for i in range(0, len(steps), batch_size):
+            t = self.g.inject(0)
+            for step in steps[i:i + batch_size]:
+                t = t.sideEffect(step)
+            t.iterate()
+            self._count("round_trips")
 
     def show_vertices_edges(self):
         """Debug: in ra vertex và edge"""
@@ -0,0 +1,18 @@
+# graph/nx_builder.py
+import networkx as nx
+
+
+def build_nx_graph(vertices, edges, directed=False, weighted=False):
+    """
+    Dựng nx.Graph / nx.DiGraph từ đỉnh và cạnh.
+    vertices: iterable tên đỉnh
+    edges: iterable [u, v] hoặc [u, v, weight] — từ ô nhập cạnh, file json hay
+           GremlinManager.iter_edges() (được đọc dần, không cần có sẵn cả list)
+    """
+    G = nx.DiGraph() if directed else nx.Graph()
+    G.add_nodes_from(vertices)
+    for e in edges:
+        u, v = e[0], e[1]
+        w = float(e[2]) if weighted and len(e) == 3 else 1.0
+        G.add_edge(u, v, weight=w)
+    return G
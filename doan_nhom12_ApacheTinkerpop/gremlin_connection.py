@@ -1,5 +1,11 @@
 # gremlin_connection.py
-from gremlin_python.driver import client, serializer
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from gremlin_python.driver import client
+
+from gremlin_wire import DEFAULT_SERIALIZER, EDGE_ROWS_OPTION, make_serializer
 
 class GremlinManager:
     def get_vertices(self):
@@ -10,50 +16,342 @@ class GremlinManager:
         # trả về danh sách cạnh (u,v,w) từ Gremlin
         return [("A","B",1), ("B","C",2), ("C","D",3), ("D","A",4), ("A","C",2)]
 
+# Script cố định, tham số truyền qua bindings: Gremlin Server chỉ biên dịch mỗi script
+# một lần (script cache) và id chứa dấu nháy không làm hỏng câu truy vấn
+ADD_VERTEX_SCRIPT = "g.V(vid).fold().coalesce(unfold(), addV(vid).property(T.id, vid))"
+ADD_EDGE_SCRIPT = (
+    "g.V(u).as('a').V(v).as('b')"
+    ".coalesce(__.inE('edge').where(__.outV().as('a')),"
+    " __.addE('edge').from('a').to('b').property('weight', w))"
+)
+GET_VERTICES_SCRIPT = "g.V().id()"
+GET_EDGES_SCRIPT = "g.E().project('u','v','w').by(outV().id()).by(inV().id()).by('weight')"
+# Toạ độ đỉnh (heuristic A*): chỉ các đỉnh có đủ hai property
+GET_COORDINATES_SCRIPT = "g.V().has(xk).has(yk).project('v','x','y').by(id).by(values(xk)).by(values(yk))"
+# Xóa theo lô: mỗi request xóa tối đa n phần tử (transaction nhỏ) và trả về số đã xóa
+CLEAR_EDGES_CHUNK_SCRIPT = "g.E().limit(n).sideEffect(drop()).count()"
+CLEAR_VERTICES_CHUNK_SCRIPT = "g.V().limit(n).sideEffect(drop()).count()"
+CLEAR_SCOPE_EDGES_CHUNK_SCRIPT = "g.E().has('graph', scope).limit(n).sideEffect(drop()).count()"
+CLEAR_SCOPE_VERTICES_CHUNK_SCRIPT = "g.V().has('graph', scope).limit(n).sideEffect(drop()).count()"
+# Phân trang theo range: mỗi trang là một request riêng nên bộ nhớ phía client bị chặn
+# theo kích thước trang, nhưng server phải bỏ qua lo phần tử đầu ở mỗi trang
+# (đồ thị không được thay đổi trong lúc xuất)
+PAGE_VERTICES_SCRIPT = "g.V().range(lo, hi).id()"
+PAGE_EDGES_SCRIPT = (
+    "g.E().range(lo, hi)"
+    ".project('u','v','w').by(outV().id()).by(inV().id()).by('weight')"
+)
+# Phân trang theo id (keyset, chỉ khi chọn paging="id"): trang sau bắt đầu sau id cuối của
+# trang trước. Cần mọi id cùng một kiểu so sánh được — không dùng được với id cạnh
+# RelationIdentifier của JanusGraph hay đỉnh lẫn id Long (GraphManager) và id chuỗi (add_vertex).
+# Không có index sắp theo id thì server vẫn lọc + sắp xếp phần còn lại ở mỗi trang.
+FIRST_VERTICES_BY_ID_SCRIPT = "g.V().order().by(id).limit(n).id()"
+PAGE_VERTICES_BY_ID_SCRIPT = "g.V().has(id, gt(last)).order().by(id).limit(n).id()"
+_EDGE_PAGE_ROWS = ".project('u','v','w','e').by(outV().id()).by(inV().id()).by('weight').by(id)"
+FIRST_EDGES_BY_ID_SCRIPT = "g.E().order().by(id).limit(n)" + _EDGE_PAGE_ROWS
+PAGE_EDGES_BY_ID_SCRIPT = "g.E().has(id, gt(last)).order().by(id).limit(n)" + _EDGE_PAGE_ROWS
+
+
+def _last_edge_id(page):
+    last = page[-1]
+    return last[3] if type(last) is tuple else last['e']
+
+
+def _clear_plan(scope, batch_size):
+    """Các (script, bindings) cần lặp lại cho tới khi xóa được ít hơn batch_size phần tử"""
+    if scope is None:
+        return [(CLEAR_EDGES_CHUNK_SCRIPT, {"n": batch_size}),
+                (CLEAR_VERTICES_CHUNK_SCRIPT, {"n": batch_size})]
+    return [(CLEAR_SCOPE_EDGES_CHUNK_SCRIPT, {"scope": scope, "n": batch_size}),
+            (CLEAR_SCOPE_VERTICES_CHUNK_SCRIPT, {"scope": scope, "n": batch_size})]
+
+
+# kết quả là các hàng cạnh: LeanGraphBinarySerializer đọc bằng đường nhanh
+EDGE_ROWS = {EDGE_ROWS_OPTION: True}
+
+
+def _edge_rows(result):
+    # LeanGraphBinarySerializer đã đọc sẵn thành tuple (u, v, w) hoặc (u, v, w, id cạnh)
+    if result and type(result[0]) is tuple:
+        if len(result[0]) == 4:
+            return [r[:3] for r in result]
+        return list(result)
+    edges = []
+    for r in result:
+        u = r['u']
+        v = r['v']
+        w = r.get('w', 1.0)
+        edges.append((u, v, w))
+    return edges
+
+
+class ConnectionPool:
+    """
+    Pool các kết nối websocket (mỗi phần tử là một client.Client).
+    size: số client
+    max_in_flight: số request đang chờ kết quả tối đa trên toàn pool
+    idle_timeout: client không dùng quá số giây này sẽ bị đóng, lần sau mở lại
+    """
+
+    def __init__(self, factory, size=4, max_in_flight=32, idle_timeout=300.0):
+        self._factory = factory
+        self.size = size
+        self.max_in_flight = max_in_flight
+        self.idle_timeout = idle_timeout
+        self._clients = [None] * size
+        self._in_flight = [0] * size
+        self._last_used = [0.0] * size
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+
+    def acquire(self, blocking=True):
+        """
+        Lấy client ít request nhất, chặn lại nếu đã đủ max_in_flight.
+        Với blocking=False trả về None thay vì chờ.
+        """
+        if not self._slots.acquire(blocking):
+            return None
+        try:
+            with self._lock:
+                self._close_idle()
+                i = min(range(self.size), key=self._in_flight.__getitem__)
+                if self._clients[i] is None:
+                    self._clients[i] = self._factory()
+                self._in_flight[i] += 1
+                return i, self._clients[i]
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, slot):
+        with self._lock:
+            self._in_flight[slot] -= 1
+            self._last_used[slot] = time.monotonic()
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        slot, conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(slot)
+
+    def _close_idle(self):
+        now = time.monotonic()
+        for i, c in enumerate(self._clients):
+            if c is not None and self._in_flight[i] == 0 \
+                    and now - self._last_used[i] > self.idle_timeout:
+                c.close()
+                self._clients[i] = None
+
+    def close(self):
+        with self._lock:
+            for i, c in enumerate(self._clients):
+                if c is not None:
+                    c.close()
+                    self._clients[i] = None
+
+
 class GremlinManager:
-    def __init__(self, url="ws://localhost:8182/gremlin", graph_name="g"):
+    def __init__(self, url="ws://localhost:8182/gremlin", graph_name="g",
+                 pool_size=4, max_in_flight=32, idle_timeout=300.0, client_factory=None,
+                 serializer_name=DEFAULT_SERIALIZER):
+        """serializer_name: định dạng trên đường truyền — "graphbinary" / "graphson-v3" / "graphson-v2" (gremlin_wire.py)"""
         self.url = url
-        self.client = client.Client(
-            self.url, 'g',
-            message_serializer=serializer.GraphSONSerializersV2d0()
-        )
         self.graph_name = graph_name
+        self.serializer_name = serializer_name
+        if client_factory is None:
+            # mỗi client giữ đủ kết nối cho phần request của nó
+            per_client = max(1, max_in_flight // pool_size)
+            client_factory = lambda: client.Client(
+                self.url, self.graph_name,
+                pool_size=per_client,
+                message_serializer=make_serializer(serializer_name)
+            )
+        self.pool = ConnectionPool(client_factory, pool_size, max_in_flight, idle_timeout)
+
+    def _submit(self, script, bindings=None, request_options=None):
+        with self.pool.connection() as conn:
+            return conn.submit(script, bindings, request_options).all().result()
 
     # ================== Vertex ==================
     def add_vertex(self, v_id):
-        script = f"g.V('{v_id}').fold().coalesce(unfold(), addV('{v_id}'))"
-        self.client.submit(script).all().result()
+        self._submit(ADD_VERTEX_SCRIPT, {"vid": v_id})
 
     def get_vertices(self):
-        script = "g.V().id()"
-        result = self.client.submit(script).all().result()
+        result = self._submit(GET_VERTICES_SCRIPT)
         return list(result)
+
+    def get_coordinates(self, x_key="x", y_key="y"):
+        """{id đỉnh: (x, y)} từ hai property toạ độ, dùng làm heuristic cho A*"""
+        result = self._submit(GET_COORDINATES_SCRIPT, {"xk": x_key, "yk": y_key})
+        return {r['v']: (r['x'], r['y']) for r in result}
     
 
     # ================== Edge ==================
     def add_edge(self, u, v, weight=1.0):
-        script = (
-            f"g.V('{u}').as('a').V('{v}').as('b')"
-            f".coalesce(__.outE().where(__.inV().is(b)), __.addE('edge').from('a').to('b').property('weight',{weight}))"
-        )
-        self.client.submit(script).all().result()
+        self._submit(ADD_EDGE_SCRIPT, {"u": u, "v": v, "w": weight})
 
     def get_edges(self):
         # Lấy tất cả các cạnh dưới dạng (u, v, weight)
-        script = "g.E().project('u','v','w').by(outV().id()).by(inV().id()).by('weight')"
-        result = self.client.submit(script).all().result()
-        edges = []
-        for r in result:
-            u = r['u']
-            v = r['v']
-            w = r.get('w', 1.0)
-            edges.append((u, v, w))
-        return edges
+        result = self._submit(GET_EDGES_SCRIPT, None, EDGE_ROWS)
+        return _edge_rows(result)
+
+    # ================== Streaming export ==================
+    def stream_vertices(self, chunk_size=10000, paging="range"):
+        """Sinh các lô id đỉnh (list), mỗi lô tối đa chunk_size phần tử; paging như stream_edges"""
+        if paging == "id":
+            return self._stream_by_id(FIRST_VERTICES_BY_ID_SCRIPT, PAGE_VERTICES_BY_ID_SCRIPT,
+                                      chunk_size, list, lambda page: page[-1])
+        return self._stream(GET_VERTICES_SCRIPT, PAGE_VERTICES_SCRIPT, chunk_size, paging, list)
+
+    def stream_edges(self, chunk_size=10000, paging="range"):
+        """
+        Sinh các lô cạnh [(u, v, w), ...], mỗi lô tối đa chunk_size cạnh.
+        paging="range": mỗi lô là một request g.E().range(lo, hi) — bộ nhớ client theo kích
+                        thước lô, server tốn O(lo) mỗi lô
+        paging="batch": một request, server trả theo từng lô batchSize; ResultSet của
+                        gremlinpython dồn các lô vào hàng đợi không giới hạn nên KHÔNG chặn
+                        bộ nhớ client khi bên tiêu thụ chậm hơn server
+        paging="id"   : mỗi lô là một request has(id, gt(id cuối)).order().by(id).limit(n);
+                        chỉ dùng khi mọi id cùng kiểu và so sánh được (xem PAGE_*_BY_ID_SCRIPT)
+        """
+        if paging == "id":
+            return self._stream_by_id(FIRST_EDGES_BY_ID_SCRIPT, PAGE_EDGES_BY_ID_SCRIPT,
+                                      chunk_size, _edge_rows, _last_edge_id, EDGE_ROWS)
+        return self._stream(GET_EDGES_SCRIPT, PAGE_EDGES_SCRIPT, chunk_size, paging, _edge_rows,
+                            EDGE_ROWS)
+
+    def iter_vertices(self, chunk_size=10000, paging="range"):
+        for chunk in self.stream_vertices(chunk_size, paging):
+            yield from chunk
+
+    def iter_edges(self, chunk_size=10000, paging="range"):
+        """Từng cạnh (u, v, w) — dùng trực tiếp làm input cho build_nx_graph"""
+        for chunk in self.stream_edges(chunk_size, paging):
+            yield from chunk
+
+    def _stream_by_id(self, first_script, page_script, chunk_size, convert, last_id, options=None):
+        page = self._submit(first_script, {"n": chunk_size}, options)
+        while page:
+            yield convert(page)
+            if len(page) < chunk_size:
+                return
+            page = self._submit(page_script, {"last": last_id(page), "n": chunk_size}, options)
+
+    def _stream(self, script, page_script, chunk_size, paging, convert, options=None):
+        if paging == "batch":
+            with self.pool.connection() as conn:
+                result_set = conn.submit(script, None, {"batchSize": chunk_size, **(options or {})})
+                for batch in result_set:
+                    yield convert(batch)
+        elif paging == "range":
+            lo = 0
+            while True:
+                page = self._submit(page_script, {"lo": lo, "hi": lo + chunk_size}, options)
+                if page:
+                    yield convert(page)
+                if len(page) < chunk_size:
+                    return
+                lo += chunk_size
+        else:
+            raise ValueError(f"paging không hợp lệ: {paging}")
 
     # ================== Clear Graph ==================
-    def clear_graph(self):
-        self.client.submit("g.V().drop()").all().result()
+    def clear_graph(self, scope=None, batch_size=10000):
+        """
+        Xóa graph theo từng lô batch_size phần tử.
+        scope: chỉ xóa đỉnh / cạnh có property graph = scope (graph_prefix của GraphManager);
+               None = xóa toàn bộ server
+        """
+        total = 0
+        for script, bindings in _clear_plan(scope, batch_size):
+            while True:
+                n = self._submit(script, bindings)[0]
+                total += n
+                if n < batch_size:
+                    break
+        return total
 
     # ================== Close connection ==================
     def close(self):
-        self.client.close()
+        self.pool.close()
+
+
+class AsyncGremlinManager:
+    """
+    Phiên bản asyncio của GremlinManager, dùng chung pool kết nối.
+    Nhiều request được gửi nối tiếp (pipeline) mà không chờ nhau, tối đa `concurrency`
+    request cùng lúc; khi đủ thì coroutine gọi tiếp sẽ chờ (backpressure).
+    """
+
+    def __init__(self, manager, concurrency=16):
+        self.manager = manager
+        self.concurrency = min(concurrency, manager.pool.max_in_flight)
+        self._semaphore = None
+
+    def _limit(self):
+        # tạo semaphore trong event loop đang chạy
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def _submit(self, script, bindings=None, request_options=None):
+        pool = self.manager.pool
+        async with self._limit():
+            lease = pool.acquire(blocking=False)
+            if lease is None:
+                # pool đang được dùng chung với code đồng bộ: chờ ngoài event loop
+                lease = await asyncio.get_running_loop().run_in_executor(None, pool.acquire)
+            slot, conn = lease
+            try:
+                result_set = await asyncio.wrap_future(conn.submit_async(script, bindings, request_options))
+                return await asyncio.wrap_future(result_set.all())
+            finally:
+                pool.release(slot)
+
+    # ================== Vertex ==================
+    async def add_vertex(self, v_id):
+        await self._submit(ADD_VERTEX_SCRIPT, {"vid": v_id})
+
+    async def get_vertices(self):
+        return list(await self._submit(GET_VERTICES_SCRIPT))
+
+    # ================== Edge ==================
+    async def add_edge(self, u, v, weight=1.0):
+        await self._submit(ADD_EDGE_SCRIPT, {"u": u, "v": v, "w": weight})
+
+    async def get_edges(self):
+        return _edge_rows(await self._submit(GET_EDGES_SCRIPT, None, EDGE_ROWS))
+
+    # ================== Clear Graph ==================
+    async def clear_graph(self, scope=None, batch_size=10000):
+        total = 0
+        for script, bindings in _clear_plan(scope, batch_size):
+            while True:
+                n = (await self._submit(script, bindings))[0]
+                total += n
+                if n < batch_size:
+                    break
+        return total
+
+    # ================== Pipeline ==================
+    async def pipeline(self, calls):
+        """
+        Chạy một loạt lời gọi, VD: [("add_vertex", ("A",)), ("add_edge", ("A", "B", 2.0))].
+        calls có thể là generator rất dài: chỉ có tối đa `concurrency` lời gọi đang chạy.
+        Trả về list theo đúng thứ tự, mỗi phần tử là kết quả hoặc Exception của lời gọi đó.
+        """
+        results = {}
+        calls = enumerate(calls)
+
+        async def worker():
+            for i, (name, args) in calls:
+                try:
+                    results[i] = await getattr(self, name)(*args)
+                except Exception as e:
+                    results[i] = e
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return [results[i] for i in range(len(results))]
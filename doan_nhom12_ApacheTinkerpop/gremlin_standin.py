@@ -0,0 +1,1418 @@
+# gremlin_standin.py
+"""
+Gremlin Server giả lập chạy ngay trong tiến trình — dùng cho benchmark / kiểm thử
+khi không có Gremlin Server thật.
+
+- StandInServer: đồ thị thuộc tính trong bộ nhớ + bộ thông dịch bytecode Gremlin
+  (một tập con các step thường dùng trong project)
+- StandInClient: cùng giao diện với client.Client (submit / submit_async / close)
+- StandInRemoteConnection: thay cho DriverRemoteConnection (traversal dạng bytecode)
+- Script Groovy được "biên dịch" (parse thành bytecode) và cache theo nguyên văn script,
+  giống script cache của Gremlin Server: script literal mỗi lần một khác nên luôn phải
+  biên dịch lại, script dùng bindings chỉ biên dịch một lần.
+- g.withComputer(): shortestPath() / connectedComponent() chạy trong tiến trình như
+  VertexProgram của TinkerGraph; StandInServer(computer=False) giả lập server không có
+  GraphComputer (withComputer() bị từ chối).
+"""
+import heapq
+import itertools
+import re
+import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from gremlin_python.driver.protocol import GremlinServerError
+from gremlin_python.driver.remote_connection import RemoteConnection, RemoteTraversal
+from gremlin_python.process.graph_traversal import __, GraphTraversalSource
+from gremlin_python.process.traversal import (
+    T, P, TextP, Order, Scope, Pop, Direction, Column, Cardinality,
+    Bytecode, TraversalStrategies, Traverser, ShortestPath, ConnectedComponent
+)
+from gremlin_python.structure.graph import Graph, Vertex, Edge
+
+_MISSING = object()
+
+
+# ================== Element ==================
+class _Vertex:
+    __slots__ = ("id", "label", "props", "out_e", "in_e")
+
+    def __init__(self, vid, label):
+        self.id = vid
+        self.label = label
+        self.props = {}
+        self.out_e = []
+        self.in_e = []
+
+
+class _Edge:
+    __slots__ = ("id", "label", "props", "out_v", "in_v")
+
+    def __init__(self, eid, label, out_v, in_v):
+        self.id = eid
+        self.label = label
+        self.props = {}
+        self.out_v = out_v
+        self.in_v = in_v
+
+
+_ELEMENT = (_Vertex, _Edge)
+
+
+# ================== Traverser ==================
+class _Trav:
+    """Traverser: object hiện tại + path và nhãn as() lưu dạng danh sách liên kết (O(1) mỗi step)"""
+    __slots__ = ("obj", "path", "labels", "loops")
+
+    def __init__(self, obj, path=None, labels=None, loops=0):
+        self.obj = obj
+        self.path = (obj, path) if path is not None else (obj, None)
+        self.labels = labels
+        self.loops = loops
+
+    def split(self, obj):
+        t = _Trav.__new__(_Trav)
+        t.obj = obj
+        t.path = (obj, self.path)
+        t.labels = self.labels
+        t.loops = self.loops
+        return t
+
+    def tag(self, names):
+        t = _Trav.__new__(_Trav)
+        t.obj = self.obj
+        t.path = self.path
+        t.labels = ((names, self.obj), self.labels)
+        t.loops = self.loops
+        return t
+
+    def select(self, key, pop=Pop.last):
+        found = []
+        node = self.labels
+        while node is not None:
+            (names, obj), node = node
+            if key in names:
+                if pop == Pop.last:
+                    return obj
+                found.append(obj)
+        if not found:
+            return _MISSING
+        if pop == Pop.first:
+            return found[-1]
+        return found[::-1]
+
+    def path_list(self):
+        out = []
+        node = self.path
+        while node is not None:
+            obj, node = node
+            if obj is not _MISSING:
+                out.append(obj)
+        return out[::-1]
+
+
+# ================== Script -> bytecode ==================
+class _Ref:
+    """Tên biến binding trong script đã biên dịch, được thay giá trị lúc thực thi"""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<num>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?P<suffix>[dDfFlL]?)
+  | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+  | (?P<op>[().,\[\];])
+)""", re.X)
+
+_NAMESPACES = {
+    "T": T, "P": P, "TextP": TextP, "Order": Order, "Scope": Scope, "Pop": Pop,
+    "Direction": Direction, "Column": Column, "Cardinality": Cardinality, "__": __,
+    "ShortestPath": ShortestPath, "ConnectedComponent": ConnectedComponent,
+}
+_BARE = {
+    "local": Scope.local, "global": Scope.global_,
+    "asc": Order.asc, "desc": Order.desc, "shuffle": Order.shuffle,
+    "OUT": Direction.OUT, "IN": Direction.IN, "BOTH": Direction.BOTH,
+    "keys": Column.keys, "values": Column.values,
+    "id": T.id, "label": T.label,
+    "true": True, "false": False, "null": None,
+}
+_BARE_P = {"within", "without", "gt", "gte", "lt", "lte", "eq", "neq", "between", "inside", "outside"}
+
+
+def _py_name(obj, name, call=True):
+    # as/in/is/not/... là từ khoá Python nên gremlinpython thêm "_"
+    # (tra trong __dict__ vì GraphTraversal / __ có __getattr__ biến tên lạ thành values())
+    owner = obj if isinstance(obj, type) else type(obj)
+    def defined(attr):
+        return any(attr in klass.__dict__ for klass in owner.__mro__)
+    if call and defined(name + "_"):
+        return getattr(obj, name + "_")
+    if call and not defined(name):
+        raise ValueError(f"Step '{name}' không tồn tại")
+    return getattr(obj, name)
+
+
+class _ScriptParser:
+    """Parse script Gremlin-Groovy dạng chuỗi gọi hàm (g.V(x).out()...) thành bytecode"""
+
+    def __init__(self, text, source_factory):
+        self.tokens = []
+        pos = 0
+        text = text.strip()
+        while pos < len(text):
+            m = _TOKEN.match(text, pos)
+            if not m or m.end() == pos:
+                raise ValueError(f"Không parse được script tại vị trí {pos}: {text[pos:pos + 20]!r}")
+            pos = m.end()
+            if m.group("num") is not None:
+                num = m.group("num")
+                is_float = "." in num or "e" in num.lower() or m.group("suffix") in ("d", "D", "f", "F")
+                self.tokens.append(("lit", float(num) if is_float else int(num)))
+            elif m.group("str") is not None:
+                raw = m.group("str")[1:-1]
+                self.tokens.append(("lit", re.sub(r"\\(.)", r"\1", raw)))
+            elif m.group("name") is not None:
+                self.tokens.append(("name", m.group("name")))
+            elif m.group("op") is not None:
+                self.tokens.append(("op", m.group("op")))
+        self.i = 0
+        self.source_factory = source_factory
+
+    def _peek(self):
+        return self.tokens[self.i] if self.i < len(self.tokens) else (None, None)
+
+    def _take(self, kind=None, value=None):
+        tok = self._peek()
+        if tok[0] is None or (kind and tok[0] != kind) or (value and tok[1] != value):
+            raise ValueError(f"Script không hợp lệ, cần {value or kind}, gặp {tok[1]!r}")
+        self.i += 1
+        return tok
+
+    def parse(self):
+        value = self._expr()
+        if self._peek() == ("op", ";"):
+            self.i += 1
+        if self._peek()[0] is not None:
+            raise ValueError(f"Script không hợp lệ, thừa {self._peek()[1]!r}")
+        return value.bytecode if hasattr(value, "bytecode") else value
+
+    def _args(self):
+        self._take("op", "(")
+        args = []
+        while self._peek() != ("op", ")"):
+            args.append(self._expr())
+            if self._peek() == ("op", ","):
+                self.i += 1
+        self._take("op", ")")
+        return args
+
+    def _expr(self):
+        kind, value = self._take()
+        if kind == "lit":
+            obj = value
+        elif kind == "op" and value == "[":
+            obj = []
+            while self._peek() != ("op", "]"):
+                obj.append(self._expr())
+                if self._peek() == ("op", ","):
+                    self.i += 1
+            self._take("op", "]")
+        elif kind == "name":
+            if self._peek() == ("op", "("):
+                # gọi step không có đối tượng: unfold(), gt(3)... (static import của __ và P)
+                args = self._args()
+                target = P if value in _BARE_P else __
+                obj = _py_name(target, value)(*args)
+            elif value == "g":
+                obj = self.source_factory()
+            elif value in _NAMESPACES:
+                obj = _NAMESPACES[value]
+            elif value in _BARE:
+                obj = _BARE[value]
+            else:
+                obj = _Ref(value)
+        else:
+            raise ValueError(f"Script không hợp lệ tại {value!r}")
+
+        while self._peek() == ("op", "."):
+            self.i += 1
+            _, name = self._take("name")
+            if self._peek() == ("op", "("):
+                obj = _py_name(obj, name)(*self._args())
+            else:
+                obj = _py_name(obj, name, call=False)
+        return obj
+
+
+# ================== Compiled traversal ==================
+class _Anon:
+    """Traversal con (anonymous) đã biên dịch"""
+    __slots__ = ("stages",)
+
+    def __init__(self, stages):
+        self.stages = stages
+
+
+class _Stage:
+    __slots__ = ("name", "args", "mods", "pre", "state")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.mods = []      # by / from / to / times / emit / until / with ... sau step
+        self.pre = []       # emit / until đứng trước repeat()
+        self.state = {}
+
+    def mod(self, name):
+        return [args for m, args in self.mods if m == name]
+
+
+_MODULATORS = {"by", "from", "to", "times", "emit", "until", "with", "option"}
+
+
+def _uses_computer(sources):
+    # gremlinpython dịch withComputer() thành withStrategies(VertexProgramStrategy)
+    for ins in sources:
+        if ins[0] == "withComputer":
+            return True
+        if ins[0] == "withStrategies" and any(
+                getattr(a, "strategy_name", None) == "VertexProgramStrategy" for a in ins[1:]):
+            return True
+    return False
+
+
+# ================== Server ==================
+# Script quản lý schema / index mà backend nhận diện được (giống TinkerGraph)
+BACKEND_SCRIPT = "graph.getClass().getSimpleName()"
+TINKER_CREATE_INDEX_SCRIPT = "graph.createIndex(key, Vertex.class)"
+TINKER_INDEXED_KEYS_SCRIPT = "graph.getIndexedKeys(Vertex.class)"
+
+
+class StandInServer:
+    """
+    backend="TinkerGraph": nhận các script tạo / liệt kê index kiểu TinkerGraph
+    backend khác: không có index (mọi has() là quét toàn bộ đỉnh)
+    computer=False: không có GraphComputer, traversal g.withComputer() bị từ chối
+    """
+
+    def __init__(self, script_cache_size=4096, backend="TinkerGraph", computer=True):
+        self.vertices = {}
+        self.edges = {}
+        self.lock = threading.RLock()
+        self._next_id = 0
+        self.backend = backend
+        self.computer = computer
+        self.indexed_keys = set()
+        self._index = {}          # key -> value -> set(vertex id)
+        self._script_cache = OrderedDict()
+        self._script_cache_size = script_cache_size
+        self._scripts = {}        # script cố định -> hàm Python (thao tác backend)
+        self.stats = {"requests": 0, "compiled": 0, "cache_hits": 0}
+        self.register_script(BACKEND_SCRIPT, lambda server, b: [server.backend])
+        if backend == "TinkerGraph":
+            self.register_script(TINKER_CREATE_INDEX_SCRIPT,
+                                 lambda server, b: server.create_index(b["key"]) or [])
+            self.register_script(TINKER_INDEXED_KEYS_SCRIPT,
+                                 lambda server, b: sorted(server.indexed_keys))
+
+    # ---------- API ----------
+    def register_script(self, script, fn):
+        """Gắn một script cố định với hàm fn(server, bindings) -> list kết quả"""
+        self._scripts[script] = fn
+
+    def execute(self, message, bindings=None):
+        """Chạy script (str) hoặc Bytecode, trả về generator các kết quả (đã đổi sang kiểu client)"""
+        with self.lock:
+            self.stats["requests"] += 1
+            if isinstance(message, str) and message in self._scripts:
+                return iter(self._scripts[message](self, bindings or {}))
+            bytecode = self._compile_script(message) if isinstance(message, str) else message
+            stages, sources = self._compile(bytecode, bindings or {})
+            if not self.computer and _uses_computer(sources):
+                raise ValueError(f"{self.backend} không hỗ trợ GraphComputer (withComputer)")
+        return self._results(stages, sources)
+
+    def _results(self, stages, sources):
+        ctx = {"computer": _uses_computer(sources), "side": {}}
+        start = [_Trav(_MISSING)]
+        for t in self._run(stages, iter(start), ctx):
+            yield self._to_client(t.obj)
+
+    # ---------- biên dịch ----------
+    def _compile_script(self, script):
+        cached = self._script_cache.get(script)
+        if cached is not None:
+            self._script_cache.move_to_end(script)
+            self.stats["cache_hits"] += 1
+            return cached
+        self.stats["compiled"] += 1
+        source = lambda: GraphTraversalSource(Graph(), TraversalStrategies(), Bytecode())
+        bytecode = _ScriptParser(script, source).parse()
+        self._script_cache[script] = bytecode
+        if len(self._script_cache) > self._script_cache_size:
+            self._script_cache.popitem(last=False)
+        return bytecode
+
+    def _compile(self, bytecode, bindings):
+        sources = [list(ins) for ins in getattr(bytecode, "source_instructions", [])]
+        return self._stages(bytecode.step_instructions, bindings), sources
+
+    def _stages(self, instructions, bindings):
+        stages = []
+        pending = []
+        for ins in instructions:
+            name, args = ins[0], [self._bind(a, bindings) for a in ins[1:]]
+            if name in ("emit", "until") and (not stages or stages[-1].name != "repeat"):
+                pending.append((name, args))
+                continue
+            if name in _MODULATORS and stages:
+                stages[-1].mods.append((name, args))
+                continue
+            stage = _Stage(name, args)
+            if pending:
+                stage.pre, pending = pending, []
+            stages.append(stage)
+        self._plan_index(stages)
+        return stages
+
+    def _plan_index(self, stages):
+        # V().has(k, v)...: nếu k có index thì V() chỉ lấy các đỉnh trong bucket index,
+        # các step has() phía sau vẫn lọc lại như bình thường
+        if not self.indexed_keys:
+            return
+        for i, stage in enumerate(stages):
+            if stage.name != "V" or stage.args:
+                continue
+            hints = []
+            for nxt in stages[i + 1:]:
+                if nxt.name != "has":
+                    break
+                if len(nxt.args) == 2 and nxt.args[0] in self.indexed_keys \
+                        and not isinstance(nxt.args[1], P):
+                    hints.append((nxt.args[0], nxt.args[1]))
+            if hints:
+                stage.state["index_hints"] = hints
+
+    def _bind(self, arg, bindings):
+        if isinstance(arg, _Ref):
+            if arg.name not in bindings:
+                raise ValueError(f"Thiếu binding '{arg.name}'")
+            return bindings[arg.name]
+        if isinstance(arg, Bytecode):
+            return _Anon(self._stages(arg.step_instructions, bindings))
+        if hasattr(arg, "bytecode") and isinstance(arg.bytecode, Bytecode):
+            return _Anon(self._stages(arg.bytecode.step_instructions, bindings))
+        if isinstance(arg, P):
+            value = arg.value
+            if isinstance(value, list):
+                value = [self._bind(v, bindings) for v in value]
+            else:
+                value = self._bind(value, bindings)
+            other = self._bind(arg.other, bindings) if arg.other is not None else None
+            return P(arg.operator, value, other)
+        if isinstance(arg, list):
+            return [self._bind(a, bindings) for a in arg]
+        if arg is T.id_:
+            return T.id
+        return arg
+
+    # ---------- chuyển kết quả ----------
+    def _to_client(self, obj):
+        if isinstance(obj, _Vertex):
+            return Vertex(obj.id, obj.label)
+        if isinstance(obj, _Edge):
+            return Edge(obj.id, Vertex(obj.out_v.id, obj.out_v.label), obj.label,
+                        Vertex(obj.in_v.id, obj.in_v.label))
+        if isinstance(obj, dict):
+            return {self._to_client(k): self._to_client(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [self._to_client(v) for v in obj]
+        if isinstance(obj, set):
+            return {self._to_client(v) for v in obj}
+        return obj
+
+    # ---------- đồ thị ----------
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def _get_vertex(self, ref):
+        if isinstance(ref, _Vertex):
+            return ref
+        if isinstance(ref, Vertex):
+            ref = ref.id
+        return self.vertices.get(ref)
+
+    def _set_prop(self, el, key, value):
+        if isinstance(el, _Vertex) and key in self.indexed_keys:
+            old = el.props.get(key, _MISSING)
+            if old is not _MISSING:
+                self._index[key].get(old, set()).discard(el.id)
+            self._index[key].setdefault(value, set()).add(el.id)
+        el.props[key] = value
+
+    def create_index(self, key):
+        """Tạo index cho property của đỉnh (giống TinkerGraph.createIndex(key, Vertex.class))"""
+        with self.lock:
+            self.indexed_keys.add(key)
+            index = self._index.setdefault(key, {})
+            for v in self.vertices.values():
+                if key in v.props:
+                    index.setdefault(v.props[key], set()).add(v.id)
+
+    def _remove_vertex(self, v):
+        for e in list(v.out_e) + list(v.in_e):
+            self._remove_edge(e)
+        for key in self.indexed_keys:
+            if key in v.props:
+                self._index[key].get(v.props[key], set()).discard(v.id)
+        self.vertices.pop(v.id, None)
+
+    def _remove_edge(self, e):
+        if self.edges.pop(e.id, None) is None:
+            return
+        e.out_v.out_e.remove(e)
+        e.in_v.in_e.remove(e)
+
+    # ================== Thông dịch ==================
+    def _run(self, stages, stream, ctx):
+        for stage in stages:
+            handler = getattr(self, "_s_" + stage.name, None)
+            if handler is None:
+                raise ValueError(f"Step '{stage.name}' chưa được hỗ trợ trong stand-in")
+            stream = handler(stage, stream, ctx)
+        return stream
+
+    def _sub(self, anon, t, ctx):
+        """Chạy traversal con trên một traverser, trả về iterator traverser kết quả"""
+        return self._run(anon.stages, iter([t]), ctx)
+
+    def _first(self, anon, t, ctx):
+        for r in self._sub(anon, t, ctx):
+            return r.obj
+        return _MISSING
+
+    def _value(self, spec, t, ctx):
+        """Giá trị của modulator by(): rỗng / tên property / T.id / T.label / traversal"""
+        obj = t.obj
+        if spec is None:
+            return obj
+        if isinstance(spec, _Anon):
+            return self._first(spec, t, ctx)
+        if spec == T.id:
+            return obj.id
+        if spec == T.label:
+            return obj.label
+        if isinstance(spec, str):
+            if isinstance(obj, dict):
+                return obj.get(spec, _MISSING)
+            return self._props(obj, ctx).get(spec, _MISSING) if isinstance(obj, _ELEMENT) else _MISSING
+        raise ValueError(f"by({spec!r}) chưa được hỗ trợ")
+
+    @staticmethod
+    def _props(el, ctx):
+        """Property của phần tử, cộng thêm property do VertexProgram tính (chỉ trong request này)"""
+        computed = ctx.get("computed")
+        if computed and isinstance(el, _Vertex) and el.id in computed:
+            return {**el.props, **computed[el.id]}
+        return el.props
+
+    def _by_specs(self, stage):
+        specs = []
+        for args in stage.mod("by"):
+            specs.append(args[0] if args else None)
+        return specs
+
+    def _test(self, pred, value):
+        if isinstance(pred, P):
+            op, arg = pred.operator, pred.value
+            if op == "eq":
+                return value == arg
+            if op == "neq":
+                return value != arg
+            if op == "gt":
+                return value is not _MISSING and value > arg
+            if op == "gte":
+                return value is not _MISSING and value >= arg
+            if op == "lt":
+                return value is not _MISSING and value < arg
+            if op == "lte":
+                return value is not _MISSING and value <= arg
+            if op == "within":
+                return value in (arg if isinstance(arg, list) else [arg])
+            if op == "without":
+                return value not in (arg if isinstance(arg, list) else [arg])
+            if op == "between":
+                return value is not _MISSING and arg <= value < pred.other
+            if op == "and":
+                return self._test(arg, value) and self._test(pred.other, value)
+            if op == "or":
+                return self._test(arg, value) or self._test(pred.other, value)
+            raise ValueError(f"Predicate '{op}' chưa được hỗ trợ")
+        return value == pred
+
+    @staticmethod
+    def _same(a, b):
+        if isinstance(a, _ELEMENT) and isinstance(b, _ELEMENT):
+            return a is b
+        return a == b
+
+    # ---------- start / đồ thị ----------
+    def _ids(self, args):
+        ids = []
+        for a in args:
+            if isinstance(a, (list, tuple, set)):
+                ids.extend(a)
+            else:
+                ids.append(a)
+        return [i.id if isinstance(i, (Vertex, Edge, _Vertex, _Edge)) else i for i in ids]
+
+    def _s_V(self, stage, stream, ctx):
+        ids = self._ids(stage.args)
+        hints = stage.state.get("index_hints")
+        for t in stream:
+            if ids:
+                found = (self.vertices.get(i) for i in ids)
+                targets = [v for v in found if v is not None]
+            elif hints:
+                # chọn bucket nhỏ nhất trong các key có index
+                bucket = min((self._index[k].get(v, ()) for k, v in hints), key=len)
+                targets = [self.vertices[i] for i in bucket]
+            else:
+                targets = list(self.vertices.values())
+            for v in targets:
+                yield t.split(v)
+
+    def _s_E(self, stage, stream, ctx):
+        ids = self._ids(stage.args)
+        for t in stream:
+            if ids:
+                targets = [self.edges[i] for i in ids if i in self.edges]
+            else:
+                targets = list(self.edges.values())
+            for e in targets:
+                yield t.split(e)
+
+    def _s_inject(self, stage, stream, ctx):
+        for t in stream:
+            if t.obj is not _MISSING:
+                yield t
+        for obj in stage.args:
+            yield _Trav(obj)
+
+    def _s_addV(self, stage, stream, ctx):
+        label = stage.args[0] if stage.args else "vertex"
+        for t in stream:
+            lab = self._first(label, t, ctx) if isinstance(label, _Anon) else label
+            v = _Vertex(self._new_id(), lab)
+            self.vertices[v.id] = v
+            yield t.split(v)
+
+    def _endpoint(self, spec, t, ctx):
+        if isinstance(spec, _Anon):
+            obj = self._first(spec, t, ctx)
+        elif isinstance(spec, str):
+            obj = t.select(spec)
+        else:
+            obj = self._get_vertex(spec)
+        if not isinstance(obj, _Vertex):
+            raise ValueError("addE(): không xác định được đỉnh đầu/cuối")
+        return obj
+
+    def _s_addE(self, stage, stream, ctx):
+        label = stage.args[0] if stage.args else "edge"
+        src = stage.mod("from")
+        dst = stage.mod("to")
+        for t in stream:
+            out_v = self._endpoint(src[-1][0], t, ctx) if src else t.obj
+            in_v = self._endpoint(dst[-1][0], t, ctx) if dst else t.obj
+            if not isinstance(out_v, _Vertex) or not isinstance(in_v, _Vertex):
+                raise ValueError("addE(): cần đỉnh nguồn và đích")
+            e = _Edge(self._new_id(), label, out_v, in_v)
+            self.edges[e.id] = e
+            out_v.out_e.append(e)
+            in_v.in_e.append(e)
+            yield t.split(e)
+
+    def _s_property(self, stage, stream, ctx):
+        args = list(stage.args)
+        if args and isinstance(args[0], Cardinality):
+            args = args[1:]
+        for t in stream:
+            el = t.obj
+            for i in range(0, len(args) - 1, 2):
+                key, value = args[i], args[i + 1]
+                if isinstance(value, _Anon):
+                    value = self._first(value, t, ctx)
+                if key == T.id:
+                    self._rekey(el, value)
+                elif key == T.label:
+                    el.label = value
+                else:
+                    self._set_prop(el, key, value)
+            yield t
+
+    def _rekey(self, el, new_id):
+        table = self.vertices if isinstance(el, _Vertex) else self.edges
+        if new_id in table and table[new_id] is not el:
+            raise ValueError(f"Phần tử với id {new_id!r} đã tồn tại")
+        table.pop(el.id, None)
+        if isinstance(el, _Vertex):
+            for key in self.indexed_keys:
+                if key in el.props:
+                    bucket = self._index[key].setdefault(el.props[key], set())
+                    bucket.discard(el.id)
+                    bucket.add(new_id)
+        el.id = new_id
+        table[new_id] = el
+
+    def _s_drop(self, stage, stream, ctx):
+        for t in stream:
+            obj = t.obj
+            if isinstance(obj, _Vertex):
+                self._remove_vertex(obj)
+            elif isinstance(obj, _Edge):
+                self._remove_edge(obj)
+        return
+        yield
+
+    def _s_discard(self, stage, stream, ctx):
+        for _ in stream:
+            pass
+        return
+        yield
+
+    _s_none = _s_discard
+
+    # ---------- lọc ----------
+    def _s_has(self, stage, stream, ctx):
+        args = stage.args
+        if len(args) == 3:
+            label, key, pred = args
+        elif len(args) == 2:
+            label, (key, pred) = None, args
+        else:
+            label, key, pred = None, args[0], _MISSING
+        for t in stream:
+            el = t.obj
+            if not isinstance(el, _ELEMENT):
+                continue
+            if label is not None and el.label != label:
+                continue
+            if key == T.id:
+                value = el.id
+            elif key == T.label:
+                value = el.label
+            else:
+                value = el.props.get(key, _MISSING)
+            if pred is _MISSING:
+                if value is not _MISSING:
+                    yield t
+            elif value is not _MISSING and self._test(pred, value):
+                yield t
+
+    def _match_any(self, args):
+        if len(args) == 1 and isinstance(args[0], P):
+            return lambda value: self._test(args[0], value)
+        allowed = set(self._ids(args))
+        return allowed.__contains__
+
+    def _s_hasLabel(self, stage, stream, ctx):
+        match = self._match_any(stage.args)
+        for t in stream:
+            if match(t.obj.label):
+                yield t
+
+    def _s_hasId(self, stage, stream, ctx):
+        match = self._match_any(stage.args)
+        for t in stream:
+            if match(t.obj.id):
+                yield t
+
+    def _s_is(self, stage, stream, ctx):
+        pred = stage.args[0]
+        for t in stream:
+            if self._test(pred, t.obj):
+                yield t
+
+    def _s_where(self, stage, stream, ctx):
+        arg = stage.args[0]
+        for t in stream:
+            if isinstance(arg, _Anon):
+                if self._where_traversal(arg, t, ctx):
+                    yield t
+            elif isinstance(arg, P):
+                # where(without('x')): 'x' là nhãn as() hoặc side-effect aggregate('x')
+                key = arg.value
+                if isinstance(key, list) and len(key) == 1:
+                    key = key[0]    # within / without bọc đối số thành list
+                other = t.select(key)
+                if other is _MISSING:
+                    other = ctx["side"].get(key, _MISSING)
+                if self._test(P(arg.operator, other), t.obj):
+                    yield t
+            else:
+                raise ValueError("where() chỉ hỗ trợ traversal hoặc predicate")
+
+    def _where_traversal(self, anon, t, ctx):
+        stages = anon.stages
+        start, end = t, None
+        if stages and stages[0].name == "as":
+            start = t.split(t.select(stages[0].args[0]))
+            stages = stages[1:]
+        if stages and stages[-1].name == "as":
+            end = stages[-1].args[0]
+            stages = stages[:-1]
+        for r in self._run(stages, iter([start]), ctx):
+            if end is None or self._same(r.obj, t.select(end)):
+                return True
+        return False
+
+    def _s_filter(self, stage, stream, ctx):
+        for t in stream:
+            if self._first(stage.args[0], t, ctx) is not _MISSING:
+                yield t
+
+    def _s_not(self, stage, stream, ctx):
+        for t in stream:
+            if self._first(stage.args[0], t, ctx) is _MISSING:
+                yield t
+
+    def _s_dedup(self, stage, stream, ctx):
+        seen = stage.state.setdefault("seen", set())
+        specs = self._by_specs(stage)
+        for t in stream:
+            key = self._value(specs[0], t, ctx) if specs else t.obj
+            key = key.id if isinstance(key, _ELEMENT) else key
+            key = tuple(key) if isinstance(key, list) else key
+            if key not in seen:
+                seen.add(key)
+                yield t
+
+    def _s_simplePath(self, stage, stream, ctx):
+        for t in stream:
+            ids = [o.id if isinstance(o, _ELEMENT) else o for o in t.path_list()]
+            if len(ids) == len(set(ids)):
+                yield t
+
+    def _s_limit(self, stage, stream, ctx):
+        n = stage.args[-1]
+        if stage.args[0] == Scope.local:
+            for t in stream:
+                items = list(t.obj)[:n]
+                if n == 1:
+                    # giống TinkerPop: limit(local, 1) trả về chính phần tử, không bọc list
+                    if items:
+                        yield t.split(items[0])
+                    continue
+                yield t.split(items)
+            return
+        for i, t in enumerate(stream):
+            if i >= n:
+                return
+            yield t
+
+    def _s_range(self, stage, stream, ctx):
+        lo, hi = stage.args[-2], stage.args[-1]
+        if stage.args[0] == Scope.local:
+            for t in stream:
+                items = list(t.obj)
+                yield t.split(items[lo:] if hi == -1 else items[lo:hi])
+            return
+        for i, t in enumerate(stream):
+            if hi != -1 and i >= hi:
+                return
+            if i >= lo:
+                yield t
+
+    def _s_skip(self, stage, stream, ctx):
+        n = stage.args[-1]
+        for i, t in enumerate(stream):
+            if i >= n:
+                yield t
+
+    def _s_tail(self, stage, stream, ctx):
+        n = stage.args[-1] if stage.args and not isinstance(stage.args[-1], Scope) else 1
+        if stage.args and stage.args[0] == Scope.local:
+            for t in stream:
+                items = list(t.obj)
+                yield t.split(items[-1] if n == 1 else items[-n:])
+            return
+        buf = list(stream)
+        yield from buf[-n:]
+
+    # ---------- map ----------
+    def _s_id(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(t.obj.id)
+
+    def _s_label(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(t.obj.label)
+
+    def _s_values(self, stage, stream, ctx):
+        keys = stage.args
+        for t in stream:
+            props = self._props(t.obj, ctx)
+            for k in (keys or props.keys()):
+                if k in props:
+                    yield t.split(props[k])
+
+    def _s_valueMap(self, stage, stream, ctx):
+        with_tokens = bool(stage.args) and stage.args[0] is True
+        keys = [k for k in stage.args if isinstance(k, str)]
+        for t in stream:
+            el = t.obj
+            # giống TinkerPop: property đỉnh trả về dạng list, property cạnh thì không
+            wrap = (lambda v: [v]) if isinstance(el, _Vertex) else (lambda v: v)
+            out = {k: wrap(v) for k, v in el.props.items() if not keys or k in keys}
+            if with_tokens:
+                out[T.id] = el.id
+                out[T.label] = el.label
+            yield t.split(out)
+
+    def _s_elementMap(self, stage, stream, ctx):
+        for t in stream:
+            el = t.obj
+            out = {T.id: el.id, T.label: el.label}
+            if isinstance(el, _Edge):
+                out[Direction.OUT] = {T.id: el.out_v.id, T.label: el.out_v.label}
+                out[Direction.IN] = {T.id: el.in_v.id, T.label: el.in_v.label}
+            out.update(el.props)
+            yield t.split(out)
+
+    def _s_constant(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(stage.args[0])
+
+    def _s_identity(self, stage, stream, ctx):
+        return stream
+
+    def _s_as(self, stage, stream, ctx):
+        names = tuple(stage.args)
+        for t in stream:
+            yield t.tag(names)
+
+    def _s_select(self, stage, stream, ctx):
+        args = list(stage.args)
+        pop = Pop.last
+        if args and isinstance(args[0], Pop):
+            pop = args.pop(0)
+        specs = self._by_specs(stage)
+        for t in stream:
+            values = []
+            for key in args:
+                value = _MISSING
+                if isinstance(t.obj, dict) and key in t.obj:
+                    value = t.obj[key]
+                if value is _MISSING:
+                    value = t.select(key, pop)
+                if value is _MISSING:
+                    break
+                values.append(value)
+            else:
+                if specs:
+                    values = [self._value(specs[i % len(specs)], t.split(v), ctx)
+                              for i, v in enumerate(values)]
+                if _MISSING in values:
+                    continue
+                yield t.split(values[0] if len(values) == 1 else dict(zip(args, values)))
+
+    def _s_project(self, stage, stream, ctx):
+        keys = stage.args
+        specs = self._by_specs(stage)
+        for t in stream:
+            out = {}
+            for i, key in enumerate(keys):
+                spec = specs[i % len(specs)] if specs else None
+                value = self._value(spec, t, ctx)
+                if value is not _MISSING:
+                    out[key] = value
+            yield t.split(out)
+
+    def _s_path(self, stage, stream, ctx):
+        specs = self._by_specs(stage)
+        for t in stream:
+            objs = t.path_list()
+            if specs:
+                objs = [self._value(specs[i % len(specs)], _Trav(o), ctx) for i, o in enumerate(objs)]
+            yield t.split(objs)
+
+    def _s_loops(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(t.loops)
+
+    # ---------- duyệt đồ thị ----------
+    def _adjacent(self, stage, stream, pick):
+        labels = set(stage.args)
+        for t in stream:
+            # chép danh sách kề trước: bước sau (drop) có thể xóa cạnh khi đang duyệt
+            for obj in list(pick(t.obj)):
+                if not labels or obj[0] in labels:
+                    yield t.split(obj[1])
+
+    def _s_outE(self, stage, stream, ctx):
+        return self._adjacent(stage, stream, lambda v: ((e.label, e) for e in v.out_e))
+
+    def _s_inE(self, stage, stream, ctx):
+        return self._adjacent(stage, stream, lambda v: ((e.label, e) for e in v.in_e))
+
+    def _s_bothE(self, stage, stream, ctx):
+        return self._adjacent(stage, stream,
+                              lambda v: ((e.label, e) for e in v.out_e + v.in_e))
+
+    def _s_out(self, stage, stream, ctx):
+        return self._adjacent(stage, stream, lambda v: ((e.label, e.in_v) for e in v.out_e))
+
+    def _s_in(self, stage, stream, ctx):
+        return self._adjacent(stage, stream, lambda v: ((e.label, e.out_v) for e in v.in_e))
+
+    def _s_both(self, stage, stream, ctx):
+        return self._adjacent(stage, stream, lambda v: [(e.label, e.in_v) for e in v.out_e]
+                              + [(e.label, e.out_v) for e in v.in_e])
+
+    def _s_outV(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(t.obj.out_v)
+
+    def _s_inV(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(t.obj.in_v)
+
+    def _s_bothV(self, stage, stream, ctx):
+        for t in stream:
+            yield t.split(t.obj.out_v)
+            yield t.split(t.obj.in_v)
+
+    def _s_otherV(self, stage, stream, ctx):
+        for t in stream:
+            e = t.obj
+            prev = t.path[1][0] if t.path[1] is not None else None
+            yield t.split(e.in_v if prev is e.out_v else e.out_v)
+
+    # ---------- nhánh ----------
+    def _s_coalesce(self, stage, stream, ctx):
+        for t in stream:
+            for anon in stage.args:
+                results = list(self._sub(anon, t, ctx))
+                if results:
+                    yield from results
+                    break
+
+    def _s_union(self, stage, stream, ctx):
+        for t in stream:
+            if t.obj is _MISSING:
+                t = _Trav(None)
+            for anon in stage.args:
+                yield from self._sub(anon, t, ctx)
+
+    def _s_optional(self, stage, stream, ctx):
+        for t in stream:
+            results = list(self._sub(stage.args[0], t, ctx))
+            yield from (results or [t])
+
+    def _s_local(self, stage, stream, ctx):
+        for t in stream:
+            yield from self._sub(stage.args[0], t, ctx)
+
+    def _s_sideEffect(self, stage, stream, ctx):
+        for t in stream:
+            for _ in self._sub(stage.args[0], t, ctx):
+                pass
+            yield t
+
+    def _s_repeat(self, stage, stream, ctx):
+        """repeat() chạy theo từng tầng (breadth-first) như Gremlin Server"""
+        body = stage.args[0]
+        times = stage.mod("times")
+        times = times[0][0] if times else None
+        emit_pre = [a for m, a in stage.pre if m == "emit"]
+        until_pre = [a for m, a in stage.pre if m == "until"]
+        emit_post = stage.mod("emit")
+        until_post = stage.mod("until")
+
+        def check(cond, t):
+            if not cond:
+                return False
+            args = cond[0]
+            return not args or self._first(args[0], t, ctx) is not _MISSING
+
+        frontier = []
+        for t in stream:
+            if check(until_pre, t):
+                yield t
+                continue
+            if check(emit_pre, t):
+                yield t
+            frontier.append(t)
+        while frontier:
+            nxt = []
+            for t in frontier:
+                for r in self._sub(body, t, ctx):
+                    r = r.split(r.obj)
+                    r.loops = t.loops + 1
+                    if (times is not None and r.loops >= times) or check(until_post, r) \
+                            or check(until_pre, r):
+                        r.loops = 0
+                        yield r
+                        continue
+                    if check(emit_post, r) or check(emit_pre, r):
+                        yield r
+                    nxt.append(r)
+            frontier = nxt
+
+    # ---------- barrier / tổng hợp ----------
+    def _s_fold(self, stage, stream, ctx):
+        yield _Trav([t.obj for t in stream if t.obj is not _MISSING])
+
+    def _s_unfold(self, stage, stream, ctx):
+        for t in stream:
+            obj = t.obj
+            if isinstance(obj, dict):
+                for k, v in obj.items():
+                    yield t.split({k: v})
+            elif isinstance(obj, (list, tuple, set)):
+                for o in obj:
+                    yield t.split(o)
+            elif obj is not _MISSING:
+                yield t
+
+    def _s_count(self, stage, stream, ctx):
+        if stage.args and stage.args[0] == Scope.local:
+            for t in stream:
+                yield t.split(len(t.obj))
+            return
+        yield _Trav(sum(1 for _ in stream))
+
+    def _reduce(self, stage, stream, fn):
+        if stage.args and stage.args[0] == Scope.local:
+            for t in stream:
+                items = list(t.obj)
+                if items:
+                    yield t.split(fn(items))
+            return
+        items = [t.obj for t in stream]
+        if items:
+            yield _Trav(fn(items))
+
+    def _s_sum(self, stage, stream, ctx):
+        return self._reduce(stage, stream, sum)
+
+    def _s_min(self, stage, stream, ctx):
+        return self._reduce(stage, stream, min)
+
+    def _s_max(self, stage, stream, ctx):
+        return self._reduce(stage, stream, max)
+
+    def _s_mean(self, stage, stream, ctx):
+        return self._reduce(stage, stream, lambda xs: sum(xs) / len(xs))
+
+    def _s_order(self, stage, stream, ctx):
+        local = stage.args and stage.args[0] == Scope.local
+        keys = []
+        for args in stage.mod("by"):
+            spec = args[0] if args and not isinstance(args[0], Order) else None
+            order = args[-1] if args and isinstance(args[-1], Order) else Order.asc
+            keys.append((spec, order))
+        keys = keys or [(None, Order.asc)]
+
+        def sort(items):
+            for spec, order in reversed(keys):
+                def key(t, spec=spec):
+                    v = self._value(spec, t, ctx)
+                    return v.id if isinstance(v, _ELEMENT) else v
+                items.sort(key=key, reverse=(order == Order.desc))
+            return items
+
+        if local:
+            for t in stream:
+                yield t.split([r.obj for r in sort([_Trav(o) for o in t.obj])])
+            return
+        yield from sort(list(stream))
+
+    def _s_group(self, stage, stream, ctx):
+        specs = self._by_specs(stage)
+        key_spec = specs[0] if specs else None
+        value_spec = specs[1] if len(specs) > 1 else None
+        out = {}
+        for t in stream:
+            k = self._value(key_spec, t, ctx)
+            k = k.id if isinstance(k, _ELEMENT) and key_spec is not None else k
+            out.setdefault(k, []).append(t)
+        result = {}
+        for k, ts in out.items():
+            if isinstance(value_spec, _Anon) and value_spec.stages and \
+                    value_spec.stages[-1].name in ("fold", "count", "sum", "min", "max", "mean"):
+                reduced = list(self._run(value_spec.stages, iter(ts), ctx))
+                result[k] = reduced[0].obj if reduced else []
+            else:
+                result[k] = [self._value(value_spec, t, ctx) for t in ts]
+        yield _Trav(result)
+
+    def _s_groupCount(self, stage, stream, ctx):
+        specs = self._by_specs(stage)
+        out = {}
+        for t in stream:
+            k = self._value(specs[0], t, ctx) if specs else t.obj
+            out[k] = out.get(k, 0) + 1
+        yield _Trav(out)
+
+    def _s_aggregate(self, stage, stream, ctx):
+        if stage.args[0] == Scope.local:
+            # aggregate(local, x): không chặn, giống store()
+            return self._s_store(stage, stream, ctx)
+        return self._aggregate(stage, stream, ctx)
+
+    def _aggregate(self, stage, stream, ctx):
+        bag = ctx["side"].setdefault(stage.args[-1], [])
+        items = list(stream)
+        bag.extend(t.obj for t in items)
+        yield from items
+
+    def _s_store(self, stage, stream, ctx):
+        bag = ctx["side"].setdefault(stage.args[-1], [])
+        for t in stream:
+            bag.append(t.obj)
+            yield t
+
+    def _s_cap(self, stage, stream, ctx):
+        for _ in stream:
+            pass
+        yield _Trav(ctx["side"].get(stage.args[0], []))
+
+    def _s_barrier(self, stage, stream, ctx):
+        yield from list(stream)
+
+    # ---------- OLAP (withComputer) ----------
+    def _olap_options(self, stage, ctx):
+        if not ctx["computer"]:
+            raise ValueError(f"{stage.name}() cần GraphComputer: dùng g.withComputer()")
+        return {args[0]: args[1] for args in stage.mod("with") if len(args) >= 2}
+
+    def _edge_picker(self, spec, ctx):
+        """Hàm v -> [(cạnh hoặc None, đỉnh kề)] theo Direction hoặc traversal (outE('edge'), both()...)"""
+        if spec == Direction.OUT:
+            return lambda v: [(e, e.in_v) for e in v.out_e]
+        if spec == Direction.IN:
+            return lambda v: [(e, e.out_v) for e in v.in_e]
+        if spec == Direction.BOTH:
+            return lambda v: [(e, e.in_v) for e in v.out_e] + [(e, e.out_v) for e in v.in_e]
+        if isinstance(spec, _Anon):
+            def pick(v):
+                out = []
+                for r in self._sub(spec, _Trav(v), ctx):
+                    obj = r.obj
+                    if isinstance(obj, _Edge):
+                        out.append((obj, obj.in_v if obj.out_v is v else obj.out_v))
+                    elif isinstance(obj, _Vertex):
+                        out.append((None, obj))
+                return out
+            return pick
+        raise ValueError(f"Chưa hỗ trợ cách chọn cạnh {spec!r}")
+
+    def _s_shortestPath(self, stage, stream, ctx):
+        """
+        Dijkstra từ mỗi đỉnh nguồn, trả về một đường ngắn nhất (dạng list) tới từng đỉnh tới được,
+        kể cả chính nó. TinkerPop trả mọi đường ngắn nhất bằng nhau, ở đây chỉ một.
+        """
+        opts = self._olap_options(stage, ctx)
+        adjacent = self._edge_picker(opts.get(ShortestPath.edges, Direction.BOTH), ctx)
+        distance = opts.get(ShortestPath.distance)
+        include_edges = opts.get(ShortestPath.includeEdges, False)
+        target = opts.get(ShortestPath.target)
+        max_distance = opts.get(ShortestPath.maxDistance)
+
+        def length(e):
+            if distance is None or e is None:
+                return 1
+            if isinstance(distance, _Anon):
+                return self._first(distance, _Trav(e), ctx)
+            return e.props[distance]
+
+        for t in stream:
+            s = t.obj
+            dist = {s.id: 0}
+            back = {s.id: None}
+            done = set()
+            tie = itertools.count()
+            heap = [(0, next(tie), s)]
+            while heap:
+                d, _, u = heapq.heappop(heap)
+                if u.id in done:
+                    continue
+                done.add(u.id)
+                if max_distance is not None and d > max_distance:
+                    break
+                if target is None or self._first(target, _Trav(u), ctx) is not _MISSING:
+                    path = []
+                    node = u
+                    while node is not None:
+                        path.append(node)
+                        step = back[node.id]
+                        if step is None:
+                            break
+                        node, e = step
+                        if include_edges and e is not None:
+                            path.append(e)
+                    yield t.split(path[::-1])
+                for e, v in adjacent(u):
+                    nd = d + length(e)
+                    if nd < dist.get(v.id, float("inf")):
+                        dist[v.id] = nd
+                        back[v.id] = (u, e)
+                        heapq.heappush(heap, (nd, next(tie), v))
+
+    def _s_connectedComponent(self, stage, stream, ctx):
+        """
+        Thành phần liên thông (yếu) của toàn đồ thị, gán cho mỗi đỉnh id nhỏ nhất của thành phần
+        (dạng chuỗi) như ConnectedComponentVertexProgram; property chỉ tồn tại trong request này.
+        """
+        opts = self._olap_options(stage, ctx)
+        adjacent = self._edge_picker(opts.get(ConnectedComponent.edges, Direction.BOTH), ctx)
+        key = opts.get(ConnectedComponent.propertyName, ConnectedComponent.component)
+        items = list(stream)
+        computed = ctx.setdefault("computed", {})
+        seen = set()
+        for v in self.vertices.values():
+            if v.id in seen:
+                continue
+            seen.add(v.id)
+            members = [v]
+            queue = deque([v])
+            while queue:
+                u = queue.popleft()
+                for _, w in adjacent(u):
+                    if w.id not in seen:
+                        seen.add(w.id)
+                        members.append(w)
+                        queue.append(w)
+            label = min(str(m.id) for m in members)
+            for m in members:
+                computed.setdefault(m.id, {})[key] = label
+        yield from items
+
+
+# ================== Client ==================
+class StandInResultSet:
+    """Giống driver.resultset.ResultSet: duyệt theo từng lô (batchSize), all() trả về Future"""
+
+    def __init__(self, server, results, batch_size=64):
+        self._server = server
+        self._results = results
+        self._batch_size = batch_size
+        self._exhausted = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        batch = self.one()
+        if not batch:
+            raise StopIteration
+        return batch
+
+    def one(self):
+        if self._exhausted:
+            return None
+        batch = []
+        with self._server.lock:
+            for r in self._results:
+                batch.append(r)
+                if len(batch) >= self._batch_size:
+                    break
+            else:
+                self._exhausted = True
+        return batch or None
+
+    def all(self):
+        future = Future()
+        results = []
+        try:
+            for batch in self:
+                results.extend(batch)
+        except Exception as e:
+            future.set_exception(_server_error(e))
+        else:
+            future.set_result(results)
+        return future
+
+
+def _server_error(e):
+    if isinstance(e, GremlinServerError):
+        return e
+    return GremlinServerError({"code": 597, "message": str(e), "attributes": {}})
+
+
+class StandInClient:
+    """Client giả lập có cùng giao diện với gremlin_python.driver.client.Client
+
+    latency: độ trễ mạng giả lập (giây) cho mỗi request
+    """
+
+    def __init__(self, server, latency=0.0, max_workers=8, traversal_source="g"):
+        self.server = server
+        self.latency = latency
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._traversal_source = traversal_source
+        self._closed = False
+
+    def is_closed(self):
+        return self._closed
+
+    def submit(self, message, bindings=None, request_options=None):
+        return self.submit_async(message, bindings, request_options).result()
+
+    def submit_async(self, message, bindings=None, request_options=None):
+        if self._closed:
+            raise Exception("Client is closed")
+        batch_size = (request_options or {}).get("batchSize", 64)
+        return self._executor.submit(self._execute, message, bindings, batch_size)
+
+    def _execute(self, message, bindings, batch_size):
+        if self.latency:
+            time.sleep(self.latency)
+        try:
+            results = self.server.execute(message, bindings)
+        except Exception as e:
+            raise _server_error(e)
+        return StandInResultSet(self.server, results, batch_size)
+
+    def close(self):
+        if not self._closed:
+            self._executor.shutdown()
+            self._closed = True
+
+
+class StandInRemoteConnection(RemoteConnection):
+    """Thay cho DriverRemoteConnection: traversal bytecode chạy trên StandInServer"""
+
+    def __init__(self, server, latency=0.0):
+        super().__init__("standin://", "g")
+        self.server = server
+        self.latency = latency
+
+    def submit(self, bytecode):
+        if self.latency:
+            time.sleep(self.latency)
+        try:
+            with self.server.lock:
+                results = list(self.server.execute(bytecode))
+        except Exception as e:
+            raise _server_error(e)
+        return RemoteTraversal(iter([Traverser(r) for r in results]))
+
+    def submit_async(self, bytecode):
+        future = Future()
+        try:
+            future.set_result(self.submit(bytecode))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def close(self):
+        pass
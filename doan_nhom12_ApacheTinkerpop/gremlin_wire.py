@@ -0,0 +1,166 @@
+# gremlin_wire.py
+"""
+Định dạng dữ liệu giữa client và Gremlin Server (message serializer của gremlinpython):
+- "graphson-v2": JSON có kiểu (bản cũ mặc định), mỗi số kèm {"@type": ..., "@value": ...}
+- "graphson-v3": như v2 nhưng list / map cũng bọc kiểu (g:List, g:Map)
+- "graphbinary": nhị phân, nhỏ hơn và đọc nhanh hơn nhiều — mặc định
+
+Với GraphBinary, request gửi kèm request option EDGE_ROWS_OPTION (các script
+project('u','v','w') lấy cạnh của GremlinManager) có kết quả List<Map{u, v, w}> được đọc thẳng
+thành list tuple (u, v, w) — có thêm khoá e (id cạnh, phân trang theo id) thì (u, v, w, e) —
+bằng struct trên bytes, không dựng dict trung gian và không qua bộ đọc tổng quát (một lời gọi
+hàm + BytesIO.read cho mỗi giá trị). Request khác, hay kết quả không đúng dạng, đọc như bình thường.
+"""
+import io
+import struct
+
+from gremlin_python.driver import serializer
+from gremlin_python.structure.io import graphbinaryV1
+
+DEFAULT_SERIALIZER = "graphbinary"
+# request option đánh dấu kết quả là các hàng cạnh (bị bỏ khỏi request trước khi gửi đi)
+EDGE_ROWS_OPTION = "edgeRows"
+
+_INT = struct.Struct(">i")
+_LONG = struct.Struct(">q")
+_DOUBLE = struct.Struct(">d")
+_FLOAT = struct.Struct(">f")
+_LIST, _MAP, _STRING = 0x09, 0x0a, 0x03
+_MISSING = object()
+
+
+class _NotEdgeRows(Exception):
+    pass
+
+
+def _value(buf, pos):
+    """(giá trị, vị trí kế tiếp) của một giá trị GraphBinary đầy đủ kiểu; kiểu lạ -> _NotEdgeRows"""
+    code = buf[pos]
+    if buf[pos + 1]:
+        return None, pos + 2
+    pos += 2
+    if code == 0x01:
+        return _INT.unpack_from(buf, pos)[0], pos + 4
+    if code == 0x02:
+        return _LONG.unpack_from(buf, pos)[0], pos + 8
+    if code == _STRING:
+        end = pos + 4 + _INT.unpack_from(buf, pos)[0]
+        return buf[pos + 4:end].decode("utf-8"), end
+    if code == 0x07:
+        return _DOUBLE.unpack_from(buf, pos)[0], pos + 8
+    if code == 0x08:
+        return _FLOAT.unpack_from(buf, pos)[0], pos + 4
+    raise _NotEdgeRows
+
+
+def decode_edge_rows(buf, pos=0):
+    """
+    Đọc List<Map> GraphBinary bắt đầu tại buf[pos] thành list (u, v, w) (thiếu w thì 1.0),
+    map có khoá e thì (u, v, w, e).
+    Không đúng dạng (không phải list, map có khoá khác u / v / w / e, kiểu giá trị lạ) -> _NotEdgeRows.
+    """
+    if buf[pos] != _LIST or buf[pos + 1]:
+        raise _NotEdgeRows
+    count = _INT.unpack_from(buf, pos + 2)[0]
+    pos += 6
+    rows = []
+    for _ in range(count):
+        if buf[pos] != _MAP or buf[pos + 1]:
+            raise _NotEdgeRows
+        size = _INT.unpack_from(buf, pos + 2)[0]
+        pos += 6
+        u = v = e = _MISSING
+        w = 1.0
+        for _ in range(size):
+            # khoá là string một ký tự: kiểu 0x03, cờ 0x00, độ dài 1
+            if buf[pos] != _STRING or buf[pos + 1] or _INT.unpack_from(buf, pos + 2)[0] != 1:
+                raise _NotEdgeRows
+            key = buf[pos + 6]
+            pos += 7
+            # string / double (trường hợp thường gặp) đọc tại chỗ, kiểu khác qua _value
+            code = buf[pos]
+            if code == _STRING and not buf[pos + 1]:
+                end = pos + 6 + _INT.unpack_from(buf, pos + 2)[0]
+                value = buf[pos + 6:end].decode("utf-8")
+                pos = end
+            elif code == 0x07 and not buf[pos + 1]:
+                value = _DOUBLE.unpack_from(buf, pos + 2)[0]
+                pos += 10
+            else:
+                value, pos = _value(buf, pos)
+            if key == 0x75:         # "u"
+                u = value
+            elif key == 0x76:       # "v"
+                v = value
+            elif key == 0x77:       # "w"
+                w = value
+            elif key == 0x65:       # "e"
+                e = value
+            else:
+                raise _NotEdgeRows
+        if u is _MISSING or v is _MISSING:
+            raise _NotEdgeRows
+        rows.append((u, v, w) if e is _MISSING else (u, v, w, e))
+    return rows
+
+
+class LeanGraphBinarySerializer(serializer.GraphBinarySerializersV1):
+    """GraphBinary v1; request có EDGE_ROWS_OPTION thì trả về list tuple (xem đầu file)"""
+
+    def __init__(self):
+        super().__init__()
+        self._edge_requests = set()     # requestId đang chờ kết quả dạng hàng cạnh
+
+    def expect_edge_rows(self, request_id):
+        """Đọc kết quả của request_id bằng đường nhanh (tới khi nhận phản hồi cuối)"""
+        self._edge_requests.add(str(request_id))
+
+    def serialize_message(self, request_id, request_message):
+        if request_message.args.pop(EDGE_ROWS_OPTION, False):
+            self.expect_edge_rows(request_id)
+        return super().serialize_message(request_id, request_message)
+
+    def deserialize_message(self, message):
+        if isinstance(message, str):
+            return super().deserialize_message(message)
+        buf = bytes(message)
+        b = io.BytesIO(buf)
+        reader = self._graphbinary_reader
+        DataType = graphbinaryV1.DataType
+        b.read(1)  # version
+        request_id = str(reader.to_object(b, DataType.uuid))
+        status_code = self.int32_unpack(b.read(4))[0]
+        status_msg = reader.to_object(b, DataType.string)
+        status_attrs = reader.to_object(b, DataType.map, nullable=False)
+        meta_attrs = reader.to_object(b, DataType.map, nullable=False)
+        start = b.tell()
+        edge_rows = request_id in self._edge_requests
+        if status_code != 206:      # 206: còn các phần tiếp theo của cùng request
+            self._edge_requests.discard(request_id)
+        data = _MISSING
+        if edge_rows:
+            try:
+                data = decode_edge_rows(buf, start)
+            except (_NotEdgeRows, IndexError, struct.error):
+                pass
+        if data is _MISSING:
+            b.seek(start)
+            data = reader.to_object(b)
+        return {'requestId': request_id,
+                'status': {'code': status_code, 'message': status_msg, 'attributes': status_attrs},
+                'result': {'meta': meta_attrs, 'data': data}}
+
+
+SERIALIZERS = {
+    "graphson-v2": serializer.GraphSONSerializersV2d0,
+    "graphson-v3": serializer.GraphSONSerializersV3d0,
+    "graphbinary": LeanGraphBinarySerializer,
+}
+
+
+def make_serializer(name=DEFAULT_SERIALIZER):
+    """Message serializer theo tên ("graphson-v2" / "graphson-v3" / "graphbinary")"""
+    cls = SERIALIZERS.get(name)
+    if cls is None:
+        raise ValueError(f"Serializer không hợp lệ: {name} (chọn một trong {', '.join(SERIALIZERS)})")
+    return cls()
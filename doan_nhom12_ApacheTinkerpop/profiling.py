@@ -0,0 +1,110 @@
+# profiling.py
+"""
+Đo theo giai đoạn (phase), bật khi cần: truyền Profiler vào GraphManager / AlgorithmController /
+GraphAnimator (tham số profiler=...), None (mặc định) thì không đo gì và không tốn gì thêm.
+
+Mỗi giai đoạn (VD: "ingest:bulk_build", "run:BFS", "compute:Dijkstra", "draw") ghi:
+- calls       : số lần chạy
+- seconds     : tổng thời gian thực (perf_counter)
+- steps       : số bước theo loại — sự kiện observer (visit, relax, ...) và các bộ đếm count()
+- peak_bytes  : (memory=True) bộ nhớ cấp phát thêm lớn nhất so với lúc vào giai đoạn, theo
+                tracemalloc (tính cả mảng numpy); tracemalloc làm chương trình chậm đi nhiều
+                nên seconds khi đo bộ nhớ không so được với seconds khi không đo
+Giai đoạn lồng nhau được: bước tính cho giai đoạn trong cùng, peak của giai đoạn ngoài
+gồm cả giai đoạn trong.
+
+    prof = Profiler(memory=True)
+    ctl = AlgorithmController(G, profiler=prof)
+    ctl.compute("Dijkstra", "A")
+    prof.write_json("profile.json")
+"""
+import json
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+
+class Profiler:
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.phases = {}        # tên -> {calls, seconds, steps, peak_bytes}
+        self._stack = []        # [bản ghi, peak tuyệt đối, bộ nhớ lúc vào] của các giai đoạn đang mở
+        self._tracing = False   # tracemalloc do Profiler bật (close() sẽ tắt)
+
+    def _record(self, name):
+        rec = self.phases.get(name)
+        if rec is None:
+            rec = self.phases[name] = {"calls": 0, "seconds": 0.0, "steps": Counter()}
+            if self.memory:
+                rec["peak_bytes"] = 0
+        return rec
+
+    @contextmanager
+    def phase(self, name):
+        rec = self._record(name)
+        frame = [rec, 0, 0]
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # peak tới lúc này thuộc về giai đoạn ngoài, trước khi reset cho giai đoạn mới
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            frame[1] = frame[2] = current
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield rec
+        finally:
+            rec["seconds"] += time.perf_counter() - start
+            rec["calls"] += 1
+            self._stack.pop()
+            if self.memory:
+                peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+                rec["peak_bytes"] = max(rec["peak_bytes"], peak - frame[2])
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+
+    def count(self, kind, n=1):
+        """Cộng n bước loại kind vào giai đoạn đang mở (không có giai đoạn nào thì bỏ qua)"""
+        if self._stack:
+            self._stack[-1][0]["steps"][kind] += n
+
+    def observer(self, kind, u, v, x):
+        """Observer (kind, u, v, x) như algorithms/cores.py: đếm mỗi sự kiện là một bước"""
+        if self._stack:
+            self._stack[-1][0]["steps"][kind] += 1
+
+    def counter(self, hook=None):
+        """Observer đếm bước rồi chuyển sự kiện cho hook (nếu có)"""
+        if hook is None:
+            return self.observer
+
+        def observe(kind, u, v, x):
+            self.observer(kind, u, v, x)
+            hook(kind, u, v, x)
+        return observe
+
+    def report(self):
+        """{tên giai đoạn: {calls, seconds, steps, [peak_bytes]}} — dict thuần, ghi được ra JSON"""
+        return {name: dict(rec, steps=dict(rec["steps"])) for name, rec in self.phases.items()}
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def reset(self):
+        self.phases = {}
+
+    def close(self):
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+
+def phase(profiler, name):
+    """profiler.phase(name), hoặc context rỗng khi không đo (profiler=None)"""
+    return nullcontext() if profiler is None else profiler.phase(name)
@@ -0,0 +1,143 @@
+# ui/algorithm_worker.py
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from algorithms.csr_graph import CSRGraph
+from algorithms.gremlin_controller import AlgorithmController
+
+
+class AlgorithmCancelled(Exception):
+    pass
+
+
+# sự kiện dùng để đếm tiến độ và tổng tương ứng (theo n = số đỉnh)
+PROGRESS = {
+    "DFS": ("visit", lambda n: n),
+    "BFS": ("visit", lambda n: n),
+    "Dijkstra": ("settle", lambda n: n),
+    "Bellman-Ford": ("round", lambda n: max(n - 1, 1)),
+    "Shortest Path": ("reach", lambda n: n),
+    "Prim": ("choose_edge", lambda n: max(n - 1, 1)),
+    "Kruskal": ("choose_edge", lambda n: max(n - 1, 1)),
+    "Graph Coloring": ("color", lambda n: n),
+}
+
+
+class _StatusSink:
+    """Thay cho QTextEdit trong luồng worker: gom dòng log lại chờ gửi"""
+
+    def __init__(self, worker):
+        self.worker = worker
+
+    def append(self, text):
+        self.worker._lines.append(text)
+        self.worker._maybe_flush()
+
+
+class _DrawSink:
+    """Thay cho GraphAnimator trong luồng worker: chỉ giữ lần vẽ mới nhất"""
+
+    def __init__(self, worker):
+        self.worker = worker
+
+    def draw(self, **kwargs):
+        self.worker._frame = kwargs
+        self.worker._maybe_flush(step=True)
+
+
+class AlgorithmWorker(QThread):
+    """
+    Chạy AlgorithmController trong luồng riêng, giao diện không bị đứng.
+    Log và hình vẽ được gom lại, gửi về luồng GUI qua signal `steps` tối đa
+    mỗi `interval` giây (khung hình giữa hai lần gửi bị bỏ, chỉ vẽ khung mới nhất).
+    delay > 0: chế độ hoạt hình, gửi từng bước và chờ delay giây giữa các bước.
+    G: nx graph hoặc CSRGraph; có controller (của GraphSession) thì dùng lại controller đó.
+    draw=False: không gửi khung hình (đồ thị quá lớn để vẽ), chỉ log và tiến độ.
+    """
+
+    steps = pyqtSignal(list, object)      # (các dòng log, kwargs cho draw() hoặc None)
+    progress = pyqtSignal(int, int)       # (đã xong, tổng)
+    done = pyqtSignal(object)             # dict kết quả theo tên đỉnh
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, G, algo_name, start_vertex=None, delay=0.0, interval=0.05,
+                 trace_every=1, parent=None, controller=None, draw=True, target_vertex=None):
+        super().__init__(parent)
+        self.draw = draw
+        self.G = G
+        self.controller = controller
+        self.algo_name = algo_name
+        self.start_vertex = start_vertex
+        self.target_vertex = target_vertex
+        self.delay = delay
+        self.interval = interval
+        self.trace_every = trace_every
+        self._cancel = False
+        self._lines = []
+        self._frame = None
+        self._last_flush = 0.0
+        self._count = 0
+        self._total = 0
+        self._kind = None
+
+    def cancel(self):
+        self._cancel = True
+
+    # ================== Observer (luồng worker) ==================
+    def _on_step(self, kind, u, v, x):
+        if self._cancel:
+            raise AlgorithmCancelled()
+        if kind == self._kind:
+            self._count += 1
+
+    def _maybe_flush(self, step=False):
+        if self._cancel:
+            raise AlgorithmCancelled()
+        if self.delay > 0:
+            if step:
+                self._flush()
+                time.sleep(self.delay)
+        elif time.perf_counter() - self._last_flush >= self.interval:
+            self._flush()
+
+    def _flush(self):
+        frame = None
+        if self._frame is not None:
+            # chép lại vì thuật toán vẫn tiếp tục sửa các tập / list này
+            frame = {k: (v.copy() if hasattr(v, "copy") else v) for k, v in self._frame.items()}
+        if self._lines or frame is not None:
+            self.steps.emit(self._lines, frame)
+        self._lines = []
+        self._frame = None
+        self.progress.emit(min(self._count, self._total), self._total)
+        self._last_flush = time.perf_counter()
+
+    # ================== Chạy ==================
+    def run(self):
+        try:
+            controller = self.controller
+            if controller is None:
+                csr = self.G if isinstance(self.G, CSRGraph) else CSRGraph.from_networkx(self.G)
+                controller = AlgorithmController(csr)
+            self._kind, total = PROGRESS.get(self.algo_name, (None, lambda n: 0))
+            self._total = total(controller.csr.n)
+            controller.status = _StatusSink(self)
+            controller.vis = _DrawSink(self) if self.draw else None
+            controller.trace_every = self.trace_every
+            controller.observer = self._on_step
+            try:
+                result = controller.run(self.algo_name, self.start_vertex, self.target_vertex)
+            finally:
+                controller.status = controller.vis = controller.observer = None
+            self._count = self._total
+            self._flush()
+            self.done.emit(result)
+        except AlgorithmCancelled:
+            self._lines.append("⛔ Đã huỷ thuật toán")
+            self._flush()
+            self.cancelled.emit()
+        except Exception as e:
+            self._flush()
+            self.failed.emit(str(e))
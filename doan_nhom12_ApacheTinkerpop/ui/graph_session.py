@@ -0,0 +1,114 @@
+# ui/graph_session.py
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+
+from algorithms import result_cache
+from algorithms.csr_graph import CSRGraph
+from algorithms.gremlin_controller import AlgorithmController
+from graph.nx_builder import build_nx_graph
+from visualization.graph_animator import GraphAnimator
+
+# lớn hơn thì không vẽ (chỉ log / kết quả)
+VIS_MAX_VERTICES = 20000
+VIS_MAX_EDGES = 100000
+
+
+class GraphSession:
+    """
+    Đồ thị đã dựng cho một lần load: nx graph, CSR, controller và animator (figure + layout).
+    Chạy nhiều thuật toán liên tiếp dùng lại tất cả, chỉ dựng lại khi đầu vào
+    hoặc loại đồ thị đổi (MainWindow gọi close() rồi bỏ session).
+    """
+
+    def __init__(self, csr, directed=False, weighted=False, start_vertex=None, G=None):
+        self.csr = csr
+        self.directed = directed
+        self.weighted = weighted
+        self.start_vertex = start_vertex if start_vertex is not None else (csr.names[0] if csr.n else None)
+        self._G = G
+        self.controller = AlgorithmController(self.csr, cache=result_cache.SHARED)
+        self.animator = None
+
+    @classmethod
+    def from_text(cls, vertex_text, edge_text, directed=False, weighted=False):
+        vertices = vertex_text.split()
+        edges = []
+        for line in edge_text.splitlines():
+            p = line.split()
+            if len(p) >= 2:
+                edges.append(p)
+        G = build_nx_graph(vertices, edges, directed, weighted)
+        return cls(CSRGraph.from_networkx(G), directed, weighted,
+                   vertices[0] if vertices else None, G)
+
+    @classmethod
+    def from_data(cls, data, directed=None, weighted=None):
+        """Từ GraphData (graph/graph_loader.py), không qua ô nhập; directed / weighted ghi đè cờ của file"""
+        directed = data.directed if directed is None else directed
+        weighted = data.weighted if weighted is None else weighted
+        w = data.w if weighted else np.ones(data.m)
+        csr = CSRGraph.from_index_arrays(data.names, data.src, data.dst, w, directed)
+        return cls(csr, directed, weighted, data.start_vertex)
+
+    @property
+    def n(self):
+        return self.csr.n
+
+    @property
+    def m(self):
+        return self.csr.m
+
+    @property
+    def G(self):
+        """nx graph, chỉ dựng khi cần (animator); dựng từ CSR nên cùng thứ tự đỉnh / cạnh"""
+        if self._G is None:
+            csr = self.csr
+            G = nx.DiGraph() if self.directed else nx.Graph()
+            G.add_nodes_from(csr.names)
+            names = csr.names
+            src, dst, w = csr.edge_lists()
+            G.add_weighted_edges_from((names[u], names[v], wt) for u, v, wt in zip(src, dst, w))
+            self._G = G
+        return self._G
+
+    def add_edge(self, u, v, w=1.0):
+        """Thêm / đổi trọng số cạnh qua controller (kết quả cache được cập nhật dần), vẽ lại từ đầu"""
+        self.controller.add_edge(u, v, w)
+        self._edited()
+
+    def remove_edge(self, u, v):
+        self.controller.remove_edge(u, v)
+        self._edited()
+
+    def _edited(self):
+        self.csr = self.controller.csr
+        self._G = None
+        self.close_animator()
+
+    @property
+    def drawable(self):
+        return self.n <= VIS_MAX_VERTICES and self.m <= VIS_MAX_EDGES
+
+    def get_animator(self, delay=0):
+        """
+        Animator của session; tạo lại nếu chưa có hoặc cửa sổ figure đã bị đóng.
+        Đồ thị quá lớn để vẽ thì trả về None.
+        """
+        if not self.drawable:
+            return None
+        if self.animator is None or not plt.fignum_exists(self.animator.fig.number):
+            self.close_animator()
+            self.animator = GraphAnimator(self.G, delay=delay)
+        else:
+            self.animator.delay = delay
+            self.animator.draw()   # xoá trạng thái lần chạy trước
+        return self.animator
+
+    def close_animator(self):
+        if self.animator is not None:
+            plt.close(self.animator.fig)
+            self.animator = None
+
+    def close(self):
+        self.close_animator()
@@ -2,17 +2,26 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTextEdit, QLabel,
     QComboBox, QLineEdit,
-    QGroupBox, QRadioButton
+    QGroupBox, QRadioButton, QProgressBar
 )
+from PyQt5.QtCore import QTimer
 import os
-import json
-import networkx as nx
-from visualization.graph_animator import GraphAnimator
-from algorithms.gremlin_controller import AlgorithmController
+from ui.algorithm_worker import AlgorithmWorker
+from ui.graph_session import GraphSession
+from graph.graph_loader import LOADABLE_EXTENSIONS, load_graph
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
+# đồ thị nhỏ: chạy từng bước có hoạt hình; lớn hơn thì gom bước và chạy hết tốc lực
+ANIMATE_MAX_VERTICES = 50
+STEP_DELAY = 0.5
+# số dòng log tối đa mỗi lần chạy (log lấy mẫu theo kích thước đồ thị)
+MAX_LOG_LINES = 2000
+# file lớn hơn thì không đổ vào ô nhập đỉnh / cạnh
+TEXT_MAX_VERTICES = 2000
+TEXT_MAX_EDGES = 5000
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
@@ -20,6 +29,10 @@ class MainWindow(QWidget):
         self.G = None
         self.visualizer = None
         self.controller = None
+        self.worker = None
+        self.session = None   # đồ thị đã dựng, dùng lại giữa các lần chạy
+        self.loaded_data = None   # GraphData của file đã load (khi ô nhập chưa bị sửa)
+        self.pending_frame = None
         self.graph_loaded = False
         self.updating_ui = False  # ⭐ chống signal lồng nhau
 
@@ -36,6 +49,8 @@ class MainWindow(QWidget):
 
         self.edge_input = QTextEdit()
         self.edge_input.setPlaceholderText("Nhập cạnh, mỗi dòng:\nA B\nA B 3")
+        self.vertex_input.textChanged.connect(self.on_input_edited)
+        self.edge_input.textChanged.connect(self.on_input_edited)
 
         # ===== Data source =====
         source_box = QGroupBox("Nguồn dữ liệu đồ thị")
@@ -67,19 +82,33 @@ class MainWindow(QWidget):
             "Vô hướng + trọng số",
             "Có hướng + trọng số"
         ])
+        self.graph_type.currentIndexChanged.connect(self.invalidate_session)
 
         self.algorithm = QComboBox()
         self.algorithm.addItems([
             "DFS", "BFS",
-            "Dijkstra", "Bellman-Ford",
+            "Dijkstra", "Bellman-Ford", "Shortest Path",
             "Prim", "Kruskal",
             "Graph Coloring"
         ])
 
+        self.start_input = QLineEdit()
+        self.start_input.setPlaceholderText("Đỉnh bắt đầu (trống = đỉnh đầu tiên)")
+        self.target_input = QLineEdit()
+        self.target_input.setPlaceholderText("Đỉnh đích (Shortest Path)")
+
         self.run_btn = QPushButton("Chạy thuật toán")
         self.run_btn.clicked.connect(self.run_algorithm)
         self.run_btn.setEnabled(False)
 
+        self.cancel_btn = QPushButton("Huỷ")
+        self.cancel_btn.clicked.connect(self.cancel_algorithm)
+        self.cancel_btn.setEnabled(False)
+
+        self.progress = QProgressBar()
+        self.progress.setFormat("%v / %m")
+        self.progress.setValue(0)
+
         self.status = QTextEdit()
         self.status.setReadOnly(True)
 
@@ -92,7 +121,15 @@ class MainWindow(QWidget):
         left.addWidget(self.graph_type)
         left.addWidget(QLabel("Thuật toán"))
         left.addWidget(self.algorithm)
-        left.addWidget(self.run_btn)
+        vertex_row = QHBoxLayout()
+        vertex_row.addWidget(self.start_input)
+        vertex_row.addWidget(self.target_input)
+        left.addLayout(vertex_row)
+        run_row = QHBoxLayout()
+        run_row.addWidget(self.run_btn)
+        run_row.addWidget(self.cancel_btn)
+        left.addLayout(run_row)
+        left.addWidget(self.progress)
         left.addWidget(QLabel("Log thuật toán"))
         left.addWidget(self.status)
 
@@ -105,7 +142,7 @@ class MainWindow(QWidget):
     def load_data_files(self):
         self.data_combo.clear()
         os.makedirs(DATA_DIR, exist_ok=True)
-        files = [f for f in os.listdir(DATA_DIR) if f.endswith(".json")]
+        files = [f for f in os.listdir(DATA_DIR) if f.lower().endswith(LOADABLE_EXTENSIONS)]
         self.data_combo.addItems(files)
 
     def update_data_source_ui(self):
@@ -140,37 +177,50 @@ class MainWindow(QWidget):
         path = os.path.join(DATA_DIR, filename)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # CSV / edge list không mang cờ có hướng: lấy theo loại đồ thị đang chọn
+            data = load_graph(path, directed="Có hướng" in self.graph_type.currentText())
 
             self.updating_ui = True
             self.blockSignals(True)
 
-            self.vertex_input.setText(" ".join(data.get("vertices", [])))
-            self.edge_input.clear()
-            for e in data.get("edges", []):
-                self.edge_input.append(" ".join(map(str, e)))
-
-            directed = data.get("directed", False)
-            weighted = data.get("weighted", False)
-
-            if directed and weighted:
+            if data.directed and data.weighted:
                 self.graph_type.setCurrentIndex(3)
-            elif directed:
+            elif data.directed:
                 self.graph_type.setCurrentIndex(1)
-            elif weighted:
+            elif data.weighted:
                 self.graph_type.setCurrentIndex(2)
             else:
                 self.graph_type.setCurrentIndex(0)
 
+            small = data.n <= TEXT_MAX_VERTICES and data.m <= TEXT_MAX_EDGES
+            if small:
+                self.vertex_input.setText(" ".join(data.names))
+                self.edge_input.setPlainText("\n".join(" ".join(e) for e in data.rows()))
+            else:
+                # đồ thị lớn: không đẩy qua ô nhập, chỉ hiện tóm tắt
+                self.vertex_input.clear()
+                self.edge_input.clear()
+
             self.blockSignals(False)
             self.updating_ui = False
 
+            # đặt sau khi sửa ô nhập (textChanged đã bỏ session / dữ liệu cũ)
+            self.loaded_data = data
+            self.session = GraphSession.from_data(data)
+            self.G = None
+            self.controller = self.session.controller
+
             self.graph_loaded = True
             self.run_btn.setEnabled(True)
 
             self.status.append("✅ Đã load dữ liệu đồ thị mẫu")
-            self.status.append(f"📄 File: {data.get('name', filename)}")
+            self.status.append(f"📄 File: {data.name or filename}")
+            if not small:
+                kind = "có hướng" if data.directed else "vô hướng"
+                self.status.append(f"📊 Đồ thị lớn: {data.n} đỉnh, {data.m} cạnh ({kind}"
+                                   f"{', có trọng số' if data.weighted else ''}) — không hiển thị trong ô nhập")
+                if not self.session.drawable:
+                    self.status.append("ℹ Đồ thị quá lớn để vẽ, chỉ ghi log kết quả")
             self.status.append("👉 Chọn thuật toán và bấm 'Chạy thuật toán'")
 
         except Exception as e:
@@ -178,34 +228,101 @@ class MainWindow(QWidget):
             self.updating_ui = False
             self.status.append(f"❌ Lỗi load dữ liệu: {e}")
 
+    # ================= SESSION =================
+    def on_input_edited(self, *args):
+        self.loaded_data = None
+        self.invalidate_session()
+
+    def invalidate_session(self, *args):
+        """Đầu vào hoặc loại đồ thị đổi: bỏ đồ thị đã dựng, đóng figure cũ"""
+        if self.session is None:
+            return
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        self.session.close()
+        self.session = None
+        self.G = self.visualizer = self.controller = None
+
     # ================= RUN =================
     def run_algorithm(self):
         if not self.graph_loaded:
             self.status.append("⚠ Vui lòng load đồ thị trước")
             return
 
-        vertices = self.vertex_input.text().split()
-        edges = []
-
-        for line in self.edge_input.toPlainText().splitlines():
-            p = line.split()
-            if len(p) >= 2:
-                edges.append(p)
-
-        directed = "Có hướng" in self.graph_type.currentText()
-        weighted = "trọng số" in self.graph_type.currentText()
-
-        self.G = nx.DiGraph() if directed else nx.Graph()
-
-        for v in vertices:
-            self.G.add_node(v)
-
-        for e in edges:
-            u, v = e[0], e[1]
-            w = float(e[2]) if weighted and len(e) == 3 else 1.0
-            self.G.add_edge(u, v, weight=w)
-
-        self.visualizer = GraphAnimator(self.G)
-        self.controller = AlgorithmController(self.G, self.status, self.visualizer)
-
-        self.controller.run(self.algorithm.currentText(), vertices[0])
+        if self.session is None:
+            directed = "Có hướng" in self.graph_type.currentText()
+            weighted = "trọng số" in self.graph_type.currentText()
+            if self.loaded_data is not None:
+                # file đã load, chỉ đổi loại đồ thị: dựng lại từ mảng, không qua ô nhập
+                self.session = GraphSession.from_data(self.loaded_data, directed, weighted)
+            else:
+                self.session = GraphSession.from_text(
+                    self.vertex_input.text(), self.edge_input.toPlainText(), directed, weighted)
+            self.controller = self.session.controller
+
+        n = self.session.n
+        animate = n <= ANIMATE_MAX_VERTICES
+        self.visualizer = self.session.get_animator(delay=0)
+        self.G = self.visualizer.G if self.visualizer else None
+
+        self.worker = AlgorithmWorker(
+            self.session.csr, self.algorithm.currentText(),
+            self.start_input.text().strip() or self.session.start_vertex,
+            delay=STEP_DELAY if animate else 0.0,
+            trace_every=max(1, n // MAX_LOG_LINES),
+            controller=self.session.controller,
+            draw=self.visualizer is not None,
+            target_vertex=self.target_input.text().strip() or None,
+        )
+        self.worker.steps.connect(self.on_steps)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.done.connect(self.on_finished)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.cancelled.connect(self.on_finished)
+        self.progress.setValue(0)
+        self.set_running(True)
+        self.worker.start()
+
+    def cancel_algorithm(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.cancel_btn.setEnabled(False)
+            self.worker.cancel()
+
+    def set_running(self, running):
+        self.run_btn.setEnabled(not running)
+        self.load_btn.setEnabled(not running and self.radio_data.isChecked())
+        self.cancel_btn.setEnabled(running)
+
+    def on_steps(self, lines, frame):
+        if lines:
+            self.status.append("\n".join(lines))
+        if frame is not None and self.visualizer:
+            # vẽ chậm hơn worker gửi: chỉ giữ khung mới nhất, vẽ khi vòng sự kiện rảnh
+            if self.pending_frame is None:
+                QTimer.singleShot(0, self.draw_pending_frame)
+            self.pending_frame = frame
+
+    def draw_pending_frame(self):
+        frame, self.pending_frame = self.pending_frame, None
+        if frame is not None and self.visualizer:
+            self.visualizer.draw(**frame)
+
+    def on_progress(self, done, total):
+        self.progress.setMaximum(max(total, 1))
+        self.progress.setValue(done)
+
+    def on_failed(self, message):
+        self.status.append(f"❌ Lỗi khi chạy thuật toán: {message}")
+        self.on_finished()
+
+    def on_finished(self, result=None):
+        self.set_running(False)
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        if self.session is not None:
+            self.session.close()
+        super().closeEvent(event)
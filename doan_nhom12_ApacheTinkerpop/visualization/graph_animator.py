@@ -1,69 +1,233 @@
 # visualization/graph_animator.py
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 import networkx as nx
-import time
+import numpy as np
+
+from profiling import phase
+from visualization.layout import layout_for
+
+# map màu số (tô màu đồ thị) thành tên màu
+COLOR_MAP = ["lightgray","lightblue","orange","yellow","pink","green","purple","cyan","brown","red"]
+# bảng màu đỉnh: 0 chưa thăm, 1 đã thăm, 2 đang xét, 3.. màu tô (COLOR_MAP)
+GRAY, VISITED, ACTIVE, COLORED = 0, 1, 2, 3
+PALETTE = to_rgba_array(["lightgray", "lightgreen", "red"] + COLOR_MAP)
+# đồ thị lớn hơn thì không vẽ nhãn (chữ là phần đắt nhất mỗi khung hình)
+LABEL_MAX_NODES = 300
+
 
 class GraphAnimator:
-    def __init__(self, G, delay=1.0):
+    """
+    Vẽ đồ thị một lần rồi chỉ cập nhật phần thay đổi giữa các bước:
+    - cạnh là nền tĩnh, được chụp lại (copy_from_bbox) để blit
+    - đỉnh là một PathCollection duy nhất, chỉ đổi màu các đỉnh thay đổi
+    - cạnh MST là một LineCollection phủ lên, chỉ thêm đoạn mới
+    Mỗi bước chỉ vẽ đè các đỉnh / cạnh MST vừa đổi (và nhãn của chúng) lên khung trước,
+    nên chi phí một khung đi theo số phần tử thay đổi chứ không theo kích thước đồ thị.
+    Khi phải xoá (MST bị làm lại, quá nhiều đỉnh đổi) thì khôi phục nền và vẽ lại phần động.
+    """
+
+    def __init__(self, G, delay=1.0, pos=None, layout_cache=None, profiler=None, offscreen=False):
+        # delay = 0: không gọi plt.pause (dùng khi chạy trong cửa sổ Qt)
+        # pos: toạ độ có sẵn {đỉnh: (x, y)}, None thì tính bằng visualization/layout.py
+        # layout_cache: LayoutCache, None = thư mục mặc định, False = không cache
+        # profiler: profiling.Profiler — đo mỗi draw() trong giai đoạn "draw" (không tính plt.pause)
+        # offscreen: không mở cửa sổ, không blit — mỗi khung do bên gọi tự render (savefig / grab_frame
+        #            của visualization/trace_player.py), nên artist không được để animated
         self.G = G
         self.delay = delay
-        self.pos = nx.spring_layout(G, seed=42)  # layout cố định
+        self.profiler = profiler
+        self.offscreen = offscreen
+        self.pos = pos if pos is not None else layout_for(G, layout_cache)  # layout cố định
         self.fig, self.ax = plt.subplots(figsize=(8,6))
-        plt.ion()  # bật interactive mode
-
-    def draw(self, visited=None, active=None, mst_edges=None, coloring=None):
-        self.ax.clear()
-        node_colors = []
-        for n in self.G.nodes():
-            if coloring and n in coloring:
-                # map màu số thành tên màu
-                c = coloring[n]
-                color_map = ["lightgray","lightblue","orange","yellow","pink","green","purple","cyan","brown","red"]
-                node_colors.append(color_map[c % len(color_map)])
-            elif active == n:
-                node_colors.append("red")
-            elif visited and n in visited:
-                node_colors.append("lightgreen")
-            else:
-                node_colors.append("lightgray")
-
-        # vẽ graph
+        self._shown = False
+        if not offscreen:
+            plt.ion()  # bật interactive mode
+
+        self.nodes = list(G.nodes())
+        self.index = {n: i for i, n in enumerate(self.nodes)}
+        self.xy = np.array([self.pos[n] for n in self.nodes], dtype=float).reshape(-1, 2)
+
+        # trạng thái đã vẽ, để tính phần thay đổi ở bước sau
+        self._codes = np.zeros(len(self.nodes), dtype=np.int16)
+        self._visited = set()
+        self._active = None
+        self._coloring = {}
+        self._mst = []
+        self._mst_pairs = []
+        self._bg = None
+        self._build_artists()
+
+    # ================== Dựng artist một lần ==================
+    def _build_artists(self):
+        ax = self.ax
         if isinstance(self.G, nx.DiGraph):
-            nx.draw_networkx(
-                self.G,
-                pos=self.pos,
-                ax=self.ax,
-                with_labels=True,
-                node_color=node_colors,
-                arrows=True,
-                arrowstyle='-|>',
-                arrowsize=15,
-                edge_color="black"
-            )
+            nx.draw_networkx_edges(self.G, self.pos, ax=ax, arrows=True,
+                                   arrowstyle='-|>', arrowsize=15, edge_color="black")
+        else:
+            nx.draw_networkx_edges(self.G, self.pos, ax=ax, edge_color="black")
+
+        self.facecolors = PALETTE[self._codes].copy()
+        self.node_artist = ax.scatter(self.xy[:, 0], self.xy[:, 1], s=300,
+                                      c=self.facecolors, zorder=2)
+        self.mst_artist = LineCollection([], colors="red", linewidths=3, zorder=1.5)
+        ax.add_collection(self.mst_artist)
+        # phần vẽ đè mỗi bước: chỉ chứa các đỉnh / cạnh MST vừa đổi
+        self.delta_nodes = ax.scatter([], [], s=300, zorder=2)
+        self.delta_mst = LineCollection([], colors="red", linewidths=3, zorder=1.5)
+        ax.add_collection(self.delta_mst)
+        self.delta_nodes.set_visible(False)
+        self.delta_mst.set_visible(False)
+        self.label_artists = []
+        if len(self.nodes) <= LABEL_MAX_NODES:
+            self.label_artists = list(nx.draw_networkx_labels(self.G, self.pos, ax=ax).values())
+        ax.tick_params(axis="both", which="both", bottom=False, left=False,
+                       labelbottom=False, labelleft=False)
+
+        canvas = self.fig.canvas
+        self.blit = not self.offscreen and getattr(canvas, "supports_blit", False)
+        if self.blit:
+            # các artist thay đổi được vẽ riêng trên nền đã chụp
+            for a in self._dynamic_artists() + [self.delta_nodes, self.delta_mst]:
+                a.set_animated(True)
+            canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _dynamic_artists(self):
+        return [self.mst_artist, self.node_artist] + self.label_artists
+
+    def _on_draw(self, event):
+        # mỗi lần canvas vẽ lại toàn bộ (lần đầu, đổi kích thước...) thì chụp lại nền
+        self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for a in self._dynamic_artists():
+            self.ax.draw_artist(a)
+
+    # ================== Cập nhật trạng thái ==================
+    def _code(self, n, visited, active, coloring):
+        if coloring and n in coloring:
+            return COLORED + coloring[n] % len(COLOR_MAP)
+        if active == n:
+            return ACTIVE
+        if visited and n in visited:
+            return VISITED
+        return GRAY
+
+    def _update_nodes(self, visited, active, coloring):
+        visited = visited or set()
+        coloring = coloring or {}
+        changed = set(visited.symmetric_difference(self._visited))
+        changed.update(k for k, c in coloring.items() if self._coloring.get(k) != c)
+        changed.update(k for k in self._coloring if k not in coloring)
+        changed.add(active)
+        changed.add(self._active)
+        idx = []
+        for n in changed:
+            i = self.index.get(n)
+            if i is None:
+                continue
+            code = self._code(n, visited, active, coloring)
+            if code != self._codes[i]:
+                self._codes[i] = code
+                idx.append(i)
+        if idx:
+            self.facecolors[idx] = PALETTE[self._codes[idx]]
+            self.node_artist.set_facecolor(self.facecolors)
+        self._visited = set(visited)
+        self._coloring = dict(coloring)
+        self._active = active
+        return idx
+
+    def _update_mst(self, mst_edges):
+        """Trả về (các cặp chỉ số cạnh MST mới, có phải xoá cạnh cũ không)"""
+        mst_edges = list(mst_edges or [])
+        k = len(self._mst)
+        reset = mst_edges[:k] != self._mst
+        if reset:
+            k = 0
+            self._mst_pairs = []
+        new = []
+        for e in mst_edges[k:]:
+            u, v = self.index.get(e[0]), self.index.get(e[1])
+            if u is not None and v is not None:
+                new.append((u, v))
+        if new or reset:
+            self._mst_pairs = self._mst_pairs + new
+            self.mst_artist.set_segments([self.xy[[u, v]] for u, v in self._mst_pairs])
+        self._mst = mst_edges
+        return new, reset
+
+    # ================== Vẽ ==================
+    def draw(self, visited=None, active=None, mst_edges=None, coloring=None, path=None):
+        # path: list đỉnh của đường đi, tô như cạnh MST
+        if path is not None:
+            mst_edges = list(zip(path, path[1:]))
+        with phase(self.profiler, "draw"):
+            idx = self._update_nodes(visited, active, coloring)
+            new_mst, reset = self._update_mst(mst_edges)
+            self._render(idx, new_mst, reset)
+            if self.profiler is not None:
+                self.profiler.count("nodes", len(idx))
+                self.profiler.count("mst_edges", len(new_mst))
+        if self.offscreen:
+            return
+        if self.delay > 0:
+            plt.pause(self.delay)
+        elif not self._shown:
+            # chế độ GUI: vòng sự kiện Qt đang chạy, không chặn
+            self.fig.show()
+            self._shown = True
+
+    def _render(self, idx, new_mst, reset):
+        canvas = self.fig.canvas
+        if self.offscreen:
+            return
+        if not self.blit:
+            canvas.draw_idle()
+            return
+        if self._bg is None:
+            canvas.draw()   # vẽ đầy đủ lần đầu, _on_draw chụp nền
+            return
+        if reset or len(idx) > len(self.nodes) // 2:
+            canvas.restore_region(self._bg)
+            for a in self._dynamic_artists():
+                self.ax.draw_artist(a)
         else:
-            nx.draw_networkx(
-                self.G,
-                pos=self.pos,
-                ax=self.ax,
-                with_labels=True,
-                node_color=node_colors,
-                edge_color="black"
-            )
-
-        # vẽ MST edges nếu có
-        if mst_edges:
-            nx.draw_networkx_edges(
-                self.G,
-                self.pos,
-                edgelist=mst_edges,
-                edge_color="red",
-                width=3
-            )
-
-        plt.pause(self.delay)
+            # vẽ đè lên khung trước: cạnh MST mới, rồi các đỉnh đổi màu và đầu mút của
+            # cạnh mới (để đỉnh nằm trên cạnh như khi vẽ đầy đủ), rồi nhãn của chúng
+            touched = set(idx)
+            if new_mst:
+                self.delta_mst.set_segments([self.xy[[u, v]] for u, v in new_mst])
+                self._draw_hidden(self.delta_mst)
+                for u, v in new_mst:
+                    touched.add(u)
+                    touched.add(v)
+            if not touched:
+                return
+            touched = sorted(touched)
+            self.delta_nodes.set_offsets(self.xy[touched])
+            self.delta_nodes.set_facecolor(self.facecolors[touched])
+            self._draw_hidden(self.delta_nodes)
+            if self.label_artists:
+                for i in touched:
+                    self.ax.draw_artist(self.label_artists[i])
+        canvas.blit(self.fig.bbox)
+
+    def _draw_hidden(self, artist):
+        artist.set_visible(True)
+        self.ax.draw_artist(artist)
+        artist.set_visible(False)
 
     def animate(self):
         plt.show(block=False)
 
     def save(self, filename):
-        self.fig.savefig(filename)
+        # savefig bỏ qua artist animated, tạm tắt để ảnh có đủ đỉnh / MST
+        dynamic = self._dynamic_artists() if self.blit else []
+        for a in dynamic:
+            a.set_animated(False)
+        try:
+            self.fig.savefig(filename)
+        finally:
+            for a in dynamic:
+                a.set_animated(True)
+            self._bg = None   # nền vừa chụp lúc savefig có cả phần động
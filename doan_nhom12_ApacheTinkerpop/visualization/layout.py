@@ -0,0 +1,260 @@
+# visualization/layout.py
+"""
+Tính layout cho GraphAnimator, thay cho nx.spring_layout (O(V²) mỗi vòng, cần scipy khi
+đồ thị > 500 đỉnh):
+- n <= EXACT_MAX_NODES : Fruchterman-Reingold vector hoá (numpy), lực đẩy đủ cặp
+- n <= FORCE_MAX_NODES : Fruchterman-Reingold xấp xỉ theo lưới: lực đẩy trong cùng ô
+                         tính đủ cặp, giữa các ô tính qua trọng tâm ô (kiểu Barnes-Hut một tầng)
+- lớn hơn nữa          : grid_layout, xếp đỉnh lên lưới theo thứ tự BFS, O(V + E)
+Kết quả được lưu ở cache trên đĩa (.npz) theo hash cấu trúc đồ thị, chạy lại thuật toán
+trên cùng đồ thị thì lấy toạ độ ngay.
+"""
+import hashlib
+import os
+from collections import deque
+
+import numpy as np
+
+EXACT_MAX_NODES = 500
+FORCE_MAX_NODES = 20000
+CELL_SIZE = 48            # số đỉnh trung bình mỗi ô lưới ở chế độ xấp xỉ
+LAYOUT_VERSION = 1        # tăng khi đổi thuật toán để bỏ cache cũ
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "graph_visualizer", "layout")
+
+
+# ================== Chuẩn bị ==================
+def _edge_arrays(G, index):
+    if G.number_of_edges() == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    pairs = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64)
+    keep = pairs[:, 0] != pairs[:, 1]   # khuyên không tạo lực
+    return pairs[keep, 0], pairs[keep, 1]
+
+
+def _rescale(xy):
+    """Đưa về tâm 0, toạ độ trong [-1, 1] như nx.rescale_layout"""
+    xy = xy - xy.mean(axis=0)
+    lim = np.abs(xy).max() if len(xy) else 0
+    return xy / lim if lim > 0 else xy
+
+
+# ================== Lực đẩy ==================
+def _repulsion_exact(xy, k, chunk=512):
+    """Lực đẩy k²/d giữa mọi cặp đỉnh, chia khối để bộ nhớ O(chunk * n)"""
+    n = len(xy)
+    disp = np.zeros_like(xy)
+    k2 = k * k
+    for lo in range(0, n, chunk):
+        delta = xy[lo:lo + chunk, None, :] - xy[None, :, :]
+        d2 = np.einsum("ijk,ijk->ij", delta, delta)
+        np.maximum(d2, 1e-6, out=d2)
+        # k²/d theo hướng delta/d = delta * k²/d²
+        disp[lo:lo + chunk] = np.einsum("ijk,ij->ik", delta, k2 / d2)
+    return disp
+
+
+def _repulsion_grid(xy, k):
+    """
+    Lực đẩy xấp xỉ: chia mặt phẳng thành lưới ~n/CELL_SIZE ô.
+    - cặp đỉnh cùng ô: tính đủ
+    - ô khác: mỗi ô coi như một điểm đặt ở trọng tâm, khối lượng = số đỉnh
+    """
+    n = len(xy)
+    side = max(1, int(np.sqrt(n / CELL_SIZE)))
+    lo = xy.min(axis=0)
+    span = np.maximum(xy.max(axis=0) - lo, 1e-9)
+    for _ in range(4):
+        cx = np.minimum(((xy[:, 0] - lo[0]) / span[0] * side).astype(np.int64), side - 1)
+        cy = np.minimum(((xy[:, 1] - lo[1]) / span[1] * side).astype(np.int64), side - 1)
+        cell = cx * side + cy
+        n_cells = side * side
+        count = np.bincount(cell, minlength=n_cells).astype(float)
+        # đỉnh dồn cục vào vài ô thì số cặp trong ô bùng nổ: chia lưới mịn hơn
+        if count.max() <= 8 * CELL_SIZE:
+            break
+        side *= 2
+    k2 = k * k
+
+    used = np.flatnonzero(count)
+    cent = np.zeros((n_cells, 2))
+    cent[:, 0] = np.bincount(cell, weights=xy[:, 0], minlength=n_cells)
+    cent[:, 1] = np.bincount(cell, weights=xy[:, 1], minlength=n_cells)
+    cent[used] /= count[used, None]
+
+    # ô - ô qua trọng tâm
+    c = cent[used]
+    delta = c[:, None, :] - c[None, :, :]
+    d2 = np.einsum("ijk,ijk->ij", delta, delta)
+    np.fill_diagonal(d2, np.inf)
+    np.maximum(d2, 1e-6, out=d2)
+    cell_force = np.zeros((n_cells, 2))
+    cell_force[used] = np.einsum("ijk,ij->ik", delta, k2 * count[used][None, :] / d2)
+    disp = cell_force[cell]
+
+    # trong cùng ô: sinh mọi cặp (i, j) theo thứ tự đã sắp theo ô
+    order = np.argsort(cell, kind="stable")
+    sizes = count[used].astype(np.int64)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rep = np.repeat(sizes, sizes)                       # kích thước ô của từng đỉnh (đã sắp)
+    first = np.repeat(starts, sizes)                    # vị trí đầu ô của từng đỉnh
+    i_sorted = np.repeat(np.arange(n), rep)
+    offs = np.arange(len(i_sorted)) - np.repeat(np.cumsum(rep) - rep, rep)
+    j_sorted = np.repeat(first, rep) + offs
+    i, j = order[i_sorted], order[j_sorted]
+    mask = i != j
+    i, j = i[mask], j[mask]
+    delta = xy[i] - xy[j]
+    d2 = np.maximum(np.einsum("ij,ij->i", delta, delta), 1e-6)
+    f = delta * (k2 / d2)[:, None]
+    disp[:, 0] += np.bincount(i, weights=f[:, 0], minlength=n)
+    disp[:, 1] += np.bincount(i, weights=f[:, 1], minlength=n)
+    return disp
+
+
+# ================== Fruchterman-Reingold ==================
+def force_layout(G, iterations=50, seed=42, exact=None):
+    """
+    Fruchterman-Reingold vector hoá. exact=None: tự chọn đủ cặp hay xấp xỉ lưới theo số đỉnh.
+    Trả về (danh sách đỉnh, mảng toạ độ n x 2).
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return nodes, np.zeros((0, 2))
+    if n == 1:
+        return nodes, np.zeros((1, 2))
+    index = {v: i for i, v in enumerate(nodes)}
+    src, dst = _edge_arrays(G, index)
+    if exact is None:
+        exact = n <= EXACT_MAX_NODES
+    repulsion = _repulsion_exact if exact else _repulsion_grid
+
+    rng = np.random.default_rng(seed)
+    if exact:
+        xy = rng.random((n, 2))
+    else:
+        # đồ thị lớn: ít vòng lặp, bắt đầu từ lưới BFS (đã gần đúng cục bộ) thay vì ngẫu nhiên
+        xy = (grid_layout(G)[1] + 1) / 2 + rng.random((n, 2)) * (0.1 / np.sqrt(n))
+    k = np.sqrt(1.0 / n)
+    t = 0.1
+    dt = t / (iterations + 1)
+    for _ in range(iterations):
+        disp = repulsion(xy, k)
+        # lực hút d²/k dọc theo cạnh
+        delta = xy[src] - xy[dst]
+        dist = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        f = delta * (dist / k)[:, None]
+        for axis in (0, 1):
+            pull = np.bincount(src, weights=f[:, axis], minlength=n)
+            pull -= np.bincount(dst, weights=f[:, axis], minlength=n)
+            disp[:, axis] -= pull
+        length = np.sqrt(np.einsum("ij,ij->i", disp, disp))
+        np.maximum(length, 0.01, out=length)
+        xy += disp * (np.minimum(length, t) / length)[:, None]
+        t -= dt
+    return nodes, _rescale(xy)
+
+
+# ================== Layout nhanh cho đồ thị rất lớn ==================
+def grid_layout(G):
+    """Xếp đỉnh lên lưới vuông theo thứ tự BFS (hàng chạy zigzag): đỉnh kề nhau thường ở gần nhau"""
+    nodes = list(G.nodes())
+    n = len(nodes)
+    order = []
+    seen = set()
+    for s in nodes:
+        if s in seen:
+            continue
+        seen.add(s)
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in G.adj[u]:
+                if v not in seen:
+                    seen.add(v)
+                    queue.append(v)
+    side = max(1, int(np.ceil(np.sqrt(n))))
+    rank = np.arange(n)
+    row, col = rank // side, rank % side
+    col = np.where(row % 2 == 1, side - 1 - col, col)
+    index = {v: i for i, v in enumerate(nodes)}
+    xy = np.zeros((n, 2))
+    at = np.fromiter((index[v] for v in order), dtype=np.int64, count=n)
+    xy[at, 0] = col
+    xy[at, 1] = row
+    return nodes, _rescale(xy)
+
+
+# ================== Cache ==================
+def graph_hash(G):
+    """Hash cấu trúc: thứ tự đỉnh, danh sách cạnh, có hướng hay không (không tính trọng số)"""
+    h = hashlib.sha1()
+    h.update(f"v{LAYOUT_VERSION}|{int(G.is_directed())}|{G.number_of_nodes()}|".encode())
+    for v in G.nodes():
+        h.update(str(v).encode("utf-8"))
+        h.update(b"\0")
+    h.update(b"\1")
+    for u, v in G.edges():
+        h.update(f"{u}\0{v}\0".encode("utf-8"))
+    return h.hexdigest()
+
+
+class LayoutCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key, nodes):
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                xy = data["xy"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if xy.shape != (len(nodes), 2):
+            return None
+        return xy
+
+    def put(self, key, xy):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = self.path(key) + ".tmp.npz"
+            np.savez(tmp, xy=xy)
+            os.replace(tmp, self.path(key))
+        except OSError:
+            pass   # không ghi được cache thì vẫn dùng layout vừa tính
+
+
+def compute_layout(G, seed=42):
+    """Chọn thuật toán theo kích thước, trả về (đỉnh, toạ độ)"""
+    n = G.number_of_nodes()
+    if n <= EXACT_MAX_NODES:
+        return force_layout(G, iterations=50, seed=seed, exact=True)
+    if n <= FORCE_MAX_NODES:
+        return force_layout(G, iterations=30, seed=seed, exact=False)
+    return grid_layout(G)
+
+
+def layout_for(G, cache=None, seed=42):
+    """
+    Layout {đỉnh: (x, y)} cho G, có cache trên đĩa.
+    cache: LayoutCache, None = thư mục mặc định, False = không dùng cache.
+    """
+    if cache is None:
+        cache = LayoutCache()
+    nodes = list(G.nodes())
+    key = None
+    xy = None
+    if cache:
+        key = f"{graph_hash(G)}-{seed}"
+        xy = cache.get(key, nodes)
+    if xy is None:
+        nodes, xy = compute_layout(G, seed)
+        if cache:
+            cache.put(key, xy)
+    return dict(zip(nodes, xy))
@@ -0,0 +1,189 @@
+# visualization/trace_player.py
+"""
+Phát lại log trace (algorithms/trace_log.py) lên GraphAnimator, không chạy lại thuật toán:
+- TracePlayer: seek tới bất kỳ bước nào (trạng thái tính thẳng từ các cột, không phát lại
+  từ đầu), advance() từng khung (dùng với QTimer của UI), play() với tốc độ tuỳ chọn và bỏ
+  khung khi vẽ không kịp nhịp.
+- export(): render log ra GIF (Pillow) / MP4 (ffmpeg) bằng animator offscreen;
+  export_async() làm việc đó trong tiến trình riêng (backend Agg) để UI không bị chặn.
+
+Chạy từ thư mục project:
+    python -m visualization.trace_player run.atrace run.gif --fps 30 --every 5
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import matplotlib
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+
+from algorithms.observers import StepState
+from algorithms.trace_log import TraceLog
+from visualization.graph_animator import GraphAnimator
+
+# nhảy xa hơn số sự kiện này thì tính lại trạng thái bằng state_at thay vì update từng sự kiện
+SEEK_REPLAY_MAX = 4096
+
+
+def trace_graph(log):
+    """nx graph của log, cùng thứ tự đỉnh / cạnh như GraphSession.G nên trùng layout (cache) lúc chạy"""
+    G = nx.DiGraph() if log.directed else nx.Graph()
+    names = log.names
+    G.add_nodes_from(names)
+    G.add_edges_from((names[u], names[v]) for u, v in zip(np.asarray(log.src).tolist(),
+                                                          np.asarray(log.dst).tolist()))
+    return G
+
+
+class TracePlayer:
+    """
+    Phát log lên animator theo khung hình: khung thứ i là sự kiện được vẽ thứ i * every.
+    position: số sự kiện đã áp dụng; state: StepState tại position.
+    """
+
+    def __init__(self, log, animator=None, fps=10.0, every=1):
+        # log: TraceLog hoặc đường dẫn .atrace
+        # animator: GraphAnimator dựng trên trace_graph(log) (hoặc G cùng tên đỉnh), None = tự tạo
+        # fps: số khung mỗi giây ở speed = 1
+        self.log = log if isinstance(log, TraceLog) else TraceLog.open(log)
+        self.animator = animator if animator is not None else GraphAnimator(trace_graph(self.log), delay=0)
+        self.fps = fps
+        self.frames = self.log.frames(every)
+        self.position = 0
+        self.state = StepState(self.log.names)
+
+    @property
+    def frame(self):
+        """Số khung đã qua (khung cuối có vị trí < position)"""
+        return int(np.searchsorted(self.frames, self.position))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def _move(self, step):
+        step = max(0, min(step, len(self.log)))
+        if step < self.position or step - self.position > SEEK_REPLAY_MAX:
+            self.state = self.log.state_at(step)
+        else:
+            update = self.state.update
+            for event in self.log.events(self.position, step):
+                update(*event)
+        self.position = step
+
+    def _draw(self):
+        kwargs = self.state.draw_kwargs()
+        self.animator.draw(**(kwargs or {}))
+
+    def seek(self, step, draw=True):
+        """Tới ngay sau step sự kiện đầu và vẽ trạng thái đó"""
+        self._move(step)
+        if draw:
+            self._draw()
+
+    def seek_frame(self, frame, draw=True):
+        """Tới khung frame (0 .. len - 1): vẽ sự kiện thứ frames[frame]"""
+        frame = max(0, min(frame, len(self.frames) - 1))
+        self.seek(int(self.frames[frame]) + 1 if len(self.frames) else 0, draw)
+
+    def advance(self, frames=1, draw=True):
+        """Tiến frames khung (bỏ qua các khung ở giữa, chỉ vẽ khung cuối); False khi đã hết"""
+        k = self.frame + frames - 1
+        if k >= len(self.frames):
+            self._move(len(self.log))
+            return False
+        self.seek(int(self.frames[k]) + 1, draw)
+        return True
+
+    def play(self, speed=1.0, start=None, stop=None, skip=True):
+        """
+        Phát từ khung start (None = vị trí hiện tại) tới khung stop, nhịp fps * speed khung / giây.
+        skip: vẽ không kịp nhịp thì bỏ các khung trễ (chỉ vẽ khung đang tới hạn) thay vì chậm dần.
+        Trả về số khung đã vẽ.
+        """
+        if start is not None:
+            self.seek_frame(start, draw=False)
+        stop = len(self.frames) if stop is None else min(stop, len(self.frames))
+        interval = 1.0 / (self.fps * speed)
+        begin = time.perf_counter()
+        first = self.frame
+        drawn = 0
+        while self.frame < stop:
+            due = first + int((time.perf_counter() - begin) / interval) + 1
+            step = max(1, min(due, stop) - self.frame) if skip else 1
+            self.advance(step)
+            drawn += 1
+            wait = begin + (self.frame - first) * interval - time.perf_counter()
+            if wait > 0:
+                plt.pause(wait)
+        return drawn
+
+
+# ================== Xuất file ==================
+def _writer(out_path, fps):
+    from matplotlib import animation
+    if os.path.splitext(out_path)[1].lower() == ".gif":
+        return animation.PillowWriter(fps=fps)
+    return animation.FFMpegWriter(fps=fps)
+
+
+def export(source, out_path, fps=30, every=1, max_frames=None, pos=None, dpi=100, layout_cache=None):
+    """
+    Render log (TraceLog hoặc đường dẫn .atrace) ra out_path: .gif qua Pillow, còn lại
+    (.mp4...) qua ffmpeg. every: 1 trên mỗi every sự kiện được vẽ; max_frames: lấy mẫu đều
+    còn tối đa chừng đó khung. Trả về số khung đã ghi.
+    """
+    log = source if isinstance(source, TraceLog) else TraceLog.open(source)
+    animator = GraphAnimator(trace_graph(log), delay=0, pos=pos, layout_cache=layout_cache, offscreen=True)
+    player = TracePlayer(log, animator, fps, every)
+    frames = np.arange(len(player.frames))
+    if max_frames is not None and len(frames) > max_frames:
+        frames = np.unique(np.linspace(0, len(frames) - 1, max_frames).astype(np.int64))
+    writer = _writer(out_path, fps)
+    try:
+        with writer.saving(animator.fig, out_path, dpi):
+            for k in frames.tolist():
+                player.seek_frame(k)
+                writer.grab_frame()
+            if not len(frames):
+                animator.draw()
+                writer.grab_frame()
+    finally:
+        plt.close(animator.fig)
+    return len(frames)
+
+
+def _init_export():
+    matplotlib.use("Agg")
+
+
+def export_async(path, out_path, **kwargs):
+    """
+    export() trong một tiến trình riêng (spawn, backend Agg) đọc log từ file path, UI vẫn chạy;
+    trả về concurrent.futures.Future với số khung đã ghi.
+    """
+    executor = ProcessPoolExecutor(1, mp_context=get_context("spawn"), initializer=_init_export)
+    future = executor.submit(export, path, out_path, **kwargs)
+    executor.shutdown(wait=False)
+    return future
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("trace")
+    parser.add_argument("output", help=".gif hoặc .mp4 (cần ffmpeg)")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--every", type=int, default=1)
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args()
+    matplotlib.use("Agg")
+    count = export(args.trace, args.output, args.fps, args.every, args.max_frames, dpi=args.dpi)
+    print(f"Đã ghi {args.output}: {count} khung")
+
+
+if __name__ == "__main__":
+    main()